@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1 import meari, dashboard, history, calendar, completion, midi
+from app.api.v1 import meari, dashboard, history, calendar, completion, midi, jobs
 
 api_router = APIRouter()
 
@@ -10,3 +10,4 @@ api_router.include_router(history.router)
 api_router.include_router(calendar.router)
 api_router.include_router(completion.router, prefix="/completion", tags=["completion"])
 api_router.include_router(midi.router)
+api_router.include_router(jobs.router)
@@ -2,17 +2,21 @@
 캘린더 기능 확장 API
 """
 from typing import Dict, Any, List, Optional
-from fastapi import APIRouter, HTTPException, Depends, status, Query
+from fastapi import APIRouter, HTTPException, Depends, status, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_, desc
+from sqlalchemy import select, and_, or_, desc
 from datetime import datetime, date, timedelta
 import uuid
 
+from app.core.cache import invalidate_user_data
+from app.core.conditional import conditional_check, bump_data_version
 from app.core.database import get_db
 from app.core.auth import get_current_user
 from app.models.user import User
 from app.models.daily import DailyRitual
 from app.models.checkin import Ritual
+from app.services.activity import fetch_daily_activity, sync_daily_activity
+from app.services.heart_tree import allocate_ritual_sequence
 from app.schemas.calendar import (
     DateRitualRequest,
     DateRitualResponse,
@@ -160,12 +164,8 @@ async def update_date_ritual(
             if request.meari_ritual.get("selected_mood"):
                 meari_ritual.selected_mood = request.meari_ritual["selected_mood"]
         else:
-            # 새로 생성 (시퀀스 계산)
-            stmt = select(func.count()).select_from(Ritual).where(
-                Ritual.user_id == user_id
-            )
-            result = await db.execute(stmt)
-            sequence = (result.scalar() or 0) + 1
+            # 새로 생성 (마음나무 카운터에서 시퀀스 발급)
+            sequence = await allocate_ritual_sequence(db, user_id)
             
             meari_ritual = Ritual(
                 user_id=user_id,
@@ -177,7 +177,10 @@ async def update_date_ritual(
             )
             db.add(meari_ritual)
     
+    await sync_daily_activity(db, user_id, target_date)
+    await bump_data_version(db, current_user.id)
     await db.commit()
+    invalidate_user_data(current_user.id)
     
     # 수정된 데이터 다시 조회
     return await get_date_ritual(target_date, current_user, db)
@@ -192,6 +195,8 @@ async def update_date_ritual(
 async def get_monthly_overview(
     year: int,
     month: int,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ) -> MonthlyOverviewResponse:
@@ -206,71 +211,39 @@ async def get_monthly_overview(
     else:
         last_day = date(year, month + 1, 1) - timedelta(days=1)
     
-    # DailyRitual 조회
-    stmt = select(DailyRitual).where(
-        and_(
-            DailyRitual.user_id == user_id,
-            DailyRitual.date >= first_day,
-            DailyRitual.date <= last_day
-        )
-    )
-    result = await db.execute(stmt)
-    daily_rituals = result.scalars().all()
+    # DailyRitual + Ritual (메아리) 날짜별 조회
+    # 조건부 요청 확인 (과거 날짜도 수정 가능하므로 끝난 달도 매번 재검증)
+    check = await conditional_check(db, user_id)
+    if check.matches(request):
+        return check.not_modified()
+    check.apply(response)
     
-    # Ritual (메아리) 조회
-    stmt = select(Ritual).where(
-        and_(
-            Ritual.user_id == user_id,
-            Ritual.checkin_date >= first_day,
-            Ritual.checkin_date <= last_day
-        )
-    )
-    result = await db.execute(stmt)
-    meari_rituals = result.scalars().all()
+    days = await fetch_daily_activity(db, user_id, [(first_day, last_day)])
     
-    # 날짜별 데이터 구성
+    # 날짜별 데이터 구성 (활동이 있는 날만)
     date_map = {}
-    
-    # DailyRitual 매핑
-    for dr in daily_rituals:
-        date_str = dr.date.isoformat()
-        if date_str not in date_map:
-            date_map[date_str] = {
-                "date": date_str,
-                "has_daily_ritual": False,
-                "daily_completed": False,
-                "has_meari_ritual": False,
-                "mood": None,
-                "activity_count": 0
-            }
-        date_map[date_str]["has_daily_ritual"] = True
-        date_map[date_str]["daily_completed"] = dr.is_completed
-        date_map[date_str]["activity_count"] += 1
-        if dr.user_mood:
-            date_map[date_str]["mood"] = dr.user_mood
-    
-    # Meari Ritual 매핑
-    for mr in meari_rituals:
-        date_str = mr.checkin_date.isoformat()
-        if date_str not in date_map:
-            date_map[date_str] = {
-                "date": date_str,
-                "has_daily_ritual": False,
-                "daily_completed": False,
-                "has_meari_ritual": False,
-                "mood": None,
-                "activity_count": 0
-            }
-        date_map[date_str]["has_meari_ritual"] = True
-        date_map[date_str]["activity_count"] += 1
-        if mr.selected_mood and not date_map[date_str]["mood"]:
-            date_map[date_str]["mood"] = mr.selected_mood
+    meari_count = 0
+    for d in days:
+        has_daily = d.daily_ritual_id is not None
+        has_meari = d.meari_ritual_id is not None
+        if not has_daily and not has_meari:
+            continue
+        
+        date_str = d.day.isoformat()
+        date_map[date_str] = {
+            "date": date_str,
+            "has_daily_ritual": has_daily,
+            "daily_completed": bool(d.daily_completed),
+            "has_meari_ritual": has_meari,
+            "mood": d.daily_mood or d.meari_mood,
+            "activity_count": int(has_daily) + int(has_meari)
+        }
+        meari_count += int(has_meari)
     
     # 통계 계산
     total_days = (last_day - first_day).days + 1
     active_days = len(date_map)
     completed_daily = sum(1 for d in date_map.values() if d["daily_completed"])
-    meari_count = len(meari_rituals)
     
     # 기분 통계
     mood_stats = {}
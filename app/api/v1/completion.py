@@ -3,14 +3,15 @@
 """
 from typing import Optional
 from datetime import datetime, date
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, status, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_
+from app.core.conditional import conditional_check
 from app.core.database import get_db
 from app.core.auth import get_current_user
 from app.models.user import User
-from app.models.checkin import Ritual, AIPersonaHistory
-from app.models.daily import DailyRitual
+from app.models.checkin import Ritual, HeartTree, AIPersonaHistory
+from app.models.daily import DailyRitual, UserDailyActivity
 from app.models.card import GeneratedCard
 from app.services.ai.completion_report import CompletionReportGenerator
 from pydantic import BaseModel
@@ -39,27 +40,22 @@ async def check_completion(
 ) -> CompletionCheckResponse:
     """사용자의 28일 챌린지 완주 여부를 확인합니다."""
     
-    # 완료된 리츄얼 개수 확인
-    stmt = select(func.count(Ritual.id)).where(
-        and_(
-            Ritual.user_id == current_user.id,
-            Ritual.ritual_completed == True
-        )
+    # 메아리 리츄얼 수(마음나무 카운터) + 일일 리츄얼 완료 일수(활동 요약)를 한 번에 확인
+    ritual_count = func.coalesce(
+        select(HeartTree.ritual_count).where(
+            HeartTree.user_id == current_user.id
+        ).scalar_subquery(),
+        0
     )
-    result = await db.execute(stmt)
-    ritual_count = result.scalar() or 0
-    
-    # DailyRitual 완료 개수도 포함
-    stmt = select(func.count(DailyRitual.id)).where(
+    daily_ritual_count = select(func.count()).where(
         and_(
-            DailyRitual.user_id == current_user.id,
-            DailyRitual.is_completed == True
+            UserDailyActivity.user_id == current_user.id,
+            UserDailyActivity.daily_completed == True
         )
-    )
-    result = await db.execute(stmt)
-    daily_ritual_count = result.scalar() or 0
+    ).select_from(UserDailyActivity).scalar_subquery()
     
-    total_rituals = ritual_count + daily_ritual_count
+    result = await db.execute(select(ritual_count + daily_ritual_count))
+    total_rituals = result.scalar() or 0
     is_completed = total_rituals >= 28
     
     message = f"{'축하합니다! 28일 챌린지를 완주하셨습니다!' if is_completed else f'{28 - total_rituals}일 더 실천하면 완주입니다!'}"
@@ -77,11 +73,19 @@ async def check_completion(
     summary="28일 완주 리포트 생성"
 )
 async def generate_completion_report(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ) -> CompletionReportResponse:
     """28일 챌린지 완주 시 AI가 생성하는 성장 리포트"""
     
+    # 데이터가 그대로면 리포트를 다시 생성하지 않음
+    check = await conditional_check(db, current_user.id)
+    if check.matches(request):
+        return check.not_modified()
+    check.apply(response)
+    
     # 완주 여부 재확인
     check_result = await check_completion(current_user, db)
     if not check_result.is_completed:
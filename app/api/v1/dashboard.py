@@ -2,17 +2,20 @@
 대시보드 및 통계 API 엔드포인트
 """
 from typing import Dict, Any, List, Optional
-from fastapi import APIRouter, HTTPException, Depends, status, Query
+from fastapi import APIRouter, HTTPException, Depends, status, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, func, and_, or_, literal, true
 from datetime import datetime, date, timedelta
 import calendar
 
+from app.core.cache import dashboard_cache, invalidate_user_data
+from app.core.conditional import conditional_check, bump_data_version
 from app.core.database import get_db
 from app.core.auth import get_current_user
 from app.models.user import User
-from app.models.daily import DailyRitual, UserStreak
+from app.models.daily import DailyRitual, UserStreak, UserDailyActivity
 from app.models.checkin import HeartTree, Ritual
+from app.services.activity import fetch_daily_activity, sync_daily_activity, current_streak
 from app.schemas.dashboard import (
     DashboardResponse,
     CalendarResponse,
@@ -42,62 +45,34 @@ async def get_dashboard(
     user_id = current_user.id
     today = date.today()
     
-    # 1. 마음나무 상태
-    stmt = select(HeartTree).where(HeartTree.user_id == user_id)
-    result = await db.execute(stmt)
-    heart_tree = result.scalar_one_or_none()
-    
-    tree_level = heart_tree.growth_level if heart_tree else 0
-    tree_stage = _get_tree_stage(tree_level)
+    # 캐시 확인 (날짜가 바뀌면 알림/오늘의 리츄얼이 달라지므로 날짜도 비교)
+    cached = dashboard_cache.get(user_id)
+    if cached is not None and cached[0] == today:
+        return cached[1]
     
-    # 2. 연속 기록 조회 (생성하지 않음 - 읽기 전용)
-    stmt = select(UserStreak).where(UserStreak.user_id == user_id)
-    result = await db.execute(stmt)
-    streak = result.scalar_one_or_none()
+    # 1~4. 마음나무, 연속 기록, 오늘의 리츄얼, 이번 달 완료 일수, 전체 리츄얼 수를 한 번에 조회
+    stats = await _fetch_dashboard_stats(db, user_id, today)
     
-    # streak이 없으면 기본값 사용
-    if not streak:
-        # 대시보드는 읽기 전용이므로 생성하지 않음
-        from types import SimpleNamespace
-        streak = SimpleNamespace(
-            current_streak=0,
-            longest_streak=0,
-            total_days_active=0,
-            total_rituals_completed=0,
-            total_rituals_created=0
-        )
+    tree_level = stats.tree_level or 0
+    tree_stage = _get_tree_stage(tree_level)
     
-    # 3. 오늘의 리츄얼
-    stmt = select(DailyRitual).where(
-        and_(
-            DailyRitual.user_id == user_id,
-            DailyRitual.date == today
-        )
+    # streak이 없으면 기본값 사용 (대시보드는 읽기 전용이므로 생성하지 않음)
+    from types import SimpleNamespace
+    streak = SimpleNamespace(
+        current_streak=stats.current_streak or 0,
+        total_rituals_completed=stats.total_rituals_completed or 0,
+        total_rituals_created=stats.total_rituals_created or 0
     )
-    result = await db.execute(stmt)
-    today_ritual = result.scalar_one_or_none()
     
-    # 4. 이번 달 완료 일수
-    first_day = date(today.year, today.month, 1)
-    stmt = select(func.count(DailyRitual.id)).where(
-        and_(
-            DailyRitual.user_id == user_id,
-            DailyRitual.date >= first_day,
-            DailyRitual.date <= today,
-            DailyRitual.is_completed == True
-        )
-    )
-    result = await db.execute(stmt)
-    monthly_completed = result.scalar() or 0
+    today_ritual = SimpleNamespace(
+        id=stats.today_ritual_id,
+        ritual_title=stats.today_ritual_title,
+        is_completed=stats.today_ritual_completed,
+        ritual_type=stats.today_ritual_type
+    ) if stats.today_ritual_id is not None else None
     
-    # 4-1. 전체 리츄얼 카운트 (메아리 세션 포함)
-    from app.models.checkin import Ritual
-    stmt = select(func.count(Ritual.id)).where(
-        Ritual.user_id == user_id,
-        Ritual.ritual_completed == True
-    )
-    result = await db.execute(stmt)
-    total_ritual_count = result.scalar() or 0
+    monthly_completed = stats.monthly_completed or 0
+    total_ritual_count = stats.total_ritual_count or 0
     
     # 5. 알림 메시지 생성
     notifications = []
@@ -184,7 +159,7 @@ async def get_dashboard(
         Notification(**notif) for notif in notifications
     ]
     
-    return DashboardResponse(
+    response = DashboardResponse(
         tree=TreeStatus(
             level=tree_level,
             stage=tree_stage["stage"],
@@ -206,6 +181,9 @@ async def get_dashboard(
         ) if today_ritual else None,
         notifications=notification_objects
     )
+    dashboard_cache.set(user_id, (today, response))
+    
+    return response
 
 
 @router.get(
@@ -215,6 +193,8 @@ async def get_dashboard(
     description="월별 리츄얼 완료 현황을 조회합니다"
 )
 async def get_calendar(
+    request: Request,
+    response: Response,
     year: int = Query(..., description="연도"),
     month: int = Query(..., ge=1, le=12, description="월"),
     current_user: User = Depends(get_current_user),
@@ -228,54 +208,44 @@ async def get_calendar(
     first_day = date(year, month, 1)
     last_day = date(year, month, calendar.monthrange(year, month)[1])
     
-    # 해당 월의 모든 리츄얼 조회
-    stmt = select(DailyRitual).where(
-        and_(
-            DailyRitual.user_id == user_id,
-            DailyRitual.date >= first_day,
-            DailyRitual.date <= last_day
-        )
-    ).order_by(DailyRitual.date)
+    # 조건부 요청 확인 (지난 일수/연속 기록은 오늘 날짜에 의존하므로 끝난 달이 아니면 날짜 포함)
+    today = date.today()
+    past_period = last_day < today - timedelta(days=1)
+    check = await conditional_check(db, user_id, *(() if past_period else (today,)))
+    if check.matches(request):
+        return check.not_modified()
+    check.apply(response)
     
-    result = await db.execute(stmt)
-    rituals = result.scalars().all()
+    # 해당 월의 모든 날짜와 리츄얼 조회 (빈 날짜 포함)
+    activity = await fetch_daily_activity(db, user_id, [(first_day, last_day)])
     
     # 날짜별 데이터 구성
-    daily_data = {}
-    for ritual in rituals:
-        date_str = ritual.date.isoformat()
-        daily_data[date_str] = {
-            "date": date_str,
-            "has_ritual": True,
-            "is_completed": ritual.is_completed,
-            "ritual_id": ritual.id,
-            "ritual_title": ritual.ritual_title,
-            "ritual_type": ritual.ritual_type,
-            "user_mood": ritual.user_mood if ritual.is_completed else None
-        }
-    
-    # 빈 날짜 채우기
-    current_date = first_day
-    while current_date <= last_day:
-        date_str = current_date.isoformat()
-        if date_str not in daily_data:
-            daily_data[date_str] = {
+    days = []
+    for d in activity:
+        date_str = d.day.isoformat()
+        if d.daily_ritual_id is not None:
+            days.append({
+                "date": date_str,
+                "has_ritual": True,
+                "is_completed": d.daily_completed,
+                "ritual_id": d.daily_ritual_id,
+                "ritual_title": d.daily_ritual_title,
+                "ritual_type": d.daily_ritual_type,
+                "user_mood": d.daily_mood if d.daily_completed else None
+            })
+        else:
+            days.append({
                 "date": date_str,
                 "has_ritual": False,
                 "is_completed": False
-            }
-        current_date += timedelta(days=1)
-    
-    # 정렬된 리스트로 변환
-    days = sorted(daily_data.values(), key=lambda x: x["date"])
+            })
     
-    # 연속 기록 계산
-    completed_dates = [d["date"] for d in days if d["is_completed"]]
-    current_streak = _calculate_current_streak(completed_dates)
+    # 연속 기록 (요약 테이블에 쓰기 시점에 계산된 값)
+    streak_days = current_streak(activity, today)
     
     # 완료 일수 계산
     completed_count = len([d for d in days if d["is_completed"]])
-    days_passed = min((date.today() - first_day).days + 1, len(days))  # 이번 달 중 지난 일수
+    days_passed = min((today - first_day).days + 1, len(days))  # 이번 달 중 지난 일수
     
     return CalendarResponse(
         year=year,
@@ -285,7 +255,7 @@ async def get_calendar(
             "total_days": days_passed,  # 전체 날짜가 아닌 지난 날짜 기준
             "completed_days": completed_count,
             "completion_rate": completed_count / days_passed * 100 if days_passed > 0 else 0,
-            "current_streak": current_streak
+            "current_streak": streak_days
         }
     )
 
@@ -376,6 +346,7 @@ async def create_daily_ritual(
         duration_minutes=request.duration_minutes
     )
     db.add(ritual)
+    await sync_daily_activity(db, current_user.id, today)
     
     # UserStreak 업데이트
     stmt = select(UserStreak).where(UserStreak.user_id == current_user.id)
@@ -391,7 +362,9 @@ async def create_daily_ritual(
         )
         db.add(streak)
     
+    await bump_data_version(db, current_user.id)
     await db.commit()
+    invalidate_user_data(current_user.id)
     await db.refresh(ritual)
     
     return DailyRitualResponse(
@@ -448,6 +421,8 @@ async def complete_ritual(
     ritual.user_mood = request.user_mood
     ritual.difficulty_rating = request.difficulty_rating
     
+    await sync_daily_activity(db, current_user.id, ritual.date)
+    
     # UserStreak 업데이트
     await _update_user_streak(current_user.id, db)
     
@@ -467,7 +442,9 @@ async def complete_ritual(
         )
         db.add(heart_tree)
     
+    await bump_data_version(db, current_user.id)
     await db.commit()
+    invalidate_user_data(current_user.id)
     await db.refresh(ritual)
     
     return DailyRitualResponse(
@@ -522,6 +499,73 @@ async def get_streak(
 
 # ========== Helper Functions ==========
 
+async def _fetch_dashboard_stats(db: AsyncSession, user_id, today: date):
+    """대시보드 통계를 CTE 하나의 쿼리로 조회 (행이 없는 항목은 None)"""
+    result = await db.execute(build_dashboard_stats_query(user_id, today))
+    return result.one()
+
+
+def build_dashboard_stats_query(user_id, today: date):
+    """마음나무/연속 기록/오늘의 리츄얼/월간 완료/전체 리츄얼 수 CTE 쿼리"""
+    first_day = date(today.year, today.month, 1)
+    
+    anchor = select(literal(1).label("one")).cte("anchor")
+    tree = select(HeartTree.growth_level.label("tree_level")).where(
+        HeartTree.user_id == user_id
+    ).cte("tree")
+    # 완료한 메아리 리츄얼 수 (heart_trees.ritual_count는 발급된 순번이라 미완료 리츄얼도 포함)
+    rituals = select(
+        func.count().filter(Ritual.ritual_completed == True).label("total_ritual_count")
+    ).where(Ritual.user_id == user_id).cte("rituals")
+    streak = select(
+        UserStreak.total_rituals_completed,
+        UserStreak.total_rituals_created
+    ).where(UserStreak.user_id == user_id).cte("streak")
+    today_ritual = select(
+        DailyRitual.id.label("today_ritual_id"),
+        DailyRitual.ritual_title.label("today_ritual_title"),
+        DailyRitual.is_completed.label("today_ritual_completed"),
+        DailyRitual.ritual_type.label("today_ritual_type")
+    ).where(
+        DailyRitual.user_id == user_id,
+        DailyRitual.date == today
+    ).cte("today_ritual")
+    # 이번 달 완료 일수 + 연속 기록 (요약 테이블 이번 달 범위 한 번 스캔)
+    # 오늘 행의 연속 일수는 어제 값을 포함하므로 오늘/어제 중 완료된 행의 최댓값이 현재 연속 기록
+    recent_first = min(first_day, today - timedelta(days=1))
+    is_completed = UserDailyActivity.daily_completed == True
+    monthly = select(
+        func.count().filter(is_completed, UserDailyActivity.day >= first_day).label("monthly_completed"),
+        func.max(UserDailyActivity.streak_length).filter(
+            is_completed, UserDailyActivity.day >= today - timedelta(days=1)
+        ).label("current_streak")
+    ).where(
+        UserDailyActivity.user_id == user_id,
+        UserDailyActivity.day.between(recent_first, today)
+    ).cte("monthly")
+    
+    stmt = select(
+        tree.c.tree_level,
+        rituals.c.total_ritual_count,
+        monthly.c.current_streak,
+        streak.c.total_rituals_completed,
+        streak.c.total_rituals_created,
+        today_ritual.c.today_ritual_id,
+        today_ritual.c.today_ritual_title,
+        today_ritual.c.today_ritual_completed,
+        today_ritual.c.today_ritual_type,
+        monthly.c.monthly_completed
+    ).select_from(
+        anchor
+        .outerjoin(tree, true())
+        .outerjoin(streak, true())
+        .outerjoin(today_ritual, true())
+        .join(monthly, true())
+        .join(rituals, true())
+    )
+    return stmt
+
+
 def _get_tree_stage(level: int) -> Dict[str, Any]:
     """마음나무 단계 계산"""
     if level <= 6:
@@ -536,31 +580,6 @@ def _get_tree_stage(level: int) -> Dict[str, Any]:
         return {"stage": "full_bloom", "label": "만개", "next_milestone": None}
 
 
-def _calculate_current_streak(completed_dates: List[str]) -> int:
-    """현재 연속 일수 계산"""
-    if not completed_dates:
-        return 0
-    
-    # 날짜 문자열을 date 객체로 변환하고 정렬
-    dates = sorted([date.fromisoformat(d) for d in completed_dates], reverse=True)
-    
-    # 오늘 또는 어제부터 시작해야 연속으로 인정
-    today = date.today()
-    yesterday = today - timedelta(days=1)
-    
-    if dates[0] != today and dates[0] != yesterday:
-        return 0
-    
-    streak = 1
-    for i in range(1, len(dates)):
-        if dates[i] == dates[i-1] - timedelta(days=1):
-            streak += 1
-        else:
-            break
-    
-    return streak
-
-
 async def _update_user_streak(user_id: str, db: AsyncSession):
     """UserStreak 업데이트"""
     
@@ -2,18 +2,24 @@
 사용자 활동 이력 및 통합 조회 API
 """
 from typing import Dict, Any, List, Optional
-from fastapi import APIRouter, HTTPException, Depends, status, Query
+from fastapi import APIRouter, HTTPException, Depends, status, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_, desc, String
+from sqlalchemy import select, func, and_, or_, desc, tuple_
+from sqlalchemy.orm import contains_eager
 from datetime import datetime, date, timedelta
 import uuid
 
+from app.core.conditional import conditional_check
 from app.core.database import get_db
+from app.core.responses import trusted_response
 from app.core.auth import get_current_user
+from app.core.pagination import encode_cursor, decode_cursor
 from app.models.user import User
 from app.models.daily import DailyRitual
 from app.models.checkin import Ritual, HeartTree, AIPersonaHistory
 from app.models.card import MeariSession, GeneratedCard
+from app.services.activity import fetch_daily_activity, count_moods
+from app.services.data.latest_persona import get_latest_persona
 from app.schemas.history import (
     DayDetailResponse,
     SessionHistoryResponse,
@@ -64,40 +70,36 @@ async def get_day_detail(
     result = await db.execute(stmt)
     meari_ritual = result.scalar_one_or_none()
     
-    # 3. 해당 날짜의 세션 조회
+    # 3~4. 해당 날짜의 세션과 카드를 한 번에 조회
     start_datetime = datetime.combine(target_date, datetime.min.time())
     end_datetime = datetime.combine(target_date, datetime.max.time())
     
-    stmt = select(MeariSession).where(
+    stmt = select(MeariSession).outerjoin(
+        MeariSession.generated_cards
+    ).options(
+        contains_eager(MeariSession.generated_cards)
+    ).where(
         and_(
             MeariSession.user_id == user_id,
             MeariSession.created_at >= start_datetime,
             MeariSession.created_at <= end_datetime
         )
-    )
+    ).order_by(MeariSession.created_at, GeneratedCard.created_at)
     result = await db.execute(stmt)
-    sessions = result.scalars().all()
-    
-    # 4. 해당 날짜의 카드 조회
-    session_ids = [s.id for s in sessions]
-    generated_cards = []
-    
-    if session_ids:
-        stmt = select(GeneratedCard).where(
-            GeneratedCard.session_id.in_(session_ids)
-        ).order_by(GeneratedCard.created_at)
-        result = await db.execute(stmt)
-        cards = result.scalars().all()
-        
-        for card in cards:
-            generated_cards.append({
-                "id": card.id,
-                "card_type": card.card_type,
-                "sub_type": card.sub_type,
-                "content": card.content,
-                "growth_context": card.growth_context,
-                "created_at": card.created_at.isoformat()
-            })
+    sessions = result.unique().scalars().all()
+    
+    cards = sorted(
+        (card for s in sessions for card in s.generated_cards),
+        key=lambda card: card.created_at
+    )
+    generated_cards = [{
+        "id": card.id,
+        "card_type": card.card_type,
+        "sub_type": card.sub_type,
+        "content": card.content,
+        "growth_context": card.growth_context,
+        "created_at": card.created_at.isoformat()
+    } for card in cards]
     
     # 5. 마음나무 레벨 조회
     stmt = select(HeartTree).where(HeartTree.user_id == user_id)
@@ -142,50 +144,77 @@ async def get_day_detail(
 async def get_session_history(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (있으면 page 무시)"),
+    include_total: Optional[bool] = Query(None, description="전체 개수 포함 여부 (기본값: cursor가 없을 때만)"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ) -> SessionHistoryResponse:
-    """메아리 세션 이력 조회"""
+    """메아리 세션 이력 조회 ((created_at, id) 키셋 페이지네이션)"""
     
     user_id = current_user.id
-    offset = (page - 1) * limit
-    
-    # 전체 개수
-    stmt = select(func.count()).select_from(MeariSession).where(
+    if include_total is None:
+        include_total = cursor is None
+    
+    # 세션별 카드 개수 (현재 페이지 행에 대해서만 계산)
+    card_count = select(func.count(GeneratedCard.id)).where(
+        GeneratedCard.session_id == MeariSession.id
+    ).correlate(MeariSession).scalar_subquery()
+    total_count = select(func.count()).select_from(MeariSession).where(
         MeariSession.user_id == user_id
-    )
-    result = await db.execute(stmt)
-    total = result.scalar() or 0
+    ).scalar_subquery()
+    
+    columns = [
+        MeariSession.id,
+        MeariSession.created_at,
+        MeariSession.selected_tag_ids,
+        card_count.label("card_count")
+    ]
+    if include_total:
+        columns.append(total_count.label("total"))
+    
+    stmt = select(*columns).where(MeariSession.user_id == user_id)
+    if cursor:
+        last_created_at, last_id = decode_cursor(cursor, (datetime.fromisoformat, uuid.UUID))
+        stmt = stmt.where(
+            tuple_(MeariSession.created_at, MeariSession.id) < tuple_(last_created_at, last_id)
+        )
+    else:
+        stmt = stmt.offset((page - 1) * limit)
     
-    # 세션 목록
-    stmt = select(MeariSession).where(
-        MeariSession.user_id == user_id
-    ).order_by(desc(MeariSession.created_at)).offset(offset).limit(limit)
+    # 다음 페이지 존재 여부 확인용으로 1개 더 조회
+    stmt = stmt.order_by(
+        desc(MeariSession.created_at), desc(MeariSession.id)
+    ).limit(limit + 1)
     
     result = await db.execute(stmt)
-    sessions = result.scalars().all()
-    
-    # 각 세션의 카드 개수 조회
-    session_data = []
-    for session in sessions:
-        stmt = select(func.count()).select_from(GeneratedCard).where(
-            GeneratedCard.session_id == session.id
-        )
-        result = await db.execute(stmt)
-        card_count = result.scalar() or 0
-        
-        session_data.append({
-            "id": str(session.id),
-            "created_at": session.created_at.isoformat(),
-            "selected_tag_ids": session.selected_tag_ids,
-            "card_count": card_count
-        })
+    rows = result.all()
+    
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+    
+    total = None
+    if include_total:
+        if rows:
+            total = rows[0].total
+        else:
+            result = await db.execute(select(total_count))
+            total = result.scalar() or 0
+    
+    session_data = [{
+        "id": str(row.id),
+        "created_at": row.created_at.isoformat(),
+        "selected_tag_ids": row.selected_tag_ids,
+        "card_count": row.card_count
+    } for row in rows]
     
     return SessionHistoryResponse(
         total=total,
         page=page,
         limit=limit,
-        sessions=session_data
+        sessions=session_data,
+        next_cursor=next_cursor
     )
 
 
@@ -204,73 +233,97 @@ async def search_cards(
     
     user_id = current_user.id
     
-    # 기본 쿼리
-    stmt = select(GeneratedCard).where(
-        GeneratedCard.user_id == user_id
-    )
+    # 필터 조건
+    conditions = [GeneratedCard.user_id == user_id]
     
     # 날짜 필터
     if request.date_from:
         start_datetime = datetime.combine(request.date_from, datetime.min.time())
-        stmt = stmt.where(GeneratedCard.created_at >= start_datetime)
+        conditions.append(GeneratedCard.created_at >= start_datetime)
     
     if request.date_to:
         end_datetime = datetime.combine(request.date_to, datetime.max.time())
-        stmt = stmt.where(GeneratedCard.created_at <= end_datetime)
+        conditions.append(GeneratedCard.created_at <= end_datetime)
     
     # 카드 타입 필터
     if request.card_type:
-        stmt = stmt.where(GeneratedCard.card_type == request.card_type)
+        conditions.append(GeneratedCard.card_type == request.card_type)
     
     if request.sub_type:
-        stmt = stmt.where(GeneratedCard.sub_type == request.sub_type)
+        conditions.append(GeneratedCard.sub_type == request.sub_type)
+    
+    include_total = request.include_total
+    if include_total is None:
+        include_total = request.cursor is None
     
-    # 키워드 검색 (JSONB content 필드에서)
+    # 정렬 키: 키워드가 있으면 (유사도, created_at, id), 없으면 (created_at, id) 내림차순
+    sort_keys = [GeneratedCard.created_at, GeneratedCard.id]
+    cursor_types = [datetime.fromisoformat, int]
+    
+    # 키워드 검색 (content 문자열 값의 pg_trgm GIN 인덱스 사용)
     if request.keyword:
-        # PostgreSQL JSONB 텍스트 검색
-        stmt = stmt.where(
-            func.cast(GeneratedCard.content, String).ilike(f"%{request.keyword}%")
-        )
+        pattern = "%" + _escape_like(request.keyword) + "%"
+        conditions.append(GeneratedCard.search_text.ilike(pattern, escape="\\"))
+        sort_keys.insert(0, func.similarity(GeneratedCard.search_text, request.keyword))
+        cursor_types.insert(0, float)
     
-    # 정렬 및 페이징
-    offset = (request.page - 1) * request.limit
-    stmt = stmt.order_by(desc(GeneratedCard.created_at)).offset(offset).limit(request.limit)
+    total_count = select(func.count()).select_from(GeneratedCard).where(*conditions).scalar_subquery()
     
-    result = await db.execute(stmt)
-    cards = result.scalars().all()
+    columns = [GeneratedCard, *[key.label(f"sort_{i}") for i, key in enumerate(sort_keys)]]
+    if include_total:
+        columns.append(total_count.label("total"))
     
-    # 전체 개수 (필터 적용)
-    count_stmt = select(func.count()).select_from(GeneratedCard).where(
-        GeneratedCard.user_id == user_id
-    )
-    if request.date_from:
-        count_stmt = count_stmt.where(GeneratedCard.created_at >= start_datetime)
-    if request.date_to:
-        count_stmt = count_stmt.where(GeneratedCard.created_at <= end_datetime)
-    if request.card_type:
-        count_stmt = count_stmt.where(GeneratedCard.card_type == request.card_type)
-    if request.sub_type:
-        count_stmt = count_stmt.where(GeneratedCard.sub_type == request.sub_type)
+    stmt = select(*columns).where(*conditions)
+    if request.cursor:
+        last_values = decode_cursor(request.cursor, cursor_types)
+        stmt = stmt.where(tuple_(*sort_keys) < tuple_(*last_values))
+    else:
+        stmt = stmt.offset((request.page - 1) * request.limit)
     
-    result = await db.execute(count_stmt)
-    total = result.scalar() or 0
+    # 다음 페이지 존재 여부 확인용으로 1개 더 조회
+    stmt = stmt.order_by(*[desc(key) for key in sort_keys]).limit(request.limit + 1)
     
-    return CardSearchResponse(
+    result = await db.execute(stmt)
+    rows = result.all()
+    
+    next_cursor = None
+    if len(rows) > request.limit:
+        rows = rows[:request.limit]
+        next_cursor = encode_cursor(*[rows[-1]._mapping[f"sort_{i}"] for i in range(len(sort_keys))])
+    cards = [row.GeneratedCard for row in rows]
+    
+    total = None
+    if include_total:
+        if rows:
+            total = rows[0].total
+        else:
+            result = await db.execute(select(total_count))
+            total = result.scalar() or 0
+    
+    # DB JSONB 카드는 재검증 없이 직렬화
+    return trusted_response(
+        CardSearchResponse,
         total=total,
         page=request.page,
         limit=request.limit,
+        next_cursor=next_cursor,
         cards=[{
             "id": card.id,
-            "session_id": str(card.session_id),
+            "session_id": card.session_id,
             "card_type": card.card_type,
             "sub_type": card.sub_type,
             "content": card.content,
             "growth_context": card.growth_context,
-            "created_at": card.created_at.isoformat()
+            "created_at": card.created_at
         } for card in cards]
     )
 
 
+def _escape_like(keyword: str) -> str:
+    """LIKE 패턴 특수문자 이스케이프"""
+    return keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 @router.get(
     "/persona/evolution",
     response_model=PersonaEvolutionResponse,
@@ -278,6 +331,8 @@ async def search_cards(
     description="사용자의 페르소나 진화 과정을 조회합니다"
 )
 async def get_persona_evolution(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ) -> PersonaEvolutionResponse:
@@ -285,15 +340,13 @@ async def get_persona_evolution(
     
     user_id = current_user.id
     
+    check = await conditional_check(db, user_id)
+    if check.matches(request):
+        return check.not_modified()
+    check.apply(response)
+    
     # 현재 페르소나
-    stmt = select(AIPersonaHistory).where(
-        and_(
-            AIPersonaHistory.user_id == user_id,
-            AIPersonaHistory.is_latest == True
-        )
-    )
-    result = await db.execute(stmt)
-    current_persona = result.scalar_one_or_none()
+    current_persona = await get_latest_persona(db, user_id)
     
     # 페르소나 이력
     stmt = select(AIPersonaHistory).where(
@@ -350,89 +403,34 @@ async def get_ritual_stats(
     else:
         last_day = date(year, month + 1, 1) - timedelta(days=1)
     
-    # DailyRitual 통계
-    stmt = select(
-        func.count(DailyRitual.id).label("total"),
-        func.count(DailyRitual.id).filter(DailyRitual.is_completed == True).label("completed"),
-        func.count(DailyRitual.user_mood).label("with_mood")
-    ).where(
-        and_(
-            DailyRitual.user_id == user_id,
-            DailyRitual.date >= first_day,
-            DailyRitual.date <= last_day
-        )
-    )
-    result = await db.execute(stmt)
-    daily_stats = result.one()
+    # 월간 + 최근 4주 활동을 한 번에 조회
+    week_starts = [
+        today - timedelta(days=today.weekday() + week_offset * 7)
+        for week_offset in range(4)
+    ]
+    days = await fetch_daily_activity(db, user_id, [
+        (first_day, last_day),
+        (week_starts[-1], week_starts[0] + timedelta(days=6))
+    ])
+    month_days = [d for d in days if first_day <= d.day <= last_day]
     
-    # Ritual (메아리) 통계
-    stmt = select(
-        func.count(Ritual.id).label("total"),
-        func.count(Ritual.selected_mood).label("with_mood")
-    ).where(
-        and_(
-            Ritual.user_id == user_id,
-            Ritual.checkin_date >= first_day,
-            Ritual.checkin_date <= last_day
-        )
-    )
-    result = await db.execute(stmt)
-    meari_stats = result.one()
+    # 월간 통계
+    daily_completed = sum(1 for d in month_days if d.daily_completed)
+    meari_total = sum(1 for d in month_days if d.meari_ritual_id is not None)
     
     # 기분 분포
-    mood_distribution = {}
-    
-    # DailyRitual 기분
-    stmt = select(
-        DailyRitual.user_mood,
-        func.count(DailyRitual.id)
-    ).where(
-        and_(
-            DailyRitual.user_id == user_id,
-            DailyRitual.date >= first_day,
-            DailyRitual.date <= last_day,
-            DailyRitual.user_mood.isnot(None)
-        )
-    ).group_by(DailyRitual.user_mood)
-    
-    result = await db.execute(stmt)
-    for mood, count in result:
-        mood_distribution[mood] = mood_distribution.get(mood, 0) + count
-    
-    # Ritual 기분
-    stmt = select(
-        Ritual.selected_mood,
-        func.count(Ritual.id)
-    ).where(
-        and_(
-            Ritual.user_id == user_id,
-            Ritual.checkin_date >= first_day,
-            Ritual.checkin_date <= last_day,
-            Ritual.selected_mood.isnot(None)
-        )
-    ).group_by(Ritual.selected_mood)
-    
-    result = await db.execute(stmt)
-    for mood, count in result:
-        mood_distribution[mood] = mood_distribution.get(mood, 0) + count
+    mood_distribution = count_moods(month_days)
     
     # 주간 통계 (최근 4주)
     weekly_stats = []
-    for week_offset in range(4):
-        week_start = today - timedelta(days=today.weekday() + week_offset * 7)
+    for week_start in week_starts:
         week_end = week_start + timedelta(days=6)
         
         # 주간 완료 일수
-        stmt = select(func.count(DailyRitual.id)).where(
-            and_(
-                DailyRitual.user_id == user_id,
-                DailyRitual.date >= week_start,
-                DailyRitual.date <= week_end,
-                DailyRitual.is_completed == True
-            )
+        completed = sum(
+            1 for d in days
+            if week_start <= d.day <= week_end and d.daily_completed
         )
-        result = await db.execute(stmt)
-        completed = result.scalar() or 0
         
         weekly_stats.append({
             "week_start": week_start.isoformat(),
@@ -442,15 +440,15 @@ async def get_ritual_stats(
         })
     
     total_days = (last_day - first_day).days + 1
-    total_completed = daily_stats.completed + meari_stats.total
+    total_completed = daily_completed + meari_total
     
     return RitualStatsResponse(
         monthly={
             "year": year,
             "month": month,
             "total_days": total_days,
-            "daily_rituals_completed": daily_stats.completed,
-            "meari_rituals_completed": meari_stats.total,
+            "daily_rituals_completed": daily_completed,
+            "meari_rituals_completed": meari_total,
             "total_completed": total_completed,
             "completion_rate": (total_completed / total_days) * 100 if total_days > 0 else 0,
             "mood_distribution": mood_distribution
@@ -0,0 +1,134 @@
+"""
+비동기 작업 조회 API
+mode=async로 접수된 워크플로우 작업의 상태 조회와 진행 상황 SSE 스트림
+"""
+import asyncio
+import os
+from typing import AsyncIterator
+from fastapi import APIRouter, HTTPException, Depends, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+import uuid
+
+from app.core.auth import get_current_user
+from app.core.database import get_db
+from app.core.job_queue import TERMINAL_STATUSES, get_job_queue
+from app.core.responses import dumps
+from app.models.job import WorkflowJob
+from app.models.user import User
+from app.schemas.job import JobAcceptedResponse, JobStatusResponse
+
+router = APIRouter(
+    prefix="/jobs",
+    tags=["jobs"]
+)
+
+# 응답 압축에서 제외할 SSE 경로 (압축 미들웨어가 버퍼링하면 이벤트가 늦게 도착함)
+EVENTS_PATH_PATTERN = r"^/api/v1/jobs/[^/]+/events$"
+
+# SSE 상태 재확인 간격과 연결 유지용 주석 간격(초)
+EVENTS_POLL_INTERVAL = float(os.getenv("JOB_EVENTS_POLL_INTERVAL", "1.0"))
+EVENTS_KEEPALIVE = float(os.getenv("JOB_EVENTS_KEEPALIVE", "15.0"))
+
+
+def job_accepted(request: Request, job: WorkflowJob) -> JobAcceptedResponse:
+    """작업 접수 응답 (상태/이벤트 URL 포함)"""
+    status_url = str(request.url_for("get_job", job_id=job.id).path)
+    return JobAcceptedResponse(
+        job_id=job.id,
+        status=job.status,
+        status_url=status_url,
+        events_url=f"{status_url}/events"
+    )
+
+
+def to_status_response(job: WorkflowJob) -> JobStatusResponse:
+    return JobStatusResponse(
+        job_id=job.id,
+        job_type=job.job_type,
+        status=job.status,
+        stage=job.stage,
+        attempts=job.attempts,
+        result=job.result,
+        error=job.error,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at
+    )
+
+
+async def _get_owned_job(job_id: uuid.UUID, user: User) -> WorkflowJob:
+    job = await get_job_queue().get(job_id)
+    # 다른 사용자의 작업은 존재 여부도 노출하지 않음
+    if job is None or job.user_id != user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="작업을 찾을 수 없습니다"
+        )
+    return job
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobStatusResponse,
+    summary="작업 상태 조회",
+    description="비동기 모드로 접수된 작업의 진행 상태와 결과를 조회합니다"
+)
+async def get_job(
+    job_id: uuid.UUID,
+    current_user: User = Depends(get_current_user)
+) -> JobStatusResponse:
+    job = await _get_owned_job(job_id, current_user)
+    return to_status_response(job)
+
+
+@router.get(
+    "/{job_id}/events",
+    summary="작업 진행 상황 스트림",
+    description="작업 상태가 바뀔 때마다 Server-Sent Events로 알리고, 끝나면 스트림을 닫습니다",
+    response_class=StreamingResponse
+)
+async def stream_job_events(
+    job_id: uuid.UUID,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> StreamingResponse:
+    job = await _get_owned_job(job_id, current_user)
+    # 인증에 쓴 세션의 커넥션을 스트림 동안 붙잡지 않도록 반납 (상태 조회는 매번 짧은 세션)
+    await db.close()
+
+    return StreamingResponse(
+        _job_events(request, job),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _job_events(request: Request, job: WorkflowJob) -> AsyncIterator[bytes]:
+    """상태/단계가 바뀔 때 이벤트 전송, 종료 상태면 마지막 이벤트 후 종료"""
+    queue = get_job_queue()
+    last_state = None
+    idle = 0.0
+
+    while True:
+        state = (job.status, job.stage)
+        if state != last_state:
+            last_state = state
+            idle = 0.0
+            payload = to_status_response(job).model_dump(mode="json")
+            yield b"event: " + job.status.encode() + b"\ndata: " + dumps(payload) + b"\n\n"
+            if job.status in TERMINAL_STATUSES:
+                return
+        elif idle >= EVENTS_KEEPALIVE:
+            idle = 0.0
+            yield b": keepalive\n\n"
+
+        await asyncio.sleep(EVENTS_POLL_INTERVAL)
+        idle += EVENTS_POLL_INTERVAL
+        if await request.is_disconnected():
+            return
+
+        job = await queue.get(job.id)
+        if job is None:
+            return
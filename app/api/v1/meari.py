@@ -1,15 +1,27 @@
 """
 메아리 API 엔드포인트
 """
-from typing import Dict, Any, Optional
-from fastapi import APIRouter, HTTPException, Depends, status
+import json
+from typing import Dict, Any, Literal, Optional
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response, status
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from datetime import datetime
 import uuid
 
+from app.core.cache import invalidate_user_data
+from app.core.conditional import bump_data_version
 from app.core.database import get_db
+from app.core.executors import run_io
+from app.core.idempotency import Idempotency, idempotency
+from app.core.job_queue import get_job_queue
+from app.core.job_worker import ProgressCallback, job_handler
+from app.core.responses import ORJSONResponse, trusted_response
 from app.core.auth import get_current_user
+from app.api.v1.jobs import job_accepted
+from app.models.job import WorkflowJob
 from app.models.user import User
 from app.schemas.meari import (
     MeariSessionRequest,
@@ -18,32 +30,70 @@ from app.schemas.meari import (
     GrowthContentResponse,
     RitualRequest,
     RitualResponse,
+    PersonaData,
     TreeStatus
 )
+from app.schemas.job import JobAcceptedResponse
 from app.models.card import MeariSession, GeneratedCard
-from app.models.checkin import AIPersonaHistory, Ritual, HeartTree
+from app.models.checkin import Ritual, HeartTree
 from app.models.history import UserContentHistory
+from app.services.activity import sync_daily_activity
 from app.services.ai.workflow import MeariWorkflow
+from app.services.heart_tree import allocate_ritual_sequence
+from app.services.data.latest_persona import record_persona, get_persona_summary
+from app.services.data.seen_policies import get_seen_policy_ids
 
 router = APIRouter(
     prefix="/meari",
     tags=["meari"]
 )
 
+ASYNC_MODE_DESCRIPTION = "async면 작업 ID를 바로 반환하고 워커가 실행 (GET /jobs/{job_id}로 결과 조회)"
+
+
+async def _enqueue_job(http_request: Request, job_type: str, current_user: User, request: BaseModel) -> Response:
+    """워크플로우 요청을 작업 큐에 넣고 202 응답"""
+    job = await get_job_queue().enqueue(job_type, current_user.id, request.model_dump(mode="json"))
+    accepted = job_accepted(http_request, job)
+    return ORJSONResponse(
+        accepted,
+        status_code=status.HTTP_202_ACCEPTED,
+        headers={"Location": accepted.status_url}
+    )
+
+
 @router.post(
     "/sessions",
     response_model=MeariSessionResponse,
     status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_202_ACCEPTED: {"model": JobAcceptedResponse, "description": "mode=async 작업 접수"}},
     summary="메아리 세션 생성",
     description="태그 선택과 고민 입력으로 AI 카드와 페르소나를 생성합니다"
 )
 async def create_meari_session(
     request: MeariSessionRequest,
+    http_request: Request,
+    mode: Literal["sync", "async"] = Query("sync", description=ASYNC_MODE_DESCRIPTION),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    idem: Idempotency = Depends(idempotency)
 ) -> MeariSessionResponse:
+    # 재시도/중복 탭은 같은 워크플로우 결과를 공유 (LLM 중복 호출 방지)
+    if mode == "async":
+        return await idem.run(lambda: _enqueue_job(http_request, "meari_session", current_user, request))
+    return await idem.run(lambda: _create_meari_session(request, current_user, db))
+
+
+async def _create_meari_session(
+    request: MeariSessionRequest,
+    current_user: User,
+    db: AsyncSession,
+    progress: Optional[ProgressCallback] = None
+) -> Response:
     
     try:
+        if progress:
+            await progress("workflow")
         workflow = MeariWorkflow()
         
         workflow_request = {
@@ -53,14 +103,8 @@ async def create_meari_session(
             "user_context": request.user_context or f"태그 {request.selected_tag_id}번 관련 고민"
         }
         
-        # 동기 함수를 비동기로 실행
-        import asyncio
-        loop = asyncio.get_event_loop()
-        workflow_result = await loop.run_in_executor(
-            None,  # 기본 ThreadPoolExecutor 사용
-            workflow.process_request,
-            workflow_request
-        )
+        # 동기 워크플로우(LLM 호출 위주)는 I/O 레인에서 실행
+        workflow_result = await run_io(workflow.process_request, workflow_request)
         
         # 디버깅: 결과 확인
         print(f"워크플로우 결과 키: {list(workflow_result.keys())}")
@@ -73,6 +117,8 @@ async def create_meari_session(
                 detail=workflow_result.get("message", "워크플로우 처리 실패")
             )
         
+        if progress:
+            await progress("saving")
         session_id = uuid.uuid4()
         user_id = current_user.id  # 인증된 사용자의 ID 사용
         
@@ -99,22 +145,7 @@ async def create_meari_session(
         
         persona_data = workflow_result.get("persona", {})
         if persona_data:  # user_id가 있으면 항상 페르소나 저장
-            # SQLAlchemy 2.0 스타일로 변경
-            from sqlalchemy import update
-            stmt = update(AIPersonaHistory).where(
-                AIPersonaHistory.user_id == user_id,
-                AIPersonaHistory.is_latest == True
-            ).values(is_latest=False)
-            await db.execute(stmt)
-            
-            persona_history = AIPersonaHistory(
-                user_id=user_id,
-                persona_data=persona_data,
-                event_type="initial",
-                is_latest=True,
-                event_date=datetime.utcnow().date()
-            )
-            db.add(persona_history)
+            await record_persona(db, user_id, persona_data, "initial", datetime.utcnow().date())
         
         # 마음나무 초기화 또는 업데이트
         from app.models.checkin import HeartTree
@@ -135,15 +166,20 @@ async def create_meari_session(
             )
             db.add(heart_tree)
         
+        await bump_data_version(db, user_id)
         await db.commit()
+        invalidate_user_data(user_id)
         
-        return MeariSessionResponse(
+        # 카드 payload는 재검증 없이 직렬화 (페르소나만 스키마 검증)
+        return trusted_response(
+            MeariSessionResponse,
+            status_code=status.HTTP_201_CREATED,
             status="success",
             session_type="initial",
             timestamp=datetime.utcnow(),
             session_id=session_id,
             cards=workflow_result.get("cards", {}),
-            persona=persona_data,
+            persona=PersonaData.model_validate(persona_data),
             next_action="growth_content"
         )
         
@@ -162,14 +198,29 @@ async def create_meari_session(
     "/growth-contents",
     response_model=GrowthContentResponse,
     status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_202_ACCEPTED: {"model": JobAcceptedResponse, "description": "mode=async 작업 접수"}},
     summary="성장 콘텐츠 생성",
     description="페르소나 기반으로 맞춤형 성장 콘텐츠를 생성합니다"
 )
 async def create_growth_contents(
     request: GrowthContentRequest,
+    http_request: Request,
+    mode: Literal["sync", "async"] = Query("sync", description=ASYNC_MODE_DESCRIPTION),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    idem: Idempotency = Depends(idempotency)
 ) -> GrowthContentResponse:
+    if mode == "async":
+        return await idem.run(lambda: _enqueue_job(http_request, "growth_content", current_user, request))
+    return await idem.run(lambda: _create_growth_contents(request, current_user, db))
+
+
+async def _create_growth_contents(
+    request: GrowthContentRequest,
+    current_user: User,
+    db: AsyncSession,
+    progress: Optional[ProgressCallback] = None
+) -> Response:
     
     try:
         # 세션 확인
@@ -208,7 +259,9 @@ async def create_growth_contents(
                 if card.sub_type:
                     cards_dict[card.sub_type] = card.content
             
-            return GrowthContentResponse(
+            return trusted_response(
+                GrowthContentResponse,
+                status_code=status.HTTP_201_CREATED,
                 status="success",
                 content_type="growth",
                 timestamp=datetime.utcnow(),
@@ -218,28 +271,17 @@ async def create_growth_contents(
         # 최신 페르소나 가져오기
         persona_summary = request.persona_summary
         if not persona_summary and user_id:
-            stmt = select(AIPersonaHistory).where(
-                AIPersonaHistory.user_id == user_id,
-                AIPersonaHistory.is_latest == True
-            )
-            result = await db.execute(stmt)
-            persona = result.scalar_one_or_none()
-            if persona:
-                persona_summary = persona.persona_data.get("summary", "")
-        
-        # 사용자가 이미 본 정책 ID 가져오기
-        from app.models.history import UserContentHistory
-        stmt = select(UserContentHistory.content_id).where(
-            UserContentHistory.user_id == user_id,
-            UserContentHistory.content_type == "policy"
-        )
-        result = await db.execute(stmt)
-        viewed_policy_ids = [row[0] for row in result.fetchall()]
+            persona_summary = await get_persona_summary(db, user_id)
+        
+        # 사용자가 이미 본 정책 ID 가져오기 (모든 워커의 기록을 보도록 DB에서)
+        viewed_policy_ids = await get_seen_policy_ids(db, user_id)
         
         # 요청에서 제공된 previous_policy_ids와 병합
-        all_previous_policy_ids = list(set(request.previous_policy_ids + viewed_policy_ids))
+        all_previous_policy_ids = list(viewed_policy_ids.union(request.previous_policy_ids))
         
         # 워크플로우 실행
+        if progress:
+            await progress("workflow")
         workflow = MeariWorkflow()
         
         # 세션에서 태그 정보 가져오기
@@ -256,51 +298,45 @@ async def create_growth_contents(
             "user_id": str(user_id) if user_id else None
         }
         
-        # 동기 함수를 비동기로 실행
-        import asyncio
-        loop = asyncio.get_event_loop()
-        workflow_result = await loop.run_in_executor(
-            None,  # 기본 ThreadPoolExecutor 사용
-            workflow.process_request,
-            workflow_request
-        )
+        # 동기 워크플로우(LLM 호출 위주)는 I/O 레인에서 실행
+        workflow_result = await run_io(workflow.process_request, workflow_request)
         workflow.close()
         
-        # 카드 저장
+        if progress:
+            await progress("saving")
+        
+        # 카드 저장 (한 번의 bulk INSERT)
         cards_for_db = workflow_result.get("cards_for_db", [])
-        for card_data in cards_for_db:
-            card = GeneratedCard(
-                session_id=request.session_id,
-                user_id=user_id,
-                card_type=card_data.get("card_type"),
-                sub_type=card_data.get("sub_type"),
-                content=card_data.get("content"),
-                source_ids=card_data.get("source_ids"),
-                growth_context=card_data.get("growth_context", request.context)
+        if cards_for_db:
+            await db.execute(insert(GeneratedCard), [
+                {
+                    "session_id": request.session_id,
+                    "user_id": user_id,
+                    "card_type": card_data.get("card_type"),
+                    "sub_type": card_data.get("sub_type"),
+                    "content": card_data.get("content"),
+                    "source_ids": card_data.get("source_ids"),
+                    "growth_context": card_data.get("growth_context", request.context)
+                }
+                for card_data in cards_for_db
+            ])
+        
+        # support 카드의 정책 ID를 열람 이력으로 저장
+        # _user_content_uc 제약으로 중복은 DB에서 무시 (조회 후 삽입 경쟁 없음)
+        recorded_policy_ids = list(dict.fromkeys(
+            policy_id
+            for card_data in cards_for_db
+            if card_data.get("sub_type") == "support" and card_data.get("source_ids")
+            for policy_id in card_data["source_ids"].get("policies", [])
+            if policy_id
+        ))
+        if recorded_policy_ids:
+            await db.execute(
+                pg_insert(UserContentHistory).values([
+                    {"user_id": user_id, "content_type": "policy", "content_id": policy_id}
+                    for policy_id in recorded_policy_ids
+                ]).on_conflict_do_nothing(constraint="_user_content_uc")
             )
-            db.add(card)
-            
-            # support 카드에서 정책 ID 추출하여 이력 저장
-            if card_data.get("sub_type") == "support" and card_data.get("source_ids"):
-                policy_ids = card_data["source_ids"].get("policies", [])
-                for policy_id in policy_ids:
-                    if policy_id:
-                        # 중복 체크 - 이미 존재하는지 확인
-                        stmt = select(UserContentHistory).where(
-                            UserContentHistory.user_id == user_id,
-                            UserContentHistory.content_type == "policy",
-                            UserContentHistory.content_id == policy_id
-                        )
-                        result = await db.execute(stmt)
-                        existing = result.scalar_one_or_none()
-                        
-                        if not existing:
-                            history = UserContentHistory(
-                                user_id=user_id,
-                                content_type="policy",
-                                content_id=policy_id
-                            )
-                            db.add(history)
         
         # Experience 카드를 DailyRitual로도 저장 (대시보드 연동)
         from app.models.daily import DailyRitual
@@ -349,6 +385,7 @@ async def create_growth_contents(
                         pass
                 
                 db.add(daily_ritual)
+                await sync_daily_activity(db, user_id, today)
                 
                 # context에 따른 메시지 분기
                 if request.context == "initial":
@@ -356,9 +393,13 @@ async def create_growth_contents(
                 else:
                     print(f"[ritual] 오늘의 리츄얼 받기 - 리츄얼 생성: {ritual_name}")
         
+        await bump_data_version(db, user_id)
         await db.commit()
+        invalidate_user_data(user_id)
         
-        return GrowthContentResponse(
+        return trusted_response(
+            GrowthContentResponse,
+            status_code=status.HTTP_201_CREATED,
             status="success",
             content_type="growth",
             timestamp=datetime.utcnow(),
@@ -376,6 +417,42 @@ async def create_growth_contents(
         )
 
 
+@job_handler("meari_session")
+async def _run_meari_session_job(
+    db: AsyncSession,
+    job: WorkflowJob,
+    progress: ProgressCallback
+) -> Dict[str, Any]:
+    """mode=async 세션 작업 (동기 모드와 같은 처리, 응답 본문을 결과로 저장)"""
+    user = await _get_job_user(db, job)
+    request = MeariSessionRequest.model_validate(job.payload)
+    response = await _create_meari_session(request, user, db, progress)
+    return json.loads(response.body)
+
+
+@job_handler("growth_content")
+async def _run_growth_content_job(
+    db: AsyncSession,
+    job: WorkflowJob,
+    progress: ProgressCallback
+) -> Dict[str, Any]:
+    """mode=async 성장 콘텐츠 작업"""
+    user = await _get_job_user(db, job)
+    request = GrowthContentRequest.model_validate(job.payload)
+    response = await _create_growth_contents(request, user, db, progress)
+    return json.loads(response.body)
+
+
+async def _get_job_user(db: AsyncSession, job: WorkflowJob) -> User:
+    user = await db.get(User, job.user_id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="사용자를 찾을 수 없습니다"
+        )
+    return user
+
+
 @router.post(
     "/rituals",
     response_model=RitualResponse,
@@ -393,13 +470,8 @@ async def create_ritual(
         # 인증된 사용자 ID 사용
         user_id = current_user.id
         
-        # 기존 리츄얼 개수 확인
-        stmt = select(func.count()).select_from(Ritual).where(Ritual.user_id == user_id)
-        result = await db.execute(stmt)
-        ritual_count = result.scalar() or 0
-        
-        # 새 리츄얼 시퀀스
-        new_sequence = ritual_count + 1
+        # 새 리츄얼 시퀀스 (마음나무 카운터 원자적 증가 + 레벨 갱신)
+        new_sequence = await allocate_ritual_sequence(db, user_id, grow_tree=True)
         
         # 리츄얼 저장
         today = datetime.utcnow().date()
@@ -482,25 +554,9 @@ async def create_ritual(
             streak.total_days_active += 1
             streak.total_rituals_completed += 1
         
-        await db.flush()
+        await sync_daily_activity(db, user_id, today)
         
-        # 마음나무 상태 업데이트 또는 생성
-        stmt = select(HeartTree).where(HeartTree.user_id == user_id)
-        result = await db.execute(stmt)
-        heart_tree = result.scalar_one_or_none()
-        
-        if not heart_tree:
-            heart_tree = HeartTree(
-                user_id=user_id,
-                growth_level=new_sequence,
-                last_grew_at=datetime.utcnow()
-            )
-            db.add(heart_tree)
-        else:
-            heart_tree.growth_level = new_sequence
-            heart_tree.last_grew_at = datetime.utcnow()
-        
-        # 마음나무 단계 계산
+        # 마음나무 단계 계산 (레벨은 순번 발급 시 이미 갱신됨)
         tree_status = _calculate_tree_status(new_sequence)
         
         # 페르소나 업데이트 (5개 리츄얼마다)
@@ -540,23 +596,8 @@ async def create_ritual(
             # 페르소나 업데이트
             persona_data = workflow_result.get("persona", {})
             if persona_data:
-                # 기존 페르소나를 is_latest=False로
-                from sqlalchemy import update
-                stmt = update(AIPersonaHistory).where(
-                    AIPersonaHistory.user_id == user_id,
-                    AIPersonaHistory.is_latest == True
-                ).values(is_latest=False)
-                await db.execute(stmt)
-                
-                # 새 페르소나 저장
-                persona_history = AIPersonaHistory(
-                    user_id=user_id,
-                    persona_data=persona_data,
-                    event_type="ritual_update",
-                    is_latest=True,
-                    event_date=datetime.utcnow().date()
-                )
-                db.add(persona_history)
+                # 새 페르소나 저장 + 최신 포인터 갱신
+                await record_persona(db, user_id, persona_data, "ritual_update", datetime.utcnow().date())
                 persona_updated = True
         
         # 28일 완주 처리
@@ -564,7 +605,9 @@ async def create_ritual(
         if new_sequence == 28:
             completion_message = "축하합니다! 28일의 여정을 완주하셨습니다! 당신의 성장 일기가 생성되었습니다."
         
+        await bump_data_version(db, user_id)
         await db.commit()
+        invalidate_user_data(user_id)
         
         return RitualResponse(
             status="success",
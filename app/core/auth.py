@@ -1,15 +1,91 @@
 """
 인증 관련 유틸리티 및 미들웨어
 """
-from typing import Optional
-from datetime import datetime
-from fastapi import Depends, HTTPException, Cookie, status
+import hmac
+import os
+from typing import Optional, Tuple
+from datetime import datetime, timezone
+from fastapi import Depends, HTTPException, Cookie, Header, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.core.database import get_db
 from app.models.user import User, UserSession
 
 
+# 세션 ID → (만료 시각, 사용자 스냅샷)
+# 로그아웃한 워커에서는 즉시 제거되고, 다른 워커는 TTL(몇 초) 이후 DB 기준으로 다시 확인하므로
+# 멀티 워커에서 로그아웃된 세션이 통과하는 시간을 짧게 유지합니다.
+_session_user_cache = TTLCache(
+    maxsize=int(os.getenv("AUTH_SESSION_CACHE_SIZE", "10000")),
+    ttl=float(os.getenv("AUTH_SESSION_CACHE_TTL", "5"))
+)
+
+_USER_SNAPSHOT_COLUMNS = (
+    User.id,
+    User.social_provider,
+    User.social_id,
+    User.email,
+    User.nickname,
+    User.created_at,
+)
+
+# 세션은 유효하지만 사용자가 없는 경우
+_USER_NOT_FOUND = object()
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+async def _resolve_session_user(session_id: str, db: AsyncSession):
+    """
+    세션 ID로 사용자 조회 (캐시 미스 시 세션+사용자 JOIN 한 번)
+    
+    Returns:
+        User(세션에 바인딩되지 않은 스냅샷), 세션이 없거나 만료되면 None,
+        사용자가 없으면 _USER_NOT_FOUND
+    """
+    cached: Optional[Tuple[datetime, dict]] = _session_user_cache.get(session_id)
+    if cached is not None:
+        expires_at, snapshot = cached
+        if expires_at > datetime.now(timezone.utc):
+            return User(**snapshot)
+        _session_user_cache.pop(session_id)
+        return None
+    
+    result = await db.execute(build_session_user_query(session_id))
+    row = result.one_or_none()
+    
+    if row is None:
+        return None
+    if row.id is None:
+        return _USER_NOT_FOUND
+    
+    snapshot = {column.key: getattr(row, column.key) for column in _USER_SNAPSHOT_COLUMNS}
+    _session_user_cache.set(session_id, (_as_utc(row.expires_at), snapshot))
+    return User(**snapshot)
+
+
+def build_session_user_query(session_id: str):
+    """유효한 세션과 사용자 컬럼을 함께 조회하는 쿼리"""
+    return (
+        select(UserSession.expires_at, *_USER_SNAPSHOT_COLUMNS)
+        .outerjoin(User, User.id == UserSession.user_id)
+        .where(
+            UserSession.session_id == session_id,
+            UserSession.expires_at > datetime.utcnow()
+        )
+    )
+
+
+def invalidate_session_cache(session_id: Optional[str]) -> None:
+    """로그아웃 등으로 세션이 삭제되었을 때 캐시 제거"""
+    if session_id:
+        _session_user_cache.pop(session_id)
+
+
 async def get_current_user(
     session_id: Optional[str] = Cookie(None, alias="meari_session"),
     db: AsyncSession = Depends(get_db)
@@ -34,27 +110,17 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Cookie"},
         )
     
-    # 세션 조회
-    stmt = select(UserSession).where(
-        UserSession.session_id == session_id,
-        UserSession.expires_at > datetime.utcnow()
-    )
-    result = await db.execute(stmt)
-    user_session = result.scalar_one_or_none()
+    # 세션 + 사용자 조회
+    user = await _resolve_session_user(session_id, db)
     
-    if not user_session:
+    if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="세션이 만료되었거나 유효하지 않습니다",
             headers={"WWW-Authenticate": "Cookie"},
         )
     
-    # 사용자 조회
-    stmt = select(User).where(User.id == user_session.user_id)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
-    
-    if not user:
+    if user is _USER_NOT_FOUND:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="사용자를 찾을 수 없습니다",
@@ -81,22 +147,26 @@ async def get_optional_user(
         return None
     
     try:
-        # 세션 조회
-        stmt = select(UserSession).where(
-            UserSession.session_id == session_id,
-            UserSession.expires_at > datetime.utcnow()
-        )
-        result = await db.execute(stmt)
-        user_session = result.scalar_one_or_none()
+        # 세션 + 사용자 조회
+        user = await _resolve_session_user(session_id, db)
         
-        if not user_session:
-            return None
-        
-        # 사용자 조회
-        stmt = select(User).where(User.id == user_session.user_id)
-        result = await db.execute(stmt)
-        user = result.scalar_one_or_none()
-        
-        return user
+        return None if user is _USER_NOT_FOUND else user
     except Exception:
-        return None
\ No newline at end of file
+        return None
+
+
+async def require_metrics_token(
+    x_metrics_token: Optional[str] = Header(None)
+) -> None:
+    """
+    운영 지표 엔드포인트 보호 (X-Metrics-Token 헤더가 METRICS_TOKEN과 같아야 함)
+
+    METRICS_TOKEN이 설정되지 않았으면 엔드포인트가 없는 것처럼 404로 응답합니다.
+    """
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not x_metrics_token or not hmac.compare_digest(x_metrics_token, settings.METRICS_TOKEN):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="지표 조회 권한이 없습니다"
+        )
@@ -0,0 +1,79 @@
+"""
+프로세스 내 TTL 캐시
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+_MISSING = object()
+
+
+class TTLCache:
+    """크기 제한이 있는 스레드 세이프 TTL 캐시 (초과 시 가장 오래 안 쓴 항목부터 제거)"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """만료되지 않은 값 반환 (없으면 default)"""
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                return default
+
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """값 저장"""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """값 제거 후 반환"""
+        with self._lock:
+            item = self._data.pop(key, _MISSING)
+        return default if item is _MISSING else item[1]
+
+    def clear(self) -> None:
+        """전체 비우기"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# 사용자별 대시보드 응답 캐시 (쓰기 경로에서 invalidate_user_data 호출)
+# 무효화는 쓰기가 일어난 워커에만 적용되므로 다른 워커의 오래된 응답은 TTL(몇 초) 안에 사라지게 함
+dashboard_cache = TTLCache(
+    maxsize=int(os.getenv("DASHBOARD_CACHE_SIZE", "10000")),
+    ttl=float(os.getenv("DASHBOARD_CACHE_TTL", "5"))
+)
+
+# 사용자별 데이터 버전 (ETag 생성용, 다른 워커의 쓰기는 TTL 이후 DB에서 다시 읽음)
+data_version_cache = TTLCache(
+    maxsize=int(os.getenv("DATA_VERSION_CACHE_SIZE", "10000")),
+    ttl=float(os.getenv("DATA_VERSION_CACHE_TTL", "5"))
+)
+
+
+def invalidate_user_data(user_id: Hashable) -> None:
+    """사용자 데이터(리츄얼/마음나무/연속 기록/페르소나)가 바뀐 뒤 커밋 후 호출"""
+    dashboard_cache.pop(user_id)
+    data_version_cache.pop(user_id)
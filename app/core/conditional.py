@@ -0,0 +1,89 @@
+"""
+HTTP 조건부 요청 (ETag / 304) 유틸리티
+사용자별 데이터 버전(users.data_version)으로 ETag를 만들고,
+무거운 조회 전에 If-None-Match를 비교해 304로 응답합니다.
+과거 날짜도 수정할 수 있으므로 모든 응답은 max-age 없이 매번 재검증(no-cache)합니다.
+"""
+from uuid import UUID
+from fastapi import Request, Response, status
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import data_version_cache
+from app.models.user import User
+
+CACHE_CONTROL_REVALIDATE = "private, no-cache"
+
+
+async def get_data_version(db: AsyncSession, user_id: UUID) -> int:
+    """사용자 데이터 버전 (캐시 미스 시에만 PK 조회)"""
+    version = data_version_cache.get(user_id)
+    if version is not None:
+        return version
+
+    result = await db.execute(select(User.data_version).where(User.id == user_id))
+    version = result.scalar() or 0
+    data_version_cache.set(user_id, version)
+    return version
+
+
+async def bump_data_version(db: AsyncSession, user_id: UUID) -> None:
+    """
+    쓰기 트랜잭션 안에서 데이터 버전 증가 (커밋은 호출자가 수행)
+    커밋 후에는 invalidate_user_data로 프로세스 캐시를 비워야 합니다.
+    """
+    await db.execute(
+        update(User).where(User.id == user_id).values(data_version=User.data_version + 1)
+    )
+
+
+class ConditionalCheck:
+    """한 요청의 ETag/Cache-Control 계산 결과"""
+
+    def __init__(self, etag: str, cache_control: str):
+        self.etag = etag
+        self.cache_control = cache_control
+
+    def matches(self, request: Request) -> bool:
+        """If-None-Match가 현재 ETag와 같은지 (약한 비교)"""
+        header = request.headers.get("if-none-match")
+        if not header:
+            return False
+        current = _strip_weak(self.etag)
+        return any(
+            tag == "*" or _strip_weak(tag) == current
+            for tag in (t.strip() for t in header.split(","))
+        )
+
+    def not_modified(self) -> Response:
+        """본문 없는 304 응답"""
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=self.headers())
+
+    def apply(self, response: Response) -> None:
+        """정상 응답에 ETag/Cache-Control 헤더 설정"""
+        response.headers.update(self.headers())
+
+    def headers(self) -> dict:
+        return {"ETag": self.etag, "Cache-Control": self.cache_control}
+
+
+def _strip_weak(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+async def conditional_check(
+    db: AsyncSession,
+    user_id: UUID,
+    *parts: object
+) -> ConditionalCheck:
+    """
+    ETag 계산 (사용자 데이터 버전 + 추가 구분값)
+
+    Args:
+        db: 데이터베이스 세션
+        user_id: 사용자 ID
+        parts: 응답이 버전 외에 의존하는 값 (예: 오늘 날짜)
+    """
+    version = await get_data_version(db, user_id)
+    etag = 'W/"' + "-".join(str(part) for part in (version, *parts)) + '"'
+    return ConditionalCheck(etag, CACHE_CONTROL_REVALIDATE)
@@ -10,9 +10,39 @@ class Settings(BaseSettings):
     
     # Database - Render가 제공하는 DATABASE_URL 사용
     DATABASE_URL: Optional[str] = Field(default=os.getenv("DATABASE_URL"))
+    DB_ECHO: bool = False  # True면 모든 SQL을 로그로 출력
+    DB_POOL_SIZE: int = 10  # 프로세스(워커)별 값, gunicorn에서는 DB_CONNECTIONS_PER_INSTANCE / 워커 수로 기본 설정
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # 커넥션 대기 최대 시간(초)
+    DB_POOL_RECYCLE: int = 1800  # 커넥션 재생성 주기(초)
+    DB_POOL_PRE_PING: bool = True
+    SLOW_QUERY_MS: float = 200.0  # 이 시간 이상 걸린 쿼리는 경고 로그
+    
+    # Response compression
+    COMPRESSION_MIN_SIZE: int = 1024  # 이 크기(바이트) 이상 응답만 압축
+    BROTLI_QUALITY: int = 4  # 0~11, 높을수록 느리고 작음
+    
+    # Background jobs (비동기 워크플로우)
+    JOB_QUEUE_BACKEND: str = "postgres"
+    JOB_WORKERS: int = 2  # 이 프로세스에서 돌릴 워커 수 (0이면 API만, 워커는 별도 프로세스, gunicorn 기본 0)
+    JOB_POLL_INTERVAL: float = 1.0  # 대기 작업이 없을 때 재확인 간격(초)
+    JOB_HEARTBEAT_INTERVAL: float = 15.0  # 실행 중 작업 생존 신호 간격(초)
+    JOB_STALE_SECONDS: float = 120.0  # 이 시간 동안 생존 신호가 없으면 워커가 죽은 것으로 보고 회수
+    # 워커 중단 시 재실행 포함 최대 실행 횟수
+    # 핸들러가 중간 커밋 후 죽으면 재실행 시 세션/카드가 중복 저장되므로 기본은 재실행 없음
+    JOB_MAX_ATTEMPTS: int = 1
+    
+    # Execution lanes (CPU 작업과 블로킹 I/O 분리)
+    # thread: 전용 스레드 (fork 전에 올린 모델을 공유)
+    # process: spawn한 워커 프로세스가 각자 모델을 로드하므로 gunicorn preload의 공유가 사라지고
+    #          모델 메모리가 (gunicorn 워커 수 x CPU_EXECUTOR_WORKERS)만큼 늘어남. GIL 격리가 꼭 필요할 때만 사용
+    CPU_EXECUTOR_MODE: str = "thread"
+    CPU_EXECUTOR_WORKERS: int = 1
+    IO_EXECUTOR_WORKERS: int = 32
     
     # Security
     SECRET_KEY: str = Field(default=os.getenv("SECRET_KEY", "dev-secret-key"))
+    METRICS_TOKEN: Optional[str] = Field(default=os.getenv("METRICS_TOKEN"))  # /metrics 조회용 공유 비밀 (X-Metrics-Token), 없으면 비활성
     
     # BigKinds API
     BIGKINDS_ACCESS_KEY: Optional[str] = Field(default=os.getenv("BIGKINDS_ACCESS_KEY"))
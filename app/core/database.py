@@ -1,18 +1,74 @@
+import logging
+import time
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
+from app.core.metrics import metrics, current_endpoint
+
+logger = logging.getLogger(__name__)
 
 # DATABASE_URL 변환 (Railway용)
 database_url = str(settings.DATABASE_URL)
 if database_url.startswith("postgresql://"):
     database_url = database_url.replace("postgresql://", "postgresql+asyncpg://")
 
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """커넥션 체크아웃 대기시간을 기록하는 풀"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            metrics.increment("db.pool.timeout", current_endpoint.get())
+            raise
+        finally:
+            metrics.observe("db.pool.checkout_wait", (time.perf_counter() - started) * 1000)
+
+
 # Async engine 생성
 engine = create_async_engine(
     database_url,
-    echo=settings.DEBUG,
+    echo=settings.DB_ECHO,
+    poolclass=TimedAsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
 )
 
+
+# 쿼리 지연시간 추적 (에이전트의 동기 엔진 포함 모든 엔진에 적용)
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started"].pop()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    endpoint = current_endpoint.get()
+    metrics.observe("db.query", elapsed_ms, endpoint)
+
+    if elapsed_ms >= settings.SLOW_QUERY_MS:
+        metrics.increment("db.slow_query", endpoint)
+        logger.warning(f"느린 쿼리 {elapsed_ms:.1f}ms [{endpoint}]: {' '.join(statement.split())[:500]}")
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started"):
+        conn.info["query_started"].pop()
+
+
 AsyncSessionLocal = sessionmaker(
     engine,
     class_=AsyncSession,
@@ -30,4 +86,15 @@ async def get_db():
         try:
             yield session
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
+
+
+def get_pool_status() -> dict:
+    """커넥션 풀 현재 상태"""
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "checked_in": pool.checkedin(),
+    }
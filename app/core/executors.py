@@ -0,0 +1,208 @@
+"""
+CPU/I/O 실행 레인
+블로킹 네트워크 I/O(LLM 호출, Milvus 검색)와 CPU 작업(임베딩 추론)을 서로 다른 풀에서 실행해
+임베딩이 I/O 스레드와 GIL을 두고 경쟁하며 관계없는 요청의 지연시간을 늘리지 않게 합니다.
+
+- I/O 레인: 스레드 풀 (이벤트 루프 기본 executor로도 설치)
+- CPU 레인: CPU_EXECUTOR_MODE=thread면 전용 스레드, process면 모델을 미리 로드한 워커 프로세스
+각 레인의 대기열 길이와 사용률은 /metrics의 executors 항목으로 확인합니다.
+"""
+import asyncio
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CPU_THREAD_PREFIX = "cpu-lane"
+
+
+def _run_timed(func: Callable[..., T], args: Tuple[Any, ...]) -> Tuple[float, float, bool, Any]:
+    """실행 시작/종료 시각과 결과를 함께 반환 (프로세스 풀에서도 쓰도록 모듈 함수)"""
+    started = time.time()
+    try:
+        value, ok = func(*args), True
+    except Exception as e:
+        value, ok = e, False
+    return started, time.time(), ok, value
+
+
+def _warm_cpu_worker() -> None:
+    """CPU 워커 프로세스 초기화: 첫 요청 전에 임베딩 모델 로드"""
+    from app.services.data.embedding_service import get_embedding_model
+    try:
+        get_embedding_model()
+    except Exception as e:
+        logger.warning(f"CPU 워커 임베딩 모델 로드 실패: {e}")
+
+
+def _ping() -> int:
+    return multiprocessing.current_process().pid
+
+
+class ExecutionLane:
+    """executor 하나와 그 대기열/사용률 지표"""
+
+    def __init__(self, name: str, executor: Executor, workers: int, mode: str):
+        self.name = name
+        self.executor = executor
+        self.workers = workers
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._busy_seconds = 0.0
+        self._created_at = time.time()
+
+    def submit(self, func: Callable[..., T], *args: Any) -> "Future[T]":
+        """작업 제출 (완료되면 대기/실행 시간 기록)"""
+        submitted = time.time()
+        with self._lock:
+            self._in_flight += 1
+
+        inner = self.executor.submit(_run_timed, func, args)
+        outer: "Future[T]" = Future()
+        # 실행 중 상태로 두어 대기 쪽 취소(wrap_future)가 outer를 취소하지 못하게 함
+        # (취소된 future에 결과를 넣으면 콜백에서 InvalidStateError가 남)
+        outer.set_running_or_notify_cancel()
+
+        def done(future: Future) -> None:
+            with self._lock:
+                self._in_flight -= 1
+                self._completed += 1
+            try:
+                started, finished, ok, value = future.result()
+            except BaseException as e:  # 풀 종료, 워커 프로세스 비정상 종료 등
+                outer.set_exception(e)
+                return
+
+            with self._lock:
+                self._busy_seconds += finished - started
+            metrics.observe("executor.queue_wait", max(started - submitted, 0.0) * 1000, self.name)
+            metrics.observe("executor.run", (finished - started) * 1000, self.name)
+            if ok:
+                outer.set_result(value)
+            else:
+                outer.set_exception(value)
+
+        inner.add_done_callback(done)
+        return outer
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            in_flight = self._in_flight
+            busy = self._busy_seconds
+            completed = self._completed
+        elapsed = max(time.time() - self._created_at, 1e-9)
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "in_flight": in_flight,
+            "queue_depth": max(in_flight - self.workers, 0),
+            "utilization": round(min(in_flight, self.workers) / self.workers, 3),
+            "avg_utilization": round(min(busy / (elapsed * self.workers), 1.0), 3),
+            "completed": completed,
+        }
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+_cpu_lane: Optional[ExecutionLane] = None
+_io_lane: Optional[ExecutionLane] = None
+_lanes_lock = threading.Lock()
+
+
+def _create_cpu_lane() -> ExecutionLane:
+    workers = max(settings.CPU_EXECUTOR_WORKERS, 1)
+    if settings.CPU_EXECUTOR_MODE == "process":
+        # 스레드가 있는 프로세스를 fork하지 않도록 spawn으로 새 인터프리터 시작
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_cpu_worker
+        )
+    elif settings.CPU_EXECUTOR_MODE == "thread":
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=CPU_THREAD_PREFIX)
+    else:
+        raise ValueError(f"알 수 없는 CPU_EXECUTOR_MODE: {settings.CPU_EXECUTOR_MODE}")
+    return ExecutionLane("cpu", executor, workers, settings.CPU_EXECUTOR_MODE)
+
+
+def get_cpu_lane() -> ExecutionLane:
+    global _cpu_lane
+    if _cpu_lane is None:
+        with _lanes_lock:
+            if _cpu_lane is None:
+                _cpu_lane = _create_cpu_lane()
+    return _cpu_lane
+
+
+def get_io_lane() -> ExecutionLane:
+    global _io_lane
+    if _io_lane is None:
+        with _lanes_lock:
+            if _io_lane is None:
+                workers = max(settings.IO_EXECUTOR_WORKERS, 1)
+                executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="io-lane")
+                _io_lane = ExecutionLane("io", executor, workers, "thread")
+    return _io_lane
+
+
+async def run_cpu(func: Callable[..., T], *args: Any) -> T:
+    """CPU 작업을 CPU 레인에서 실행 (process 모드면 func/args는 pickle 가능해야 함)"""
+    return await asyncio.wrap_future(get_cpu_lane().submit(func, *args))
+
+
+async def run_io(func: Callable[..., T], *args: Any) -> T:
+    """블로킹 I/O 함수를 I/O 레인에서 실행"""
+    return await asyncio.wrap_future(get_io_lane().submit(func, *args))
+
+
+def cpu_call(func: Callable[..., T], *args: Any) -> T:
+    """
+    동기 코드(I/O 스레드 등)에서 CPU 레인으로 넘겨 결과를 기다림
+
+    이미 CPU 레인 스레드 안이면 바로 실행합니다 (레인 스레드가 자기 자신을 기다리는 교착 방지).
+    """
+    if threading.current_thread().name.startswith(CPU_THREAD_PREFIX):
+        return func(*args)
+    return get_cpu_lane().submit(func, *args).result()
+
+
+async def start_executors() -> None:
+    """
+    앱 시작 시 (gunicorn이면 fork 이후 워커마다) 레인 생성
+
+    I/O 레인을 이벤트 루프 기본 executor로 설치해 run_in_executor(None, ...)도 같은 풀을 쓰게 하고,
+    process 모드면 워커 프로세스를 미리 띄워 모델 로드를 첫 요청 전에 끝냅니다.
+    """
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(get_io_lane().executor)
+
+    cpu_lane = get_cpu_lane()
+    if cpu_lane.mode == "process":
+        pids = await asyncio.gather(*(run_cpu(_ping) for _ in range(cpu_lane.workers)))
+        logger.info(f"CPU 워커 프로세스 준비 완료: {sorted(set(pids))}")
+
+
+def shutdown_executors() -> None:
+    global _cpu_lane, _io_lane
+    with _lanes_lock:
+        for lane in (_cpu_lane, _io_lane):
+            if lane is not None:
+                lane.shutdown()
+        _cpu_lane = _io_lane = None
+
+
+def get_executor_status() -> Dict[str, Any]:
+    """레인별 현재 상태 (아직 만들어지지 않은 레인은 생략)"""
+    return {lane.name: lane.status() for lane in (_cpu_lane, _io_lane) if lane is not None}
@@ -0,0 +1,281 @@
+"""
+비싼 POST 엔드포인트의 멱등성 처리
+- Idempotency-Key 헤더: 같은 키의 완료된 응답을 TTL 동안 그대로 재전송 (Location 등 헤더 포함)
+- 동시에 들어온 같은 요청은 먼저 실행 중인 요청 결과를 기다림 (single-flight)
+- 헤더가 없으면 (사용자, 경로, 본문 해시)가 같은 요청을 몇 초 동안 하나로 합침
+
+키 선점과 완료 응답은 idempotency_keys 테이블에 두고 INSERT ... ON CONFLICT로 선점하므로
+다른 워커/노드로 들어온 중복도 한 번만 실행됩니다. 선점하지 못한 요청은 완료될 때까지 폴링하고,
+같은 프로세스 안의 중복은 DB를 거치지 않고 실행 중인 future를 바로 기다립니다.
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from datetime import timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.auth import get_current_user
+from app.core.database import AsyncSessionLocal
+from app.models.idempotency import IdempotencyKey
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+KEY_PROCESSING = "processing"
+KEY_COMPLETED = "completed"
+
+# Idempotency-Key로 식별된 완료 응답 보관 시간(초)
+IDEMPOTENCY_TTL = float(os.getenv("IDEMPOTENCY_TTL", "600"))
+# 헤더 없는 동일 본문 요청을 합치는 시간(초)
+IDEMPOTENCY_COALESCE_TTL = float(os.getenv("IDEMPOTENCY_COALESCE_TTL", "5"))
+# 처리 중 선점 유효 시간(초): 원 요청 워커가 죽으면 이 시간 뒤 재시도가 다시 선점
+IDEMPOTENCY_LOCK_TTL = float(os.getenv("IDEMPOTENCY_LOCK_TTL", "900"))
+# 다른 워커가 처리 중인 요청을 기다릴 때 폴링 간격/최대 대기(초)
+IDEMPOTENCY_POLL_INTERVAL = float(os.getenv("IDEMPOTENCY_POLL_INTERVAL", "0.25"))
+IDEMPOTENCY_WAIT_TIMEOUT = float(os.getenv("IDEMPOTENCY_WAIT_TIMEOUT", "300"))
+
+# 재전송 시 응답 객체가 다시 만드는 헤더
+_REBUILT_HEADERS = frozenset({"content-length", "content-type"})
+
+LocalKey = Tuple[UUID, str, str]
+_inflight: Dict[LocalKey, Tuple[str, "asyncio.Future[StoredResponse]"]] = {}
+
+
+class StoredResponse:
+    """재전송용으로 보관한 응답 (본문 바이트와 헤더 그대로)"""
+
+    def __init__(
+        self,
+        fingerprint: str,
+        status_code: int,
+        body: bytes,
+        media_type: Optional[str],
+        headers: List[List[str]]
+    ):
+        self.fingerprint = fingerprint
+        self.status_code = status_code
+        self.body = body
+        self.media_type = media_type
+        self.headers = headers
+
+    @classmethod
+    def from_response(cls, fingerprint: str, response: Response) -> "StoredResponse":
+        headers = [
+            [name.decode("latin-1"), value.decode("latin-1")]
+            for name, value in response.raw_headers
+            if name.decode("latin-1").lower() not in _REBUILT_HEADERS
+        ]
+        return cls(fingerprint, response.status_code, bytes(response.body), response.media_type, headers)
+
+    @classmethod
+    def from_row(cls, row: IdempotencyKey) -> "StoredResponse":
+        return cls(row.fingerprint, row.status_code, row.body, row.media_type, row.headers or [])
+
+    def replay(self) -> Response:
+        response = Response(
+            content=self.body,
+            status_code=self.status_code,
+            media_type=self.media_type
+        )
+        for name, value in self.headers:
+            response.headers.append(name, value)
+        response.headers[REPLAYED_HEADER] = "true"
+        return response
+
+
+class Idempotency:
+    """한 요청의 멱등성 키와 본문 지문"""
+
+    def __init__(self, user_id: UUID, scope: str, key: str, fingerprint: str, ttl: float):
+        self.user_id = user_id
+        self.scope = scope
+        self.key = key
+        self.fingerprint = fingerprint
+        self.ttl = ttl
+        self._row_id: Optional[int] = None
+
+    @property
+    def local_key(self) -> LocalKey:
+        return (self.user_id, self.scope, self.key)
+
+    async def run(self, handler: Callable[[], Awaitable[Response]]) -> Response:
+        """
+        handler를 한 번만 실행하고, 중복 요청에는 같은 응답을 돌려줌
+
+        2xx 응답만 저장하며, 실패(HTTPException 등)는 같은 프로세스에서 기다리던
+        중복 요청에만 전달되고 선점이 해제되어 이후 재시도는 다시 실행됩니다.
+        """
+        inflight = _inflight.get(self.local_key)
+        if inflight is not None:
+            fingerprint, future = inflight
+            self._check_fingerprint(fingerprint)
+            # 대기 중인 요청이 취소돼도 공유 future는 취소되지 않도록 shield
+            return (await asyncio.shield(future)).replay()
+
+        future: "asyncio.Future[StoredResponse]" = asyncio.get_running_loop().create_future()
+        _inflight[self.local_key] = (self.fingerprint, future)
+        try:
+            response, stored = await self._run_once(handler)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        except BaseException:
+            # 원 요청이 취소되면(클라이언트 연결 끊김 등) 대기 중인 요청은 재시도하도록 안내
+            future.set_exception(_interrupted())
+            raise
+        else:
+            future.set_result(stored)
+            return response
+        finally:
+            _inflight.pop(self.local_key, None)
+            # 대기자가 없을 때 예외를 꺼내가지 않아 생기는 경고 방지
+            if future.done() and not future.cancelled():
+                future.exception()
+
+    async def _run_once(self, handler: Callable[[], Awaitable[Response]]) -> Tuple[Response, StoredResponse]:
+        """DB에서 키를 선점했으면 실행해 저장하고, 못 했으면 다른 워커의 결과를 기다림"""
+        if not await self._claim():
+            stored = await self._wait_for_result()
+            return stored.replay(), stored
+
+        try:
+            response = await handler()
+        except BaseException:
+            await asyncio.shield(self._release())
+            raise
+
+        stored = StoredResponse.from_response(self.fingerprint, response)
+        if 200 <= response.status_code < 300:
+            await self._save(stored)
+        else:
+            await self._release()
+        return response, stored
+
+    async def _claim(self) -> bool:
+        """키 선점 (만료된 이전 행은 같은 트랜잭션에서 정리 후 다시 선점 가능)"""
+        stmt = pg_insert(IdempotencyKey).values(
+            user_id=self.user_id,
+            scope=self.scope,
+            key=self.key,
+            fingerprint=self.fingerprint,
+            status=KEY_PROCESSING,
+            expires_at=func.now() + timedelta(seconds=IDEMPOTENCY_LOCK_TTL)
+        ).on_conflict_do_nothing(
+            constraint="_user_scope_idempotency_key_uc"
+        ).returning(IdempotencyKey.id)
+
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                delete(IdempotencyKey).where(
+                    IdempotencyKey.user_id == self.user_id,
+                    IdempotencyKey.expires_at < func.now()
+                )
+            )
+            self._row_id = (await db.execute(stmt)).scalar_one_or_none()
+            await db.commit()
+        return self._row_id is not None
+
+    async def _wait_for_result(self) -> StoredResponse:
+        """다른 워커가 선점한 요청이 끝날 때까지 폴링"""
+        deadline = time.monotonic() + IDEMPOTENCY_WAIT_TIMEOUT
+        while True:
+            async with AsyncSessionLocal() as db:
+                row = (await db.execute(
+                    select(IdempotencyKey).where(
+                        IdempotencyKey.user_id == self.user_id,
+                        IdempotencyKey.scope == self.scope,
+                        IdempotencyKey.key == self.key,
+                        IdempotencyKey.expires_at > func.now()
+                    )
+                )).scalar_one_or_none()
+
+            if row is None:
+                # 원 요청이 실패/중단되어 선점이 해제됨
+                raise _interrupted()
+            self._check_fingerprint(row.fingerprint)
+            if row.status == KEY_COMPLETED:
+                return StoredResponse.from_row(row)
+            if time.monotonic() >= deadline:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="같은 요청이 아직 처리 중입니다. 잠시 후 다시 시도해주세요"
+                )
+            await asyncio.sleep(IDEMPOTENCY_POLL_INTERVAL)
+
+    async def _save(self, stored: StoredResponse) -> None:
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(IdempotencyKey)
+                .where(IdempotencyKey.id == self._row_id)
+                .values(
+                    status=KEY_COMPLETED,
+                    status_code=stored.status_code,
+                    body=stored.body,
+                    media_type=stored.media_type,
+                    headers=stored.headers,
+                    expires_at=func.now() + timedelta(seconds=self.ttl)
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+
+    async def _release(self) -> None:
+        """선점 해제 (실패해도 선점 만료 후에는 다시 실행 가능)"""
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(delete(IdempotencyKey).where(IdempotencyKey.id == self._row_id))
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"멱등성 키 선점 해제 실패 ({self.scope}): {e}")
+
+    def _check_fingerprint(self, fingerprint: str) -> None:
+        if fingerprint != self.fingerprint:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"같은 {IDEMPOTENCY_HEADER}가 다른 요청 본문으로 사용되었습니다"
+            )
+
+
+def _interrupted() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="같은 요청의 처리가 중단되었습니다. 다시 시도해주세요"
+    )
+
+
+async def idempotency(
+    request: Request,
+    current_user: User = Depends(get_current_user)
+) -> Idempotency:
+    """
+    멱등성 의존성 (엔드포인트에서 `await idem.run(handler)`로 사용)
+
+    키는 사용자와 경로(쿼리 포함) 범위 안에서만 유효합니다.
+    """
+    body = await request.body()
+    fingerprint = hashlib.sha256(body).hexdigest()
+    scope = request.url.path
+    if request.url.query:
+        scope = f"{scope}?{request.url.query}"
+
+    header_key = request.headers.get(IDEMPOTENCY_HEADER)
+    if header_key is not None:
+        header_key = header_key.strip()
+        if not header_key or len(header_key) > MAX_KEY_LENGTH:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{IDEMPOTENCY_HEADER}는 1~{MAX_KEY_LENGTH}자여야 합니다"
+            )
+        return Idempotency(current_user.id, scope, f"key:{header_key}", fingerprint, IDEMPOTENCY_TTL)
+
+    return Idempotency(current_user.id, scope, f"body:{fingerprint}", fingerprint, IDEMPOTENCY_COALESCE_TTL)
@@ -0,0 +1,225 @@
+"""
+비동기 워크플로우 작업 큐
+API는 작업을 넣고 바로 응답하고, 워커 풀(app.core.job_worker)이 꺼내 실행합니다.
+백엔드는 JOB_QUEUE_BACKEND 설정으로 선택하며, 기본 Postgres 구현은
+FOR UPDATE SKIP LOCKED로 여러 워커/노드가 같은 작업을 중복 선점하지 않게 합니다.
+"""
+import asyncio
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from typing import Any, Callable, Dict, Optional
+from uuid import UUID
+from sqlalchemy import Select, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.job import WorkflowJob
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+TERMINAL_STATUSES = frozenset({JOB_SUCCEEDED, JOB_FAILED})
+
+
+class JobQueue(ABC):
+    """작업 큐 인터페이스 (반환되는 WorkflowJob은 세션에서 분리된 스냅샷)"""
+
+    def __init__(self):
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @property
+    def wakeup(self) -> asyncio.Event:
+        """같은 프로세스의 워커를 바로 깨우는 이벤트 (다른 노드는 폴링으로 확인)"""
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        return self._wakeup
+
+    @abstractmethod
+    async def enqueue(self, job_type: str, user_id: UUID, payload: Dict[str, Any]) -> WorkflowJob:
+        """작업 추가"""
+
+    @abstractmethod
+    async def claim(self, worker_id: str) -> Optional[WorkflowJob]:
+        """실행할 작업 하나 선점 (없으면 None)"""
+
+    @abstractmethod
+    async def heartbeat(self, job_id: UUID, stage: Optional[str] = None) -> None:
+        """실행 중 생존 신호 (stage가 있으면 진행 단계도 갱신)"""
+
+    @abstractmethod
+    async def complete(self, job_id: UUID, result: Dict[str, Any]) -> None:
+        """성공 처리"""
+
+    @abstractmethod
+    async def fail(self, job_id: UUID, error: str) -> None:
+        """실패 처리"""
+
+    @abstractmethod
+    async def release(self, job_id: UUID) -> None:
+        """워커 종료로 끝내지 못한 작업을 다시 대기 상태로"""
+
+    @abstractmethod
+    async def reap_stale(self) -> int:
+        """생존 신호가 끊겼고 재시도 횟수도 다 쓴 작업을 실패 처리 (처리 건수 반환)"""
+
+    @abstractmethod
+    async def get(self, job_id: UUID) -> Optional[WorkflowJob]:
+        """작업 조회"""
+
+
+class PostgresJobQueue(JobQueue):
+    """workflow_jobs 테이블 기반 큐 (작업마다 짧은 트랜잭션 하나)"""
+
+    def _stale_before(self):
+        return func.now() - timedelta(seconds=settings.JOB_STALE_SECONDS)
+
+    async def enqueue(self, job_type: str, user_id: UUID, payload: Dict[str, Any]) -> WorkflowJob:
+        job = WorkflowJob(
+            user_id=user_id,
+            job_type=job_type,
+            status=JOB_QUEUED,
+            payload=payload,
+            max_attempts=settings.JOB_MAX_ATTEMPTS
+        )
+        async with AsyncSessionLocal() as db:
+            db.add(job)
+            await db.commit()
+            await db.refresh(job)
+        self.wakeup.set()
+        return job
+
+    async def claim(self, worker_id: str) -> Optional[WorkflowJob]:
+        # 대기 작업을 먼저, 없으면 워커가 죽어 생존 신호가 끊긴 작업 (재시도 횟수 남은 것만)
+        # 조건을 OR로 합치면 두 부분 인덱스를 모두 못 쓰므로 상태별로 따로 선점
+        queued = (
+            select(WorkflowJob.id)
+            .where(
+                WorkflowJob.status == JOB_QUEUED,
+                WorkflowJob.attempts < WorkflowJob.max_attempts
+            )
+            .order_by(WorkflowJob.created_at)
+        )
+        stale = (
+            select(WorkflowJob.id)
+            .where(
+                WorkflowJob.status == JOB_RUNNING,
+                WorkflowJob.heartbeat_at < self._stale_before(),
+                WorkflowJob.attempts < WorkflowJob.max_attempts
+            )
+            .order_by(WorkflowJob.heartbeat_at)
+        )
+        async with AsyncSessionLocal() as db:
+            job = await self._claim_first(db, queued, worker_id)
+            if job is None:
+                job = await self._claim_first(db, stale, worker_id)
+            await db.commit()
+        return job
+
+    async def _claim_first(self, db: AsyncSession, candidates: Select, worker_id: str) -> Optional[WorkflowJob]:
+        """후보 중 잠기지 않은 첫 작업을 실행 상태로 전환"""
+        candidate = candidates.limit(1).with_for_update(skip_locked=True).scalar_subquery()
+        stmt = (
+            update(WorkflowJob)
+            .where(WorkflowJob.id == candidate)
+            .values(
+                status=JOB_RUNNING,
+                stage=None,
+                attempts=WorkflowJob.attempts + 1,
+                worker_id=worker_id,
+                heartbeat_at=func.now(),
+                started_at=func.coalesce(WorkflowJob.started_at, func.now()),
+                updated_at=func.now()
+            )
+            .returning(WorkflowJob)
+            .execution_options(synchronize_session=False)
+        )
+        return (await db.execute(stmt)).scalar_one_or_none()
+
+    async def heartbeat(self, job_id: UUID, stage: Optional[str] = None) -> None:
+        values = {"heartbeat_at": func.now(), "updated_at": func.now()}
+        if stage is not None:
+            values["stage"] = stage
+        await self._update_running(job_id, **values)
+
+    async def complete(self, job_id: UUID, result: Dict[str, Any]) -> None:
+        await self._update_running(
+            job_id, status=JOB_SUCCEEDED, stage=None, result=result,
+            finished_at=func.now(), updated_at=func.now()
+        )
+
+    async def fail(self, job_id: UUID, error: str) -> None:
+        await self._update_running(
+            job_id, status=JOB_FAILED, error=error,
+            finished_at=func.now(), updated_at=func.now()
+        )
+
+    async def release(self, job_id: UUID) -> None:
+        # 이번 실행은 시도 횟수에서 빼고 다시 대기열로
+        await self._update_running(
+            job_id, status=JOB_QUEUED, stage=None, worker_id=None,
+            attempts=WorkflowJob.attempts - 1, updated_at=func.now()
+        )
+        self.wakeup.set()
+
+    async def reap_stale(self) -> int:
+        stmt = (
+            update(WorkflowJob)
+            .where(
+                WorkflowJob.status == JOB_RUNNING,
+                WorkflowJob.heartbeat_at < self._stale_before(),
+                WorkflowJob.attempts >= WorkflowJob.max_attempts
+            )
+            .values(
+                status=JOB_FAILED,
+                error="워커가 응답하지 않아 작업이 중단되었습니다",
+                finished_at=func.now(),
+                updated_at=func.now()
+            )
+            .execution_options(synchronize_session=False)
+        )
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(stmt)
+            await db.commit()
+        return result.rowcount
+
+    async def get(self, job_id: UUID) -> Optional[WorkflowJob]:
+        async with AsyncSessionLocal() as db:
+            return await db.get(WorkflowJob, job_id)
+
+    async def _update_running(self, job_id: UUID, **values: Any) -> None:
+        """실행 중인 작업만 갱신 (이미 회수되어 끝난 작업은 건드리지 않음)"""
+        stmt = (
+            update(WorkflowJob)
+            .where(WorkflowJob.id == job_id, WorkflowJob.status == JOB_RUNNING)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        async with AsyncSessionLocal() as db:
+            await db.execute(stmt)
+            await db.commit()
+
+
+_BACKENDS: Dict[str, Callable[[], JobQueue]] = {
+    "postgres": PostgresJobQueue,
+}
+
+_queue: Optional[JobQueue] = None
+
+
+def register_job_queue_backend(name: str, factory: Callable[[], JobQueue]) -> None:
+    """큐 백엔드 추가 (JOB_QUEUE_BACKEND 값으로 선택)"""
+    _BACKENDS[name] = factory
+
+
+def get_job_queue() -> JobQueue:
+    """설정된 백엔드의 프로세스 단일 큐"""
+    global _queue
+    if _queue is None:
+        try:
+            factory = _BACKENDS[settings.JOB_QUEUE_BACKEND]
+        except KeyError:
+            raise ValueError(f"알 수 없는 작업 큐 백엔드: {settings.JOB_QUEUE_BACKEND}")
+        _queue = factory()
+    return _queue
@@ -0,0 +1,180 @@
+"""
+작업 큐 워커 풀
+작업 종류별 핸들러를 등록해 두고, 정해진 수의 워커가 큐에서 작업을 꺼내 실행합니다.
+워커 수가 동시에 도는 LLM 파이프라인 수의 상한이 되므로 요청 처리 용량과 분리해
+API 프로세스(JOB_WORKERS) 또는 별도 프로세스(scripts/run_job_worker.py)로 늘릴 수 있습니다.
+"""
+import asyncio
+import logging
+import os
+import socket
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.job_queue import JobQueue, get_job_queue
+from app.core.metrics import metrics, current_endpoint
+from app.models.job import WorkflowJob
+
+logger = logging.getLogger(__name__)
+
+# 진행 단계 보고 (예: await progress("workflow"))
+ProgressCallback = Callable[[str], Awaitable[None]]
+# 핸들러: 전용 DB 세션과 작업을 받아 결과(JSON) 반환, 실패는 예외로
+JobHandler = Callable[[AsyncSession, WorkflowJob, ProgressCallback], Awaitable[Dict[str, Any]]]
+
+_handlers: Dict[str, JobHandler] = {}
+
+# 핸들러가 이 시간 안에 끝나지 않으면 실패 처리
+JOB_TIMEOUT = float(os.getenv("JOB_TIMEOUT", "600"))
+# 회수 불가능한 중단 작업 정리 주기(초)
+REAP_INTERVAL = 60.0
+
+
+def job_handler(job_type: str) -> Callable[[JobHandler], JobHandler]:
+    """작업 종류의 핸들러로 등록하는 데코레이터"""
+    def decorator(func: JobHandler) -> JobHandler:
+        _handlers[job_type] = func
+        return func
+    return decorator
+
+
+class JobWorkerPool:
+    """큐를 폴링하며 작업을 실행하는 asyncio 워커 묶음"""
+
+    def __init__(self, concurrency: int, queue: Optional[JobQueue] = None):
+        self.concurrency = concurrency
+        self.queue = queue or get_job_queue()
+        self.worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+        self._tasks: List[asyncio.Task] = []
+        self._stopping = False
+
+    def start(self) -> None:
+        self._stopping = False
+        self._tasks = [
+            asyncio.create_task(self._worker(f"{self.worker_prefix}:{i}"))
+            for i in range(self.concurrency)
+        ]
+        self._tasks.append(asyncio.create_task(self._reaper()))
+        logger.info(f"작업 워커 {self.concurrency}개 시작 ({self.worker_prefix})")
+
+    async def stop(self) -> None:
+        """워커 중지 (실행 중이던 작업은 대기열로 되돌림)"""
+        self._stopping = True
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def run_forever(self) -> None:
+        """별도 워커 프로세스용: 시작 후 취소될 때까지 대기"""
+        self.start()
+        try:
+            await asyncio.gather(*self._tasks)
+        finally:
+            await self.stop()
+
+    async def _worker(self, worker_id: str) -> None:
+        while not self._stopping:
+            try:
+                job = await self.queue.claim(worker_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"작업 선점 실패 ({worker_id}): {e}")
+                job = None
+
+            if job is None:
+                await self._wait_for_work()
+                continue
+
+            try:
+                await self._run(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 결과 기록 실패 등: 작업은 생존 신호가 끊긴 뒤 회수됨
+                logger.warning(f"작업 상태 기록 실패 {job.id} ({worker_id}): {e}")
+
+    async def _wait_for_work(self) -> None:
+        wakeup = self.queue.wakeup
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout=settings.JOB_POLL_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+        wakeup.clear()
+
+    async def _run(self, job: WorkflowJob) -> None:
+        handler = _handlers.get(job.job_type)
+        if handler is None:
+            await self.queue.fail(job.id, f"등록되지 않은 작업 종류: {job.job_type}")
+            return
+
+        async def progress(stage: str) -> None:
+            await self.queue.heartbeat(job.id, stage)
+
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        token = current_endpoint.set(f"JOB {job.job_type}")
+        started = time.perf_counter()
+        try:
+            async with AsyncSessionLocal() as db:
+                result = await asyncio.wait_for(handler(db, job, progress), timeout=JOB_TIMEOUT)
+        except asyncio.CancelledError:
+            await asyncio.shield(self.queue.release(job.id))
+            raise
+        except asyncio.TimeoutError:
+            metrics.increment("job.failed", job.job_type)
+            await self.queue.fail(job.id, f"작업 시간 초과 ({JOB_TIMEOUT:.0f}초)")
+        except HTTPException as e:
+            metrics.increment("job.failed", job.job_type)
+            await self.queue.fail(job.id, str(e.detail))
+        except Exception as e:
+            metrics.increment("job.failed", job.job_type)
+            logger.exception(f"작업 실패 {job.id} ({job.job_type})")
+            await self.queue.fail(job.id, str(e))
+        else:
+            await self.queue.complete(job.id, result)
+        finally:
+            metrics.observe("job.run", (time.perf_counter() - started) * 1000, job.job_type)
+            heartbeat.cancel()
+            current_endpoint.reset(token)
+
+    async def _heartbeat(self, job: WorkflowJob) -> None:
+        while True:
+            await asyncio.sleep(settings.JOB_HEARTBEAT_INTERVAL)
+            try:
+                await self.queue.heartbeat(job.id)
+            except Exception as e:
+                logger.warning(f"작업 생존 신호 실패 {job.id}: {e}")
+
+    async def _reaper(self) -> None:
+        while not self._stopping:
+            await asyncio.sleep(REAP_INTERVAL)
+            try:
+                reaped = await self.queue.reap_stale()
+                if reaped:
+                    logger.warning(f"중단된 작업 {reaped}건 실패 처리")
+            except Exception as e:
+                logger.warning(f"중단 작업 정리 실패: {e}")
+
+
+_pool: Optional[JobWorkerPool] = None
+
+
+async def start_job_workers(concurrency: int) -> None:
+    """API 프로세스 안에서 워커 풀 시작 (0이면 시작하지 않음)"""
+    global _pool
+    if concurrency <= 0 or _pool is not None:
+        return
+    _pool = JobWorkerPool(concurrency)
+    _pool.start()
+
+
+async def stop_job_workers() -> None:
+    global _pool
+    if _pool is not None:
+        await _pool.stop()
+        _pool = None
@@ -0,0 +1,86 @@
+"""
+프로세스 내 성능 지표 수집
+DB 쿼리 지연시간, 커넥션 풀 대기시간 등을 이름/라벨별로 집계합니다.
+"""
+import threading
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Tuple
+
+# 현재 요청의 엔드포인트 (미들웨어에서 설정, 요청 밖에서는 "-")
+current_endpoint: ContextVar[str] = ContextVar("current_endpoint", default="-")
+
+
+class LatencyStats:
+    """지연시간 집계 (최근 샘플로 백분위 계산)"""
+
+    def __init__(self, window: int = 1024):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def observe(self, value_ms: float):
+        self.count += 1
+        self.total_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+        self.samples.append(value_ms)
+
+    def _percentile(self, ordered, q: float) -> float:
+        if not ordered:
+            return 0.0
+        index = min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))
+        return ordered[index]
+
+    def snapshot(self) -> Dict[str, Any]:
+        ordered = sorted(self.samples)
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(self._percentile(ordered, 0.50), 3),
+            "p95_ms": round(self._percentile(ordered, 0.95), 3),
+            "p99_ms": round(self._percentile(ordered, 0.99), 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class MetricsRegistry:
+    """스레드 세이프 지표 레지스트리"""
+
+    def __init__(self):
+        self._latencies: Dict[Tuple[str, str], LatencyStats] = {}
+        self._counters: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, value_ms: float, label: str = "-"):
+        """지연시간 기록"""
+        key = (name, label)
+        with self._lock:
+            stats = self._latencies.get(key)
+            if stats is None:
+                stats = self._latencies[key] = LatencyStats()
+            stats.observe(value_ms)
+
+    def increment(self, name: str, label: str = "-", amount: int = 1):
+        """카운터 증가"""
+        key = (name, label)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def snapshot(self) -> Dict[str, Any]:
+        """{이름: {라벨: 값}} 형태로 반환"""
+        result: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for (name, label), stats in self._latencies.items():
+                result.setdefault(name, {})[label] = stats.snapshot()
+            for (name, label), value in self._counters.items():
+                result.setdefault(name, {})[label] = value
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._latencies.clear()
+            self._counters.clear()
+
+
+metrics = MetricsRegistry()
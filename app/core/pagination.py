@@ -0,0 +1,48 @@
+"""
+키셋(cursor) 페이지네이션 유틸리티
+정렬 키 값을 불투명한 cursor 문자열로 인코딩/디코딩합니다.
+"""
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Callable, List, Sequence
+from fastapi import HTTPException, status
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    """정렬 키 값들을 cursor 문자열로 변환"""
+    payload = json.dumps([_to_json(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, types: Sequence[Callable[[Any], Any]]) -> List[Any]:
+    """
+    cursor 문자열을 정렬 키 값으로 복원
+
+    Args:
+        cursor: encode_cursor로 만든 문자열
+        types: 값별 변환 함수 (예: datetime.fromisoformat, uuid.UUID, int)
+
+    Raises:
+        HTTPException: 형식이 잘못된 경우 400
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("cursor 길이 불일치")
+        return [convert(value) for convert, value in zip(types, values)]
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 cursor입니다"
+        )
@@ -0,0 +1,58 @@
+"""
+멀티 워커 배포용 fork 전/후 처리 (gunicorn.conf.py에서 호출)
+마스터 프로세스에서 임베딩 모델처럼 크고 읽기 전용인 상태를 미리 올려두면
+fork된 워커들이 같은 메모리 페이지를 copy-on-write로 공유합니다.
+DB 커넥션 풀, Milvus 연결처럼 소켓을 가진 자원은 워커마다 fork 이후에 만들어야 합니다.
+"""
+import gc
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+def preload_shared_state() -> None:
+    """
+    워커 fork 직전 마스터에서 호출
+
+    앱 모듈(에이전트, 프롬프트 템플릿)은 preload_app으로 이미 import된 상태이고,
+    여기서는 임베딩 모델 가중치를 올린 뒤 GC 추적 대상에서 빼서(gc.freeze)
+    워커의 GC가 공유 페이지의 객체 헤더를 건드려 복사가 일어나지 않게 합니다.
+    추론은 실행하지 않습니다 (마스터에서 torch 스레드 풀이 뜨면 fork 후 워커가 멈출 수 있음).
+    """
+    from app.core.config import settings
+    if settings.CPU_EXECUTOR_MODE == "process":
+        logger.warning(
+            "CPU_EXECUTOR_MODE=process: CPU 워커 프로세스가 모델을 각자 로드하므로 "
+            "사전 로드한 모델은 공유되지 않습니다 (워커 수만큼 모델 메모리 증가)"
+        )
+
+    if os.getenv("PRELOAD_EMBEDDING_MODEL", "true").lower() == "true":
+        from app.services.data.embedding_service import get_embedding_model
+        try:
+            get_embedding_model()
+        except Exception as e:
+            # 모델이 없으면 워커가 첫 요청에서 각자 로드 (공유는 안 되지만 서비스는 동작)
+            logger.warning(f"임베딩 모델 사전 로드 실패: {e}")
+
+    gc.collect()
+    gc.freeze()
+    logger.info(f"fork 전 공유 객체 고정: {gc.get_freeze_count()}개")
+
+
+def reset_after_fork(torch_threads: int) -> None:
+    """
+    fork 직후 워커에서 호출
+
+    - 마스터에서 만들어진 DB 엔진 풀을 버리고 워커 전용 풀로 시작 (커넥션 소켓 공유 방지)
+    - 워커마다 torch 연산 스레드 수를 제한해 코어 수보다 많은 스레드가 경쟁하지 않게 함
+    """
+    from app.core.database import engine
+    # close=False: 부모 소유 커넥션은 닫지 않고 참조만 버림
+    engine.sync_engine.dispose(close=False)
+
+    try:
+        import torch
+        torch.set_num_threads(torch_threads)
+    except ImportError:
+        pass
@@ -0,0 +1,45 @@
+"""
+JSON 응답 직렬화
+orjson 기반 기본 응답 클래스와, 신뢰된 데이터(DB JSONB, 워크플로우 결과)를
+Pydantic 재검증 없이 내보내는 경로를 제공합니다.
+"""
+from typing import Any, Type, TypeVar
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _default(obj: Any) -> Any:
+    """orjson이 직접 처리하지 못하는 타입 변환"""
+    if isinstance(obj, BaseModel):
+        # model_construct로 만든 모델은 중첩 dict를 그대로 두므로 타입 경고를 끔
+        return obj.model_dump(by_alias=True, warnings=False)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"JSON으로 직렬화할 수 없는 타입: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """orjson 직렬화 (datetime, UUID, date는 ISO 문자열로)"""
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ORJSONResponse(JSONResponse):
+    """orjson 기반 JSON 응답 (앱 기본 응답 클래스)"""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def trusted_response(model: Type[ModelT], status_code: int = 200, **fields: Any) -> ORJSONResponse:
+    """
+    검증 없이 응답 생성 (model_construct + orjson)
+
+    DB JSONB 카드처럼 이미 저장/생성 시점에 형식이 정해진 큰 payload를
+    response_model 재검증과 jsonable_encoder 순회 없이 그대로 직렬화합니다.
+    작은 필드라도 외부 입력이면 호출 전에 따로 검증하세요.
+    """
+    return ORJSONResponse(model.model_construct(**fields), status_code=status_code)
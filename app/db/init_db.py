@@ -2,11 +2,15 @@ import asyncio
 from sqlalchemy import text
 from app.core.database import engine, Base
 from app.models import *  # 모든 모델 import
+from app.db.migrate import migrate
 
 
 async def init_db():
     """DB 초기화 - 테이블만 생성 (데이터 유지)"""
     async with engine.begin() as conn:
+        # 카드 검색 인덱스(gin_trgm_ops)에 필요한 확장
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        
         # 모든 테이블 생성 (이미 있으면 무시)
         await conn.run_sync(Base.metadata.create_all)
         print("테이블 생성 완료")
@@ -25,6 +29,9 @@ async def init_db():
         print("\n생성된 테이블 목록:")
         for table in tables:
             print(f"  - {table[0]}")
+    
+    # 기존 DB에 새 컬럼/인덱스 반영 (이미 적용된 버전은 건너뜀)
+    await migrate()
 
 
 async def reset_db():
@@ -34,6 +41,7 @@ async def reset_db():
         await conn.run_sync(Base.metadata.drop_all)
         
         print("새 테이블 생성 중...")
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
         print("DB 초기화 완료!")
         
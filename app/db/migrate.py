@@ -0,0 +1,123 @@
+"""
+버전 관리형 SQL 마이그레이션 실행기
+
+migrations/NNNN_이름.sql 파일을 번호 순서대로 한 번씩 적용하고
+schema_migrations 테이블에 적용 이력을 남깁니다.
+
+사용 예:
+  python -m app.db.migrate            # 미적용 마이그레이션 적용
+  python -m app.db.migrate --status   # 적용 현황만 출력
+"""
+import argparse
+import asyncio
+from pathlib import Path
+from typing import List
+from sqlalchemy import text
+from app.core.database import engine
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "migrations"
+
+
+def list_migrations() -> List[Path]:
+    """마이그레이션 파일 목록 (버전 순)"""
+    return sorted(MIGRATIONS_DIR.glob("[0-9][0-9][0-9][0-9]_*.sql"))
+
+
+def split_statements(sql: str) -> List[str]:
+    """SQL 파일을 문장 단위로 분리 (주석, 작은따옴표 문자열 안의 ;는 무시)"""
+    statements = []
+    current = []
+    in_quote = False
+    i = 0
+    while i < len(sql):
+        char = sql[i]
+        if not in_quote and sql.startswith("--", i):
+            end = sql.find("\n", i)
+            i = len(sql) if end == -1 else end
+            continue
+        if char == "'":
+            in_quote = not in_quote
+        if char == ";" and not in_quote:
+            statement = "".join(current).strip()
+            if statement:
+                statements.append(statement)
+            current = []
+        else:
+            current.append(char)
+        i += 1
+
+    statement = "".join(current).strip()
+    if statement:
+        statements.append(statement)
+    return statements
+
+
+async def _ensure_table(conn):
+    await conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version VARCHAR(255) PRIMARY KEY,
+            applied_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+        )
+    """))
+
+
+async def get_applied_versions() -> set:
+    """적용된 마이그레이션 버전 집합"""
+    async with engine.begin() as conn:
+        await _ensure_table(conn)
+        result = await conn.execute(text("SELECT version FROM schema_migrations"))
+        return {row[0] for row in result.fetchall()}
+
+
+async def migrate() -> List[str]:
+    """
+    미적용 마이그레이션을 순서대로 적용 (파일마다 하나의 트랜잭션)
+
+    Returns:
+        이번에 적용된 버전 목록
+    """
+    applied = await get_applied_versions()
+    newly_applied = []
+
+    for path in list_migrations():
+        version = path.stem
+        if version in applied:
+            continue
+
+        print(f"마이그레이션 적용 중: {version}")
+        async with engine.begin() as conn:
+            # 동시에 여러 인스턴스가 실행해도 한 번만 적용되도록 잠금
+            await conn.execute(text("LOCK TABLE schema_migrations IN EXCLUSIVE MODE"))
+            result = await conn.execute(
+                text("SELECT 1 FROM schema_migrations WHERE version = :version"),
+                {"version": version}
+            )
+            if result.first():
+                continue
+
+            for statement in split_statements(path.read_text(encoding="utf-8")):
+                await conn.execute(text(statement))
+            await conn.execute(
+                text("INSERT INTO schema_migrations (version) VALUES (:version)"),
+                {"version": version}
+            )
+        newly_applied.append(version)
+
+    print(f"마이그레이션 완료 ({len(newly_applied)}개 적용)")
+    return newly_applied
+
+
+async def print_status():
+    """마이그레이션 적용 현황 출력"""
+    applied = await get_applied_versions()
+    for path in list_migrations():
+        mark = "적용됨" if path.stem in applied else "미적용"
+        print(f"  [{mark}] {path.stem}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DB 마이그레이션")
+    parser.add_argument("--status", action="store_true", help="적용 현황만 출력")
+    args = parser.parse_args()
+
+    asyncio.run(print_status() if args.status else migrate())
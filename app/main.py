@@ -1,25 +1,38 @@
 from fastapi import FastAPI, Depends, HTTPException, Query, Response, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse, JSONResponse
+from starlette.routing import Match
+from brotli_asgi import BrotliMiddleware
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from urllib.parse import urlencode
 import httpx
 import os
+import asyncio
+import logging
 import uuid
 from datetime import datetime, timedelta
 from typing import Optional
 
 from app.core.config import settings
-from app.core.database import get_db
-from app.core.auth import get_current_user, get_optional_user
+from app.core.database import get_db, get_pool_status
+from app.core.metrics import metrics, current_endpoint
+from app.core.responses import ORJSONResponse
+from app.core.job_worker import start_job_workers, stop_job_workers
+from app.core.executors import start_executors, shutdown_executors, get_executor_status
+from app.core.auth import get_current_user, get_optional_user, invalidate_session_cache, require_metrics_token
 # from app.core.workflow_manager import initialize_workflow
 from app.api.v1.api import api_router
+from app.api.v1.jobs import EVENTS_PATH_PATTERN
 from app.models.user import User, UserSession
+from app.services.data.milvus_connection import milvus_manager
+
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title=settings.APP_NAME,
     openapi_url="/api/v1/openapi.json",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS 설정
@@ -31,15 +44,74 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 (brotli 지원 클라이언트는 br, 나머지는 gzip)
+app.add_middleware(
+    BrotliMiddleware,
+    quality=settings.BROTLI_QUALITY,
+    minimum_size=settings.COMPRESSION_MIN_SIZE,
+    gzip_fallback=True,
+    excluded_handlers=[EVENTS_PATH_PATTERN],  # SSE는 버퍼링 없이 바로 전송
+)
+
 # API 라우터 등록
 app.include_router(api_router, prefix="/api/v1")
 
+def _route_template(request: Request) -> str:
+    """요청 경로의 라우트 템플릿 (지표 라벨용, 경로 파라미터 값은 제외)"""
+    for route in request.app.router.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return f"{request.method} {route.path}"
+    return f"{request.method} {request.url.path}"
+
+@app.middleware("http")
+async def track_endpoint(request: Request, call_next):
+    """DB 쿼리 지표에 엔드포인트를 남기기 위해 요청 컨텍스트 설정"""
+    token = current_endpoint.set(_route_template(request))
+    try:
+        return await call_next(request)
+    finally:
+        current_endpoint.reset(token)
+
 # @app.on_event("startup")
 # async def startup_event():
 #     """서버 시작 시 워크플로우 및 연결 초기화"""
 #     # initialize_workflow()
 #     print(f"🌐 API 문서: http://localhost:8001/docs")
 
+@app.on_event("startup")
+async def start_execution_lanes():
+    """CPU/I/O 실행 레인 생성 (다른 startup 작업보다 먼저 기본 executor 설치)"""
+    await start_executors()
+
+@app.on_event("startup")
+async def connect_milvus():
+    """서버 시작 시 Milvus 검색 연결을 한 번만 수립"""
+    try:
+        await asyncio.get_running_loop().run_in_executor(None, milvus_manager.startup)
+    except Exception as e:
+        # 벡터 검색이 없는 API는 계속 동작하도록 첫 검색 시 재연결에 맡김
+        logger.warning(f"Milvus 초기 연결 실패: {e}")
+
+@app.on_event("shutdown")
+async def disconnect_milvus():
+    """서버 종료 시 Milvus 연결 해제"""
+    milvus_manager.shutdown()
+
+@app.on_event("startup")
+async def start_workers():
+    """비동기 모드 작업 워커 시작 (JOB_WORKERS=0이면 별도 워커 프로세스에 맡김)"""
+    await start_job_workers(settings.JOB_WORKERS)
+
+@app.on_event("shutdown")
+async def stop_workers():
+    """실행 중이던 작업은 대기열로 되돌린 뒤 워커 중지"""
+    await stop_job_workers()
+
+@app.on_event("shutdown")
+async def stop_execution_lanes():
+    shutdown_executors()
+
 # OAuth 환경 변수
 GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
 GOOGLE_CLIENT_SECRET = os.getenv("GOOGLE_CLIENT_SECRET")
@@ -235,6 +307,8 @@ async def logout(
         if user_session:
             await db.delete(user_session)
             await db.commit()
+        
+        invalidate_session_cache(session_id)
     
     # 쿠키 제거
     response.delete_cookie(
@@ -245,6 +319,11 @@ async def logout(
     
     return {"message": "로그아웃 성공"}
 
+@app.get("/metrics", dependencies=[Depends(require_metrics_token)], include_in_schema=False)
+async def get_metrics():
+    """DB 쿼리/커넥션 풀/실행 레인 지표"""
+    return {"pool": get_pool_status(), "executors": get_executor_status(), "metrics": metrics.snapshot()}
+
 @app.get("/")
 async def root():
     return {"message": "Meari Backend API", "version": "1.0.0"}
\ No newline at end of file
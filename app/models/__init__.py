@@ -1,16 +1,20 @@
 from app.models.user import User, UserSession
 from app.models.tag import Tag
 from app.models.card import MeariSession, GeneratedCard
-from app.models.checkin import Ritual, HeartTree, AIPersonaHistory
+from app.models.checkin import Ritual, HeartTree, AIPersonaHistory, UserLatestPersona
 from app.models.news import News, NewsQuote
 from app.models.policy import YouthPolicy
 from app.models.history import UserContentHistory
-from app.models.daily import DailyRitual, UserStreak, RitualTemplate
+from app.models.daily import DailyRitual, UserStreak, UserDailyActivity, RitualTemplate
+from app.models.job import WorkflowJob
+from app.models.vector_sync import VectorSyncWatermark
+from app.models.idempotency import IdempotencyKey
 
 __all__ = [
     "User", "UserSession", "Tag", 
     "MeariSession", "GeneratedCard",
-    "Ritual", "HeartTree", "AIPersonaHistory",
+    "Ritual", "HeartTree", "AIPersonaHistory", "UserLatestPersona",
     "News", "NewsQuote", "YouthPolicy", "UserContentHistory",
-    "DailyRitual", "UserStreak", "RitualTemplate"
+    "DailyRitual", "UserStreak", "UserDailyActivity", "RitualTemplate",
+    "WorkflowJob", "VectorSyncWatermark", "IdempotencyKey"
 ]
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, BigInteger, DateTime, ForeignKey, func
+from sqlalchemy import Column, String, Text, BigInteger, DateTime, ForeignKey, Computed, Index, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -16,6 +16,11 @@ class MeariSession(Base):
     # 관계 설정
     user = relationship("User", back_populates="meari_sessions")
     generated_cards = relationship("GeneratedCard", back_populates="session", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        # 세션 이력 키셋 페이지네이션
+        Index("ix_meari_sessions_user_created_id", "user_id", "created_at", "id"),
+    )
 
 
 class GeneratedCard(Base):
@@ -30,7 +35,28 @@ class GeneratedCard(Base):
     source_ids = Column(JSONB)  # 참조한 뉴스/정책 ID들 {"news": ["id1", "id2"], "policies": ["id3"]}
     growth_context = Column(String(20))  # 'initial' or 'ritual'
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    # 검색용: content의 모든 문자열 값 (키 제외, INSERT/UPDATE 시 DB가 자동 계산)
+    search_text = Column(
+        Text,
+        Computed("""jsonb_path_query_array(content, 'strict $.** ? (@.type() == "string")')::text""", persisted=True)
+    )
     
     # 관계 설정
     session = relationship("MeariSession", back_populates="generated_cards")
-    user = relationship("User", back_populates="generated_cards")
\ No newline at end of file
+    user = relationship("User", back_populates="generated_cards")
+    
+    __table_args__ = (
+        # 카드 검색 키셋 페이지네이션
+        Index("ix_generated_cards_user_created_id", "user_id", "created_at", "id"),
+        # 카드 타입 필터 검색
+        Index("ix_generated_cards_user_type_created", "user_id", "card_type", "created_at"),
+        # 세션별 카드 조회/개수
+        Index("ix_generated_cards_session_id", "session_id"),
+        # 한국어 부분 일치 검색 (pg_trgm 확장 필요)
+        Index(
+            "ix_generated_cards_search_text_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"}
+        ),
+    )
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, Integer, SmallInteger, Text, Date, DateTime, ForeignKey, UniqueConstraint, CheckConstraint, String, Boolean, func
+from sqlalchemy import Column, BigInteger, Integer, SmallInteger, Text, Date, DateTime, ForeignKey, UniqueConstraint, CheckConstraint, Index, String, Boolean, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -34,6 +34,7 @@ class HeartTree(Base):
     
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
     growth_level = Column(Integer, nullable=False, default=0, server_default='0')
+    ritual_count = Column(Integer, nullable=False, default=0, server_default='0')  # 발급된 리츄얼 순번 (allocate_ritual_sequence)
     last_grew_at = Column(DateTime(timezone=True))
     
     # 관계 설정
@@ -52,8 +53,25 @@ class AIPersonaHistory(Base):
     persona_data = Column(JSONB, nullable=False)  # LLM이 생성한 페르소나 분석
     event_type = Column(String(50))  # 'initial', 'ritual_update' 등
     event_date = Column(Date, nullable=False, server_default=func.current_date())
-    is_latest = Column(Boolean, nullable=False, default=False)  # 최신 페르소나 여부
+    is_latest = Column(Boolean, nullable=False, default=False)  # 더 이상 갱신하지 않음 (UserLatestPersona 사용)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     
     # 관계 설정
-    user = relationship("User", back_populates="persona_histories")
\ No newline at end of file
+    user = relationship("User", back_populates="persona_histories")
+    
+    __table_args__ = (
+        # 페르소나 진화 이력 조회
+        Index("ix_ai_persona_histories_user_event_date", "user_id", "event_date"),
+    )
+
+
+class UserLatestPersona(Base):
+    """사용자별 최신 페르소나 포인터 (페르소나 저장과 같은 트랜잭션에서 갱신)"""
+    __tablename__ = "user_latest_personas"
+    
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    persona_history_id = Column(BigInteger, ForeignKey("ai_persona_histories.id", ondelete="CASCADE"), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    
+    # 관계 설정
+    persona = relationship("AIPersonaHistory")
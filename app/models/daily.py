@@ -61,6 +61,31 @@ class UserStreak(Base):
     user = relationship("User", back_populates="user_streak", uselist=False)
 
 
+class UserDailyActivity(Base):
+    """사용자 날짜별 활동 요약 (리츄얼 쓰기 경로에서 sync_daily_activity로 갱신)"""
+    __tablename__ = "user_daily_activity"
+    
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    
+    # 일일 리츄얼 (DailyRitual)
+    daily_ritual_id = Column(BigInteger)
+    daily_ritual_title = Column(String(200))
+    daily_ritual_type = Column(String(50))
+    daily_completed = Column(Boolean, nullable=False, default=False, server_default='false')
+    daily_mood = Column(String(50))
+    
+    # 메아리 리츄얼 (Ritual)
+    meari_ritual_id = Column(BigInteger)
+    meari_completed = Column(Boolean, nullable=False, default=False, server_default='false')
+    meari_mood = Column(String(50))
+    
+    # 이 날짜까지 일일 리츄얼 연속 완료 일수 (미완료면 0)
+    streak_length = Column(Integer, nullable=False, default=0, server_default='0')
+    
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
 class RitualTemplate(Base):
     """리츄얼 템플릿 (재사용 가능한 리츄얼)"""
     __tablename__ = "ritual_templates"
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, BigInteger, Integer, String, LargeBinary, DateTime, ForeignKey, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from app.core.database import Base
+
+
+class IdempotencyKey(Base):
+    """멱등성 키 선점/완료 응답 (모든 워커가 공유, app.core.idempotency)"""
+    __tablename__ = "idempotency_keys"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    scope = Column(String(500), nullable=False)  # 경로(+쿼리): '/api/v1/meari/sessions?mode=async'
+    key = Column(String(300), nullable=False)  # 'key:<Idempotency-Key>' 또는 'body:<본문 해시>'
+    fingerprint = Column(String(64), nullable=False)  # 요청 본문 SHA-256
+    status = Column(String(20), nullable=False, default="processing")  # processing, completed
+
+    # 완료된 응답 (재전송용)
+    status_code = Column(Integer)
+    body = Column(LargeBinary)
+    media_type = Column(String(100))
+    headers = Column(JSONB)  # [[이름, 값], ...] (Location 등, 본문 길이/타입 제외)
+
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=False)  # 처리 중이면 선점 만료, 완료면 재전송 만료
+
+    __table_args__ = (
+        UniqueConstraint('user_id', 'scope', 'key', name='_user_scope_idempotency_key_uc'),
+    )
@@ -0,0 +1,46 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, func, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from app.core.database import Base
+import uuid
+
+
+class WorkflowJob(Base):
+    """비동기 모드로 요청된 워크플로우 작업 (Postgres 작업 큐)"""
+    __tablename__ = "workflow_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    job_type = Column(String(50), nullable=False)  # 'meari_session', 'growth_content'
+    status = Column(String(20), nullable=False, default="queued")  # queued, running, succeeded, failed
+    stage = Column(String(50))  # 진행 단계: 'workflow', 'saving' 등
+    payload = Column(JSONB, nullable=False)  # 원 요청 본문
+    result = Column(JSONB)  # 성공 시 동기 모드와 같은 응답 본문
+    error = Column(Text)
+
+    # 실행/재시도 관리
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=1)
+    worker_id = Column(String(100))
+    heartbeat_at = Column(DateTime(timezone=True))
+
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        # 대기 작업 선점 (FOR UPDATE SKIP LOCKED)
+        Index(
+            "ix_workflow_jobs_queued_created",
+            "created_at",
+            postgresql_where=text("status = 'queued'")
+        ),
+        # 하트비트가 끊긴 실행 작업 회수
+        Index(
+            "ix_workflow_jobs_running_heartbeat",
+            "heartbeat_at",
+            postgresql_where=text("status = 'running'")
+        ),
+        # 사용자 삭제 CASCADE
+        Index("ix_workflow_jobs_user_id", "user_id"),
+    )
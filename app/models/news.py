@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, BigInteger, Integer, DateTime, ForeignKey, func, Text
+from sqlalchemy import Column, String, BigInteger, Integer, DateTime, ForeignKey, Index, func, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -36,4 +36,9 @@ class NewsQuote(Base):
     tag_id = Column(Integer, ForeignKey("tags.id", ondelete="SET NULL"), nullable=True)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     
-    tag = relationship("Tag", backref="quotes")
\ No newline at end of file
+    tag = relationship("Tag", backref="quotes")
+    
+    __table_args__ = (
+        # 인용문 → 뉴스 조회
+        Index("ix_news_quotes_news_id", "news_id"),
+    )
\ No newline at end of file
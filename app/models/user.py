@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, UniqueConstraint, func
+from sqlalchemy import Column, BigInteger, String, DateTime, ForeignKey, UniqueConstraint, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -13,6 +13,7 @@ class User(Base):
     social_id = Column(String(255), nullable=False)
     email = Column(String(255), unique=True, nullable=False)
     nickname = Column(String(100))
+    data_version = Column(BigInteger, nullable=False, default=0, server_default='0')  # 쓰기마다 증가 (ETag용)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     
     # 관계 설정
@@ -40,4 +41,11 @@ class UserSession(Base):
     expires_at = Column(DateTime(timezone=True), nullable=False)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     
-    user = relationship("User", back_populates="sessions")
\ No newline at end of file
+    user = relationship("User", back_populates="sessions")
+    
+    __table_args__ = (
+        # 인증 조회 (session_id + 만료 확인을 인덱스만으로 처리)
+        Index("ix_user_sessions_session_expires", "session_id", "expires_at"),
+        # 사용자 삭제/로그아웃 시 세션 조회
+        Index("ix_user_sessions_user_id", "user_id"),
+    )
\ No newline at end of file
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, BigInteger, DateTime, func
+from app.core.database import Base
+
+
+class VectorSyncWatermark(Base):
+    """Milvus 컬렉션별 증분 동기화 기준 (이 값 이하의 원본 ID는 이미 적재됨)"""
+    __tablename__ = "vector_sync_watermarks"
+    
+    collection_name = Column(String(100), primary_key=True)  # 'meari_quotes'
+    watermark = Column(BigInteger, nullable=False, default=0)  # 마지막으로 적재한 원본 ID
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
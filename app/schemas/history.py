@@ -50,10 +50,11 @@ class DayDetailResponse(BaseModel):
 
 class SessionHistoryResponse(BaseModel):
     """세션 이력 응답"""
-    total: int
+    total: Optional[int] = Field(None, description="전체 개수 (include_total=false면 생략)")
     page: int
     limit: int
     sessions: List[Dict[str, Any]]
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 cursor (마지막 페이지면 null)")
     
     class Config:
         schema_extra = {
@@ -68,7 +69,8 @@ class SessionHistoryResponse(BaseModel):
                         "selected_tag_ids": [1, 4],
                         "card_count": 5
                     }
-                ]
+                ],
+                "next_cursor": "WyIyMDI1LTA4LTIwVDEwOjAwOjAwIiwidXVpZCJd"
             }
         }
 
@@ -82,14 +84,17 @@ class CardSearchRequest(BaseModel):
     keyword: Optional[str] = None
     page: int = Field(1, ge=1)
     limit: int = Field(20, ge=1, le=100)
+    cursor: Optional[str] = Field(None, description="이전 응답의 next_cursor (있으면 page 무시)")
+    include_total: Optional[bool] = Field(None, description="전체 개수 포함 여부 (기본값: cursor가 없을 때만)")
 
 
 class CardSearchResponse(BaseModel):
     """카드 검색 응답"""
-    total: int
+    total: Optional[int] = Field(None, description="전체 개수 (include_total=false면 생략)")
     page: int
     limit: int
     cards: List[Dict[str, Any]]
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 cursor (마지막 페이지면 null)")
     
     class Config:
         schema_extra = {
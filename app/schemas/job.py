@@ -0,0 +1,32 @@
+"""
+비동기 작업 스키마
+"""
+from typing import Dict, Any, Literal, Optional
+from uuid import UUID
+from pydantic import BaseModel, Field
+from datetime import datetime
+
+
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+
+class JobAcceptedResponse(BaseModel):
+    """작업 접수 응답 (mode=async)"""
+    job_id: UUID
+    status: JobStatus = "queued"
+    status_url: str = Field(..., description="상태 조회 URL")
+    events_url: str = Field(..., description="진행 상황 SSE URL")
+
+
+class JobStatusResponse(BaseModel):
+    """작업 상태 응답"""
+    job_id: UUID
+    job_type: str
+    status: JobStatus
+    stage: Optional[str] = Field(None, description="실행 중 진행 단계 (workflow, saving)")
+    attempts: int
+    result: Optional[Dict[str, Any]] = Field(None, description="성공 시 동기 모드와 같은 응답 본문")
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
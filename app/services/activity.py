@@ -0,0 +1,233 @@
+"""
+사용자 활동(리츄얼) 날짜별 집계
+캘린더, 월간 개요, 리츄얼 통계, 대시보드가 공유하는 user_daily_activity 요약 테이블 헬퍼
+"""
+from datetime import date, timedelta
+from typing import Dict, List, Sequence, Tuple
+from sqlalchemy import select, delete, func, cast, literal, literal_column, null, union, union_all, or_, Date, String
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.daily import DailyRitual, UserDailyActivity
+from app.models.checkin import Ritual
+
+# 요약 테이블과 원본 집계 쿼리가 공유하는 컬럼
+_ACTIVITY_COLUMNS = (
+    "daily_ritual_id", "daily_ritual_title", "daily_ritual_type", "daily_completed", "daily_mood",
+    "meari_ritual_id", "meari_completed", "meari_mood"
+)
+
+
+def _day_series(ranges: Sequence[Tuple[date, date]]):
+    """기간별 generate_series를 합친 날짜 CTE"""
+    selects = [
+        select(
+            cast(
+                func.generate_series(cast(start, Date), cast(end, Date), literal_column("interval '1 day'")),
+                Date
+            ).label("day")
+        )
+        for start, end in ranges
+    ]
+    series = selects[0] if len(selects) == 1 else union(*selects)
+    return series.cte("days")
+
+
+async def fetch_daily_activity(
+    db: AsyncSession,
+    user_id,
+    ranges: Sequence[Tuple[date, date]]
+) -> List[Row]:
+    """
+    기간 내 모든 날짜의 리츄얼 활동을 요약 테이블에서 한 번의 쿼리로 조회
+
+    Args:
+        db: 데이터베이스 세션
+        user_id: 사용자 ID
+        ranges: (시작일, 종료일) 목록 (겹쳐도 날짜는 한 번만 나옴)
+
+    Returns:
+        날짜순 행 목록 (컬럼은 build_daily_activity_query 참고)
+    """
+    result = await db.execute(build_daily_activity_query(user_id, ranges))
+    return result.all()
+
+
+def build_daily_activity_query(user_id, ranges: Sequence[Tuple[date, date]]):
+    """
+    날짜별 리츄얼 활동 쿼리
+
+    user_daily_activity를 (user_id, day) PK 범위로 읽고 generate_series 날짜에 붙입니다.
+
+    Args:
+        user_id: 사용자 ID
+        ranges: (시작일, 종료일) 목록 (겹쳐도 날짜는 한 번만 나옴)
+
+    Returns:
+        날짜순 select. 컬럼: day, daily_ritual_id, daily_ritual_title, daily_ritual_type,
+        daily_completed, daily_mood, meari_ritual_id, meari_completed, meari_mood, streak_length
+        (활동이 없는 날은 day 외 모두 None)
+    """
+    days = _day_series(ranges)
+    activity = select(UserDailyActivity).where(
+        UserDailyActivity.user_id == user_id,
+        or_(*[UserDailyActivity.day.between(start, end) for start, end in ranges])
+    ).cte("activity")
+
+    stmt = select(
+        days.c.day,
+        *[activity.c[column] for column in _ACTIVITY_COLUMNS],
+        activity.c.streak_length
+    ).select_from(
+        days.outerjoin(activity, activity.c.day == days.c.day)
+    ).order_by(days.c.day)
+
+    return stmt
+
+
+def _build_source_activity_query(user_id, ranges: Sequence[Tuple[date, date]]):
+    """
+    원본 테이블에서 날짜별 리츄얼 활동을 직접 집계 (요약 테이블 갱신용)
+
+    generate_series로 날짜를 만들고, DailyRitual과 Ritual(메아리)을 UNION ALL 한 뒤
+    날짜별 FILTER 집계합니다. 두 테이블 모두 사용자/날짜당 최대 1건입니다.
+
+    Args:
+        user_id: 사용자 ID
+        ranges: (시작일, 종료일) 목록 (겹쳐도 날짜는 한 번만 나옴)
+
+    Returns:
+        날짜순 select. 컬럼: day, daily_ritual_id, daily_ritual_title, daily_ritual_type,
+        daily_completed, daily_mood, meari_ritual_id, meari_completed, meari_mood
+        (활동이 없는 날은 day 외 모두 None)
+    """
+    days = _day_series(ranges)
+
+    daily = select(
+        DailyRitual.date.label("day"),
+        literal("daily").label("source"),
+        DailyRitual.id.label("ritual_id"),
+        DailyRitual.ritual_title.label("title"),
+        DailyRitual.ritual_type.label("ritual_type"),
+        DailyRitual.is_completed.label("completed"),
+        DailyRitual.user_mood.label("mood")
+    ).where(
+        DailyRitual.user_id == user_id,
+        or_(*[DailyRitual.date.between(start, end) for start, end in ranges])
+    )
+    meari = select(
+        Ritual.checkin_date.label("day"),
+        literal("meari").label("source"),
+        Ritual.id.label("ritual_id"),
+        cast(null(), String).label("title"),
+        cast(null(), String).label("ritual_type"),
+        Ritual.ritual_completed.label("completed"),
+        Ritual.selected_mood.label("mood")
+    ).where(
+        Ritual.user_id == user_id,
+        or_(*[Ritual.checkin_date.between(start, end) for start, end in ranges])
+    )
+    activity = union_all(daily, meari).cte("activity")
+
+    is_daily = activity.c.source == "daily"
+    is_meari = activity.c.source == "meari"
+
+    stmt = select(
+        days.c.day,
+        func.max(activity.c.ritual_id).filter(is_daily).label("daily_ritual_id"),
+        func.max(activity.c.title).filter(is_daily).label("daily_ritual_title"),
+        func.max(activity.c.ritual_type).filter(is_daily).label("daily_ritual_type"),
+        func.bool_or(activity.c.completed).filter(is_daily).label("daily_completed"),
+        func.max(activity.c.mood).filter(is_daily).label("daily_mood"),
+        func.max(activity.c.ritual_id).filter(is_meari).label("meari_ritual_id"),
+        func.bool_or(activity.c.completed).filter(is_meari).label("meari_completed"),
+        func.max(activity.c.mood).filter(is_meari).label("meari_mood")
+    ).select_from(
+        days.outerjoin(activity, activity.c.day == days.c.day)
+    ).group_by(days.c.day).order_by(days.c.day)
+
+    return stmt
+
+
+async def sync_daily_activity(db: AsyncSession, user_id, day: date) -> None:
+    """
+    원본 리츄얼 테이블의 하루치 상태를 요약 테이블에 반영하고 연속 일수 갱신
+    (리츄얼 쓰기 경로에서 커밋 전에 호출, 커밋은 호출자가 수행)
+    """
+    await db.flush()
+    result = await db.execute(_build_source_activity_query(user_id, [(day, day)]))
+    source = result.one()
+
+    values = {column: getattr(source, column) for column in _ACTIVITY_COLUMNS}
+    values["daily_completed"] = bool(values["daily_completed"])
+    values["meari_completed"] = bool(values["meari_completed"])
+
+    stmt = pg_insert(UserDailyActivity).values(user_id=user_id, day=day, **values)
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=[UserDailyActivity.user_id, UserDailyActivity.day],
+        set_={**values, "updated_at": func.now()}
+    ))
+    await _refresh_streaks(db, user_id, day)
+
+
+async def _refresh_streaks(db: AsyncSession, user_id, day: date) -> None:
+    """day부터 연속 일수를 전날 값에 이어서 다시 계산 (값이 그대로인 날에서 중단)"""
+    stmt = select(UserDailyActivity).where(
+        UserDailyActivity.user_id == user_id,
+        UserDailyActivity.day >= day - timedelta(days=1)
+    ).order_by(UserDailyActivity.day).execution_options(populate_existing=True)
+    result = await db.execute(stmt)
+
+    prev_day, prev_streak = None, 0
+    for row in result.scalars():
+        if row.day < day:
+            prev_day, prev_streak = row.day, row.streak_length
+            continue
+
+        if not row.daily_completed:
+            expected = 0
+        elif prev_day == row.day - timedelta(days=1):
+            expected = prev_streak + 1
+        else:
+            expected = 1
+
+        if row.day > day and row.streak_length == expected:
+            break
+        row.streak_length = expected
+        prev_day, prev_streak = row.day, expected
+
+
+async def rebuild_daily_activity(db: AsyncSession, user_id) -> None:
+    """사용자의 요약 테이블 전체 재생성 (데모/시드 데이터를 원본 테이블에 직접 넣은 뒤 사용)"""
+    await db.flush()
+    days = union(
+        select(DailyRitual.date.label("day")).where(DailyRitual.user_id == user_id),
+        select(Ritual.checkin_date.label("day")).where(Ritual.user_id == user_id)
+    ).subquery()
+    result = await db.execute(select(days.c.day).order_by(days.c.day))
+    active_days = result.scalars().all()
+
+    await db.execute(delete(UserDailyActivity).where(UserDailyActivity.user_id == user_id))
+    for day in active_days:
+        await sync_daily_activity(db, user_id, day)
+
+
+def current_streak(days: Sequence[Row], today: date) -> int:
+    """오늘(없으면 어제)까지 이어진 일일 리츄얼 연속 일수"""
+    by_day = {d.day: d for d in days}
+    for anchor in (today, today - timedelta(days=1)):
+        row = by_day.get(anchor)
+        if row is not None and row.daily_completed:
+            return row.streak_length or 0
+    return 0
+
+
+def count_moods(days: Sequence[Row]) -> Dict[str, int]:
+    """리츄얼별 기분 분포 (DailyRitual과 메아리 리츄얼을 각각 집계)"""
+    distribution: Dict[str, int] = {}
+    for day in days:
+        for mood in (day.daily_mood, day.meari_mood):
+            if mood:
+                distribution[mood] = distribution.get(mood, 0) + 1
+    return distribution
@@ -2,16 +2,19 @@ from typing import Dict, Any, List, Optional
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
-from pymilvus import Collection, connections
 from sqlalchemy import create_engine, select
 from sqlalchemy.orm import sessionmaker
 from app.models.news import News
-from app.services.data.vector_store import get_quotes_collection
-from app.services.data.embedding_service import embed_text
+from app.services.data.vector_store import multi_search, VectorSearchRequest
+from app.services.data.diversity import mmr_select, MMR_LAMBDA
 import numpy as np
 import os
 
 
+EMPATHY_CARD_COUNT = 3
+EMPATHY_SEARCH_TOP_K = 6  # MMR로 다양화하므로 적게 가져와도 충분
+
+
 class QuoteCard(BaseModel):
     """개별 인용문 기반 공감 카드"""
     title: str = Field(description="카드 제목")
@@ -44,9 +47,6 @@ class EmpathyAgent:
             google_api_key=api_key
         )
         
-        # Milvus 컬렉션은 사용 시점에 가져오기
-        self.quotes_collection = None
-        
         # 프롬프트 설정
         self.prompt = self._create_prompt()
         
@@ -58,12 +58,6 @@ class EmpathyAgent:
         self.engine = create_engine(database_url)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
     
-    def _get_collection(self):
-        """Milvus 컬렉션 가져오기 (lazy loading)"""
-        if self.quotes_collection is None:
-            self.quotes_collection = get_quotes_collection()
-        return self.quotes_collection
-    
     def _create_prompt(self) -> ChatPromptTemplate:
         """공감 카드 생성 프롬프트"""
         
@@ -109,12 +103,15 @@ JSON 코드 블록 없이 순수한 JSON 배열만 응답하세요. 설명이나
         top_k: int = 5
     ) -> List[Dict[str, Any]]:
         """유사한 인용문 검색"""
-        
-        # 사용자 입력 임베딩
-        user_embedding = embed_text(user_context)
-        
-        # 검색 파라미터
-        search_params = {"metric_type": "COSINE", "params": {"nprobe": 16}}
+        return self.search_similar_quotes_batch([user_context], tag_ids, top_k)[0]
+    
+    def search_similar_quotes_batch(
+        self,
+        user_contexts: List[str],
+        tag_ids: List[int] = None,
+        top_k: int = 5
+    ) -> List[List[Dict[str, Any]]]:
+        """여러 사용자 상황의 유사 인용문을 한 번의 배치 임베딩/검색으로 조회"""
         
         # 태그 필터 생성
         if tag_ids:
@@ -122,30 +119,71 @@ JSON 코드 블록 없이 순수한 JSON 배열만 응답하세요. 설명이나
         else:
             expr = None
         
-        # 벡터 검색
-        collection = self._get_collection()
-        results = collection.search(
-            data=[user_embedding.tolist()],
-            anns_field="embedding",
-            param=search_params,
-            limit=top_k,
-            expr=expr,
-            output_fields=["quote_text", "speaker", "news_id", "tag_id"]
-        )
+        # 벡터 검색 (같은 필터의 쿼리는 하나의 search 호출로 합쳐짐)
+        requests = [
+            VectorSearchRequest(
+                collection="meari_quotes",
+                query_text=user_context,
+                expr=expr,
+                top_k=top_k,
+                output_fields=["quote_text", "speaker", "news_id", "tag_id", "embedding"]
+            )
+            for user_context in user_contexts
+        ]
+        results = multi_search(requests)
         
         # 결과 정리
-        quotes = []
-        for hit in results[0]:
-            quote_data = {
-                "text": hit.entity.get("quote_text"),
-                "speaker": hit.entity.get("speaker"),
-                "news_id": hit.entity.get("news_id"),
-                "tag_id": hit.entity.get("tag_id"),
-                "similarity_score": hit.distance
-            }
-            quotes.append(quote_data)
-        
-        return quotes
+        return [
+            [
+                {
+                    "text": hit["quote_text"],
+                    "speaker": hit["speaker"],
+                    "news_id": hit["news_id"],
+                    "tag_id": hit["tag_id"],
+                    "similarity_score": hit["distance"],
+                    "embedding": hit.get("embedding")
+                }
+                for hit in hits
+            ]
+            for hits in results
+        ]
+    
+    def _select_diverse_quotes(
+        self,
+        quotes: List[Dict[str, Any]],
+        news_info: Dict[str, Dict],
+        k: int = EMPATHY_CARD_COUNT,
+        lambda_mult: float = MMR_LAMBDA
+    ) -> List[Dict[str, Any]]:
+        """
+        MMR로 관련도는 높고 서로 겹치지 않는 인용문 선택
+
+        뉴스 링크가 있는 인용문이 k개 이상이면 그 안에서 고르고, 모자라면 링크 있는 인용문은
+        모두 유지한 채 남은 자리만 나머지 인용문 중에서 MMR로 채웁니다 (카드의 news_link 유지).
+        """
+        with_news = [
+            q for q in quotes
+            if q.get('news_id') in news_info and news_info[q['news_id']].get('link_url')
+        ]
+        if len(with_news) >= k:
+            kept, pool = [], with_news
+        else:
+            kept = with_news
+            linked_ids = {id(q) for q in with_news}
+            pool = with_news + [q for q in quotes if id(q) not in linked_ids]
+        
+        # 후보가 모자라거나 임베딩이 없으면 기존처럼 검색 순서대로
+        if len(pool) <= k or any(q.get('embedding') is None for q in pool):
+            return pool[:k]
+        
+        selected = mmr_select(
+            np.asarray([q['embedding'] for q in pool], dtype=np.float32),
+            k=k - len(kept),
+            relevance=[q['similarity_score'] for q in pool],
+            lambda_mult=lambda_mult,
+            already_selected=range(len(kept))
+        )
+        return kept + [pool[i] for i in selected]
     
     def _get_news_info_sync(self, news_ids: List[str]) -> Dict[str, Dict]:
         """뉴스 ID로 뉴스 정보 조회 (동기 버전)"""
@@ -225,8 +263,8 @@ JSON 코드 블록 없이 순수한 JSON 배열만 응답하세요. 설명이나
                 seen_news_ids.add(news_id)
             unique_quotes.append(quote)
         
-        # 상위 3개 인용문 선택
-        top_quotes = unique_quotes[:3]
+        # 서로 다른 내용의 인용문 3개 선택
+        top_quotes = self._select_diverse_quotes(unique_quotes, news_info)
         
         # 각 인용문에 대한 포맷팅
         quotes_text = "\n\n".join([
@@ -362,7 +400,7 @@ JSON 코드 블록 없이 순수한 JSON 배열만 응답하세요. 설명이나
         quotes = self.search_similar_quotes(
             user_context=user_context,
             tag_ids=tag_ids,
-            top_k=7  # 여유있게 7개 검색
+            top_k=EMPATHY_SEARCH_TOP_K
         )
         
         # 공감 카드 3개 생성
@@ -409,5 +447,5 @@ JSON 코드 블록 없이 순수한 JSON 배열만 응답하세요. 설명이나
         return state
     
     def close(self):
-        """연결 종료"""
-        connections.disconnect("default")
\ No newline at end of file
+        """Milvus 연결은 앱 수명주기(milvus_manager)에서 관리하므로 요청마다 끊지 않음"""
+        pass
\ No newline at end of file
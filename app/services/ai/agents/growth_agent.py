@@ -1,13 +1,29 @@
-from typing import Dict, Any, List, Optional, Literal
+from typing import Dict, Any, List, Optional, Literal, Iterable
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
-from pymilvus import Collection, connections
-from app.services.data.vector_store import get_policies_collection
+from app.services.data.vector_store import multi_search, VectorSearchRequest
 from app.services.data.embedding_service import embed_text
 import os
 from concurrent.futures import ThreadPoolExecutor
 
+# 정책 검색 과다 조회 설정 (이미 본 정책 제외용)
+POLICY_SEARCH_TOP_K = 5
+POLICY_SEARCH_MAX_FETCH = 320
+
+# 태그별 기본 사용자 컨텍스트
+TAG_CONTEXTS = {
+    1: "취업 준비와 구직 활동에서 느끼는 스트레스",
+    2: "직장 생활에서의 번아웃과 업무 스트레스",
+    3: "이직과 커리어 전환에 대한 고민",
+    4: "우울감과 무기력감으로 인한 일상의 어려움",
+    5: "건강에 대한 과도한 걱정과 불안",
+    6: "수면 문제로 인한 피로와 집중력 저하",
+    7: "사회적 연결감 부족과 외로움",
+    8: "세대 간 가치관 차이로 인한 갈등",
+    9: "대인관계에서 오는 스트레스와 긴장"
+}
+
 
 class GrowthContent(BaseModel):
     """성장 콘텐츠 응답"""
@@ -26,19 +42,10 @@ class GrowthAgent:
             google_api_key=os.getenv("GEMINI_API_KEY")
         )
         
-        # Milvus 커렉션은 사용 시점에 가져오기
-        self.policies_collection = None
-        
         # 프롬프트 설정
         self.info_prompt = self._create_info_prompt()
         self.exp_prompt = self._create_exp_prompt()
     
-    def _get_collection(self):
-        """Milvus 커렉션 가져오기 (lazy loading)"""
-        if self.policies_collection is None:
-            self.policies_collection = get_policies_collection()
-        return self.policies_collection
-    
     def _create_info_prompt(self) -> ChatPromptTemplate:
         """정보 콘텐츠 생성 프롬프트"""
         
@@ -120,39 +127,43 @@ class GrowthAgent:
     def search_policy(
         self, 
         user_context: str,
-        previous_policy_ids: List[str] = None
+        previous_policy_ids: Iterable[str] = None
     ) -> Optional[Dict[str, Any]]:
         """관련 정책 검색"""
         
-        if previous_policy_ids is None:
-            previous_policy_ids = []
-        
-        query_embedding = embed_text(user_context)
-        search_params = {"metric_type": "COSINE", "params": {"nprobe": 16}}
-        
-        # 중복 제외
-        expr = f"policy_id not in {previous_policy_ids}" if previous_policy_ids else None
-        
-        collection = self._get_collection()
-        results = collection.search(
-            data=[query_embedding.tolist()],
-            anns_field="embedding",
-            param=search_params,
-            limit=5,
-            expr=expr,
-            output_fields=["policy_id", "policy_name", "support_content", "application_url", "organization"]
-        )
+        # 중복 제외는 Milvus 필터(not in) 대신 과다 조회 후 메모리 집합으로 처리
+        # → 사용자 이력이 길어져도 필터 크기와 검색 비용이 일정
+        seen_policy_ids = set(previous_policy_ids or [])
+        query_vector = embed_text(user_context).tolist()
+        
+        limit = POLICY_SEARCH_TOP_K + min(len(seen_policy_ids), POLICY_SEARCH_TOP_K)
+        hit = None
+        while True:
+            results = multi_search([
+                VectorSearchRequest(
+                    collection="meari_policies",
+                    vector=query_vector,
+                    top_k=limit,
+                    output_fields=["policy_id", "policy_name", "support_content", "application_url", "organization"]
+                )
+            ])
+            hits = results[0] if results else []
+            hit = next((h for h in hits if h["policy_id"] not in seen_policy_ids), None)
+            
+            # 상위 결과가 모두 이미 본 정책이면 조회 범위를 늘려 재검색
+            if hit or len(hits) < limit or limit >= POLICY_SEARCH_MAX_FETCH:
+                break
+            limit = min(limit * 4, POLICY_SEARCH_MAX_FETCH)
         
-        if results and len(results[0]) > 0:
-            hit = results[0][0]
+        if hit:
             return {
                 "type": "support",
                 "title": "맞춤형 지원 정책",
-                "policy_id": hit.entity.get("policy_id"),
-                "policy_name": hit.entity.get("policy_name"),
-                "support_content": hit.entity.get("support_content"),
-                "application_url": hit.entity.get("application_url"),
-                "organization": hit.entity.get("organization"),
+                "policy_id": hit["policy_id"],
+                "policy_name": hit["policy_name"],
+                "support_content": hit["support_content"],
+                "application_url": hit["application_url"],
+                "organization": hit["organization"],
                 "eligibility": "만 19-34세 청년",
                 "how_to_apply": "온라인 신청"
             }
@@ -433,18 +444,7 @@ class GrowthAgent:
         tag_ids = state.get("tag_ids", [])
         tag_context = ""
         if tag_ids:
-            tag_contexts = {
-                1: "취업 준비와 구직 활동에서 느끼는 스트레스",
-                2: "직장 생활에서의 번아웃과 업무 스트레스",
-                3: "이직과 커리어 전환에 대한 고민",
-                4: "우울감과 무기력감으로 인한 일상의 어려움",
-                5: "건강에 대한 과도한 걱정과 불안",
-                6: "수면 문제로 인한 피로와 집중력 저하",
-                7: "사회적 연결감 부족과 외로움",
-                8: "세대 간 가치관 차이로 인한 갈등",
-                9: "대인관계에서 오는 스트레스와 긴장"
-            }
-            tag_context = tag_contexts.get(tag_ids[0], "청년의 심리적 어려움")
+            tag_context = TAG_CONTEXTS.get(tag_ids[0], "청년의 심리적 어려움")
         
         # user_context 구성: 태그 컨텍스트 + 페르소나 요약
         user_context = state.get("user_context", "")
@@ -479,5 +479,5 @@ class GrowthAgent:
         return state
     
     def close(self):
-        """연결 종료"""
-        connections.disconnect("default")
\ No newline at end of file
+        """Milvus 연결은 앱 수명주기(milvus_manager)에서 관리하므로 요청마다 끊지 않음"""
+        pass
\ No newline at end of file
@@ -0,0 +1,81 @@
+"""
+검색 결과 다양화 (Maximal Marginal Relevance)
+유사도가 높은 후보 중 서로 비슷한 항목이 함께 뽑히지 않도록 재정렬합니다.
+"""
+import os
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+
+# 1.0이면 관련도만, 0.0이면 다양성만 고려
+MMR_LAMBDA = float(os.getenv("MMR_LAMBDA", "0.7"))
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def mmr_select(
+    candidate_vectors: np.ndarray,
+    k: int,
+    relevance: Optional[Sequence[float]] = None,
+    query_vector: Optional[np.ndarray] = None,
+    lambda_mult: float = MMR_LAMBDA,
+    already_selected: Sequence[int] = ()
+) -> List[int]:
+    """
+    MMR로 k개 후보 인덱스 선택
+
+    후보 간 코사인 유사도 행렬을 한 번만 계산하고, 이미 선택된 항목과의
+    최대 유사도를 벡터로 갱신하며 탐욕적으로 고릅니다.
+
+    Args:
+        candidate_vectors: 후보 임베딩 (n, dim)
+        k: 선택할 개수
+        relevance: 후보별 쿼리 관련도 (검색 점수). 없으면 query_vector로 계산
+        query_vector: 쿼리 임베딩 (relevance가 없을 때 사용)
+        lambda_mult: 관련도 가중치 (0~1)
+        already_selected: 이미 고정으로 선택된 후보 인덱스 (다양성 비교에만 쓰고 결과에는 포함하지 않음)
+
+    Returns:
+        새로 선택된 후보 인덱스 (선택 순서)
+    """
+    candidates = _normalize(np.asarray(candidate_vectors, dtype=np.float32))
+    n = candidates.shape[0]
+    fixed = sorted(set(already_selected))
+    k = min(k, n - len(fixed))
+    if k <= 0:
+        return []
+
+    if relevance is not None:
+        rel = np.asarray(relevance, dtype=np.float32)
+    elif query_vector is not None:
+        rel = candidates @ _normalize(np.asarray(query_vector, dtype=np.float32))
+    else:
+        raise ValueError("relevance 또는 query_vector가 필요합니다")
+
+    similarity = candidates @ candidates.T
+    max_sim = np.full(n, -np.inf, dtype=np.float32)
+    available = np.ones(n, dtype=bool)
+
+    for index in fixed:
+        available[index] = False
+        np.maximum(max_sim, similarity[index], out=max_sim)
+
+    selected: List[int] = []
+    if not fixed:
+        selected.append(int(np.argmax(rel)))
+        available[selected[0]] = False
+        np.maximum(max_sim, similarity[selected[0]], out=max_sim)
+
+    while len(selected) < k:
+        scores = lambda_mult * rel - (1 - lambda_mult) * max_sim
+        scores[~available] = -np.inf
+        last = int(np.argmax(scores))
+        selected.append(last)
+        available[last] = False
+        np.maximum(max_sim, similarity[last], out=max_sim)
+
+    return selected
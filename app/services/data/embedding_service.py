@@ -5,6 +5,8 @@ import os
 from sentence_transformers import SentenceTransformer
 import logging
 
+from app.core.executors import cpu_call, run_cpu
+
 # MPS 메모리 설정
 os.environ['PYTORCH_MPS_HIGH_WATERMARK_RATIO'] = '0.0'
 os.environ['PYTORCH_ENABLE_MPS_FALLBACK'] = '1'
@@ -24,12 +26,18 @@ def get_embedding_model():
         logger.info(f"임베딩 차원: {_embedding_model.get_sentence_embedding_dimension()}")
     return _embedding_model
 
+def _encode(texts, batch_size: int = 32):
+    """임베딩 추론 (CPU 레인에서 실행)"""
+    return get_embedding_model().encode(texts, batch_size=batch_size, show_progress_bar=False)
+
 def embed_text(text: str):
     """단일 텍스트 임베딩"""
-    model = get_embedding_model()
-    return model.encode(text)
+    return cpu_call(_encode, text)
 
-def embed_texts(texts: list):
+def embed_texts(texts: list, batch_size: int = 32):
     """복수 텍스트 임베딩"""
-    model = get_embedding_model()
-    return model.encode(texts)
\ No newline at end of file
+    return cpu_call(_encode, texts, batch_size)
+
+async def aembed_texts(texts: list, batch_size: int = 32):
+    """복수 텍스트 임베딩 (이벤트 루프에서 CPU 레인 결과를 기다림)"""
+    return await run_cpu(_encode, texts, batch_size)
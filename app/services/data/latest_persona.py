@@ -0,0 +1,61 @@
+"""
+사용자별 최신 페르소나 조회/저장
+user_latest_personas 포인터로 PK 조회 (워커 간 불일치가 없도록 캐시하지 않음)
+"""
+from datetime import date
+from typing import Any, Dict, Optional
+from uuid import UUID
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.checkin import AIPersonaHistory, UserLatestPersona
+
+
+async def record_persona(
+    db: AsyncSession,
+    user_id: UUID,
+    persona_data: Dict[str, Any],
+    event_type: str,
+    event_date: Optional[date] = None
+) -> AIPersonaHistory:
+    """
+    새 페르소나 이력을 추가하고 최신 포인터를 같은 트랜잭션에서 갱신
+    (기존 이력 행은 수정하지 않음, 커밋은 호출자가 수행)
+    """
+    persona = AIPersonaHistory(
+        user_id=user_id,
+        persona_data=persona_data,
+        event_type=event_type,
+        event_date=event_date or date.today()
+    )
+    db.add(persona)
+    await db.flush()
+
+    stmt = pg_insert(UserLatestPersona).values(
+        user_id=user_id,
+        persona_history_id=persona.id
+    )
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=[UserLatestPersona.user_id],
+        set_={"persona_history_id": stmt.excluded.persona_history_id, "updated_at": func.now()}
+    ))
+    return persona
+
+
+async def get_latest_persona(db: AsyncSession, user_id: UUID) -> Optional[AIPersonaHistory]:
+    """최신 페르소나 (포인터 PK 조회)"""
+    stmt = select(AIPersonaHistory).join(
+        UserLatestPersona, UserLatestPersona.persona_history_id == AIPersonaHistory.id
+    ).where(UserLatestPersona.user_id == user_id)
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
+
+
+async def get_persona_summary(db: AsyncSession, user_id: UUID) -> str:
+    """최신 페르소나 요약 (포인터 PK 조인으로 요약 필드만 조회, 페르소나가 없으면 빈 문자열)"""
+    stmt = select(AIPersonaHistory.persona_data["summary"].astext).join(
+        UserLatestPersona, UserLatestPersona.persona_history_id == AIPersonaHistory.id
+    ).where(UserLatestPersona.user_id == user_id)
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none() or ""
@@ -0,0 +1,116 @@
+"""
+Milvus 연결 수명주기 관리
+앱 시작 시 한 번 연결하고, 용도별 alias를 유지하며, 끊기면 백오프로 재연결합니다.
+요청 처리 중에는 연결을 끊지 않고 종료 시에만 disconnect 합니다.
+"""
+import os
+import random
+import threading
+import time
+import logging
+from typing import Optional, Set
+from pymilvus import connections, utility
+from dotenv import load_dotenv
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+
+class MilvusConnectionManager:
+    """프로세스 전역 Milvus 연결 관리자"""
+
+    SEARCH_ALIAS = "meari_search"  # API 요청 경로의 벡터 검색
+    INGEST_ALIAS = "meari_ingest"  # 컬렉션 생성/적재 등 오프라인 작업
+
+    def __init__(
+        self,
+        uri: Optional[str] = None,
+        token: Optional[str] = None,
+        max_retries: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0
+    ):
+        self.uri = uri or os.getenv("MILVUS_URI")
+        self.token = token or os.getenv("MILVUS_TOKEN")
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._aliases: Set[str] = set()
+        self._lock = threading.RLock()
+
+    def ensure(self, alias: str = SEARCH_ALIAS) -> str:
+        """alias 연결이 없으면 연결 (이미 있으면 RPC 없이 바로 반환)"""
+        if connections.has_connection(alias):
+            return alias
+
+        with self._lock:
+            if not connections.has_connection(alias):
+                self._connect_with_backoff(alias)
+        return alias
+
+    def is_healthy(self, alias: str = SEARCH_ALIAS) -> bool:
+        """서버 응답 확인"""
+        if not connections.has_connection(alias):
+            return False
+        try:
+            utility.get_server_version(using=alias)
+            return True
+        except Exception as e:
+            logger.warning(f"Milvus 상태 확인 실패 ({alias}): {e}")
+            return False
+
+    def reconnect(self, alias: str = SEARCH_ALIAS) -> str:
+        """연결을 새로 맺음 (동시에 여러 스레드가 호출해도 한 번만 재연결)"""
+        with self._lock:
+            if self.is_healthy(alias):
+                return alias
+
+            try:
+                connections.disconnect(alias)
+            except Exception:
+                pass
+            self._connect_with_backoff(alias)
+        return alias
+
+    def _connect_with_backoff(self, alias: str):
+        """지수 백오프(지터 포함)로 연결 시도"""
+        if not self.uri or not self.token:
+            raise ValueError("MILVUS_URI와 MILVUS_TOKEN이 설정되지 않았습니다")
+
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                connections.connect(
+                    alias=alias,
+                    uri=self.uri,
+                    token=self.token,
+                    secure=True
+                )
+                self._aliases.add(alias)
+                logger.info(f"Milvus 연결 성공 ({alias})")
+                return
+            except Exception as e:
+                if attempt == self.max_retries:
+                    logger.error(f"Milvus 연결 실패 ({alias}): {e}")
+                    raise
+                delay = min(self.base_delay * 2 ** (attempt - 1), self.max_delay)
+                delay *= random.uniform(0.5, 1.0)
+                logger.warning(f"Milvus 연결 재시도 {attempt}/{self.max_retries} ({alias}), {delay:.1f}초 후: {e}")
+                time.sleep(delay)
+
+    def startup(self):
+        """앱 시작 시 검색용 연결 수립"""
+        self.ensure(self.SEARCH_ALIAS)
+
+    def shutdown(self):
+        """앱 종료 시 모든 연결 해제"""
+        with self._lock:
+            for alias in list(self._aliases):
+                try:
+                    connections.disconnect(alias)
+                    logger.info(f"Milvus 연결 해제 ({alias})")
+                except Exception as e:
+                    logger.warning(f"Milvus 연결 해제 실패 ({alias}): {e}")
+            self._aliases.clear()
+
+
+milvus_manager = MilvusConnectionManager()
@@ -0,0 +1,25 @@
+"""
+사용자별 이미 본 정책 ID 조회
+정책 벡터 검색에서 중복 제외를 Milvus 필터 대신 메모리 집합으로 처리하기 위해 사용
+"""
+from typing import FrozenSet
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.history import UserContentHistory
+
+
+async def get_seen_policy_ids(db: AsyncSession, user_id: UUID) -> FrozenSet[str]:
+    """
+    사용자가 이미 본 정책 ID 집합
+
+    프로세스 캐시를 두면 다른 워커가 기록한 열람 이력을 못 보므로 요청마다 DB에서 읽습니다.
+    (_user_content_uc 유니크 인덱스의 (user_id, content_type) 접두 범위 조회)
+    """
+    stmt = select(UserContentHistory.content_id).where(
+        UserContentHistory.user_id == user_id,
+        UserContentHistory.content_type == "policy"
+    )
+    result = await db.execute(stmt)
+    return frozenset(row[0] for row in result.fetchall())
@@ -3,14 +3,30 @@ Milvus 벡터 데이터베이스 클라이언트
 Zilliz Cloud 연동 및 벡터 검색 기능
 """
 import os
+import json
 import asyncio
-from typing import List, Dict, Optional, Any
-from pymilvus import connections, Collection, CollectionSchema, FieldSchema, DataType, utility
-from sentence_transformers import SentenceTransformer
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Any, Callable, Tuple
+from pymilvus import Collection, CollectionSchema, FieldSchema, DataType, utility, MilvusException
+from pymilvus.exceptions import (
+    CollectionNotExistException,
+    ConnectError,
+    ConnectionNotExistException,
+    ErrorCode,
+    MilvusUnavailableException,
+    SchemaNotReadyException,
+)
+import grpc
 import numpy as np
 from dotenv import load_dotenv
 import logging
 import threading
+import time
+
+from app.core.executors import run_io
+from app.services.data.embedding_service import aembed_texts, embed_texts, get_embedding_model
+from app.services.data.milvus_connection import milvus_manager
 
 os.environ['PYTORCH_ENABLE_MPS_FALLBACK'] = '1'
 os.environ['TOKENIZERS_PARALLELISM'] = 'false'
@@ -18,8 +34,105 @@ os.environ['TOKENIZERS_PARALLELISM'] = 'false'
 load_dotenv()
 logger = logging.getLogger(__name__)
 
-# 스레드 로컬 스토리지
-thread_local = threading.local()
+# 임베딩/적재 설정
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "32"))
+INGEST_QUEUE_SIZE = 2  # 임베딩이 업로드보다 앞서 나갈 수 있는 배치 수
+EXISTING_ID_PAGE_SIZE = 1000  # 기존 ID 확인 시 한 번에 조회할 후보 수
+
+# 벡터 인덱스 프로필
+# 컬렉션별로 MILVUS_INDEX_PROFILE_<컬렉션명 대문자> 환경변수로 선택
+# (예: MILVUS_INDEX_PROFILE_MEARI_QUOTES=hnsw)
+# scripts/benchmark_vector_index.py 로 recall/latency를 측정한 뒤 고를 것
+METRIC_TYPE = "COSINE"
+INDEX_PROFILES: Dict[str, Dict[str, Any]] = {
+    "flat": {
+        "index": {"index_type": "FLAT", "params": {}},
+        "search": {}
+    },
+    "ivf_flat": {
+        "index": {"index_type": "IVF_FLAT", "params": {"nlist": 128}},
+        "search": {"nprobe": 16}
+    },
+    "ivf_sq8": {
+        "index": {"index_type": "IVF_SQ8", "params": {"nlist": 128}},
+        "search": {"nprobe": 16}
+    },
+    "hnsw": {
+        "index": {"index_type": "HNSW", "params": {"M": 16, "efConstruction": 200}},
+        "search": {"ef": 64}
+    },
+}
+DEFAULT_INDEX_PROFILES = {
+    "meari_quotes": "ivf_flat",
+    "meari_policies": "ivf_flat",
+}
+
+
+def get_index_profile_name(collection_name: str) -> str:
+    """컬렉션에 설정된 인덱스 프로필 이름"""
+    env_key = f"MILVUS_INDEX_PROFILE_{collection_name.upper()}"
+    name = os.getenv(env_key, DEFAULT_INDEX_PROFILES.get(collection_name, "ivf_flat")).lower()
+    if name not in INDEX_PROFILES:
+        raise ValueError(f"알 수 없는 인덱스 프로필: {name} (가능: {', '.join(INDEX_PROFILES)})")
+    return name
+
+
+def build_index_params(profile_name: str) -> Dict[str, Any]:
+    """create_index에 전달할 인덱스 파라미터"""
+    profile = INDEX_PROFILES[profile_name]["index"]
+    return {
+        "metric_type": METRIC_TYPE,
+        "index_type": profile["index_type"],
+        "params": dict(profile["params"])
+    }
+
+
+def build_search_params(profile_name: str, overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """search에 전달할 검색 파라미터 (nprobe, ef 등)"""
+    params = dict(INDEX_PROFILES[profile_name]["search"])
+    if overrides:
+        params.update(overrides)
+    return {"metric_type": METRIC_TYPE, "params": params}
+
+
+def get_search_params(collection_name: str) -> Dict[str, Any]:
+    """컬렉션에 설정된 프로필 기준 검색 파라미터"""
+    return build_search_params(get_index_profile_name(collection_name))
+
+
+# multi_search 병렬 검색용 스레드 풀
+_search_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("VECTOR_SEARCH_WORKERS", "4")),
+    thread_name_prefix="vector-search"
+)
+
+
+@dataclass
+class VectorSearchRequest:
+    """multi_search 단위 검색 요청 (query_text 또는 vector 중 하나 필요)"""
+    collection: str
+    query_text: Optional[str] = None
+    vector: Optional[List[float]] = None
+    expr: Optional[str] = None
+    top_k: int = 5
+    output_fields: List[str] = field(default_factory=list)
+    search_params: Optional[Dict[str, Any]] = None  # 없으면 컬렉션 인덱스 프로필 기준
+    anns_field: str = "embedding"
+    
+    def __post_init__(self):
+        if self.search_params is None:
+            self.search_params = get_search_params(self.collection)
+    
+    def group_key(self) -> Tuple:
+        """같은 키를 가진 요청은 한 번의 search(data=[...]) 호출로 합쳐짐"""
+        return (
+            self.collection,
+            self.expr,
+            self.top_k,
+            tuple(self.output_fields),
+            self.anns_field,
+            json.dumps(self.search_params, sort_keys=True)
+        )
 
 
 class VectorStore:
@@ -33,27 +146,18 @@ class VectorStore:
         if not self.uri or not self.token:
             raise ValueError("MILVUS_URI와 MILVUS_TOKEN이 설정되지 않았습니다")
         
-        # Milvus 연결
+        # Milvus 연결 (적재/관리 작업 전용 alias)
+        self.alias = milvus_manager.INGEST_ALIAS
         self._connect()
         
-        logger.info(f"임베딩 모델 로드 중: {self.model_name}")
-        self.encoder = SentenceTransformer(self.model_name, device='cpu')
+        # 임베딩은 싱글톤 모델을 CPU 레인에서 실행 (모델을 따로 로드하지 않음)
+        self.encoder = get_embedding_model()
         self.dimension = self.encoder.get_sentence_embedding_dimension()
         logger.info(f"임베딩 차원: {self.dimension}")
     
     def _connect(self):
-        """Milvus 서버에 연결"""
-        try:
-            connections.connect(
-                alias="default",
-                uri=self.uri,
-                token=self.token,
-                secure=True
-            )
-            logger.info("Milvus 연결 성공")
-        except Exception as e:
-            logger.error(f"Milvus 연결 실패: {e}")
-            raise
+        """Milvus 서버에 연결 (이미 연결되어 있으면 재사용)"""
+        milvus_manager.ensure(self.alias)
     
     def create_collection(
         self,
@@ -73,9 +177,9 @@ class VectorStore:
             생성된 컬렉션 객체
         """
         # 이미 존재하는지 확인
-        if utility.has_collection(collection_name):
+        if utility.has_collection(collection_name, using=self.alias):
             logger.info(f"컬렉션 '{collection_name}'이 이미 존재합니다")
-            return Collection(collection_name)
+            return Collection(collection_name, using=self.alias)
         
         # 스키마 생성
         schema_fields = []
@@ -106,8 +210,10 @@ class VectorStore:
         collection = Collection(
             name=collection_name,
             schema=schema,
+            using=self.alias,
             consistency_level="Strong"
         )
+        collection_registry.invalidate(collection_name)
         
         logger.info(f"컬렉션 '{collection_name}' 생성 완료")
         return collection
@@ -156,19 +262,31 @@ class VectorStore:
         self._create_index(collection, "embedding")
         return collection
     
-    def _create_index(self, collection: Collection, field_name: str):
-        """벡터 필드에 인덱스 생성"""
-        index_params = {
-            "metric_type": "COSINE",
-            "index_type": "IVF_FLAT",
-            "params": {"nlist": 128}
-        }
+    def _create_index(self, collection: Collection, field_name: str, profile_name: Optional[str] = None):
+        """벡터 필드에 인덱스 생성 (컬렉션별 인덱스 프로필 적용)"""
+        profile_name = profile_name or get_index_profile_name(collection.name)
+        index_params = build_index_params(profile_name)
         
         collection.create_index(
             field_name=field_name,
             index_params=index_params
         )
-        logger.info(f"인덱스 생성 완료: {collection.name}.{field_name}")
+        logger.info(f"인덱스 생성 완료: {collection.name}.{field_name} ({profile_name})")
+    
+    def rebuild_index(self, collection_name: str, profile_name: Optional[str] = None):
+        """
+        인덱스 프로필 변경 후 기존 컬렉션의 인덱스 재생성
+        
+        Args:
+            collection_name: 컬렉션 이름
+            profile_name: 적용할 프로필 (기본값: 환경변수 설정)
+        """
+        collection = Collection(collection_name, using=self.alias)
+        collection.release()
+        collection.drop_index()
+        self._create_index(collection, "embedding", profile_name)
+        collection.load()
+        collection_registry.invalidate(collection_name)
     
     def embed_texts(self, texts: List[str]) -> np.ndarray:
         """
@@ -180,18 +298,116 @@ class VectorStore:
         Returns:
             임베딩 벡터 배열
         """
-        embeddings = self.encoder.encode(
-            texts, 
-            show_progress_bar=True,
-            batch_size=8,
-            convert_to_numpy=True
+        return embed_texts(texts, batch_size=EMBEDDING_BATCH_SIZE)
+    
+    def find_existing_ids(self, collection_name: str, id_field: str, candidate_ids: List[Any]) -> set:
+        """
+        후보 원본 ID 중 컬렉션에 이미 저장된 것 (중복 적재 방지용)
+        
+        컬렉션 전체를 훑지 않고 후보 ID만 `in` 조건으로 나눠 조회하므로
+        비용이 컬렉션 크기가 아니라 새로 넣을 행 수에 비례합니다.
+        
+        Args:
+            collection_name: 컬렉션 이름
+            id_field: 원본 ID 필드 (quote_id, policy_id)
+            candidate_ids: 적재하려는 원본 ID
+        
+        Returns:
+            이미 저장된 ID 집합
+        """
+        if not candidate_ids or not utility.has_collection(collection_name, using=self.alias):
+            return set()
+        
+        # 적재 작업은 검색용 공유 연결이 아니라 적재 전용 alias로 조회
+        collection = Collection(collection_name, using=self.alias)
+        collection.load()
+        
+        existing_ids = set()
+        for i in range(0, len(candidate_ids), EXISTING_ID_PAGE_SIZE):
+            chunk = candidate_ids[i:i + EXISTING_ID_PAGE_SIZE]
+            rows = collection.query(
+                expr=f"{id_field} in {json.dumps(chunk, ensure_ascii=False)}",
+                output_fields=[id_field]
+            )
+            existing_ids.update(row[id_field] for row in rows)
+        
+        return existing_ids
+    
+    async def _ingest(
+        self,
+        collection_name: str,
+        rows: List[Dict[str, Any]],
+        text_fn: Callable[[Dict[str, Any]], str],
+        columns_fn: Callable[[List[Dict[str, Any]], List[str], np.ndarray], List[List[Any]]],
+        batch_size: int
+    ) -> int:
+        """
+        임베딩(생산자)과 업로드(소비자)를 겹쳐 실행하는 파이프라인 삽입
+        
+        다음 배치를 임베딩하는 동안 이전 배치를 Milvus에 업로드합니다.
+        
+        Args:
+            collection_name: 컬렉션 이름
+            rows: 삽입할 데이터
+            text_fn: 행 → 임베딩할 텍스트
+            columns_fn: (배치, 텍스트, 임베딩) → 컬렉션 컬럼 데이터
+            batch_size: 배치 크기
+        
+        Returns:
+            삽입된 개수
+        """
+        if not rows:
+            logger.info(f"{collection_name}: 새로 삽입할 데이터 없음")
+            return 0
+        
+        collection = Collection(collection_name, using=self.alias)
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=INGEST_QUEUE_SIZE)
+        started_at = time.perf_counter()
+        total_inserted = 0
+        
+        async def produce():
+            try:
+                for i in range(0, len(rows), batch_size):
+                    batch = rows[i:i+batch_size]
+                    texts = [text_fn(row) for row in batch]
+                    embeddings = await aembed_texts(texts, batch_size=EMBEDDING_BATCH_SIZE)
+                    await queue.put(columns_fn(batch, texts, embeddings))
+            finally:
+                await queue.put(None)
+        
+        async def consume():
+            nonlocal total_inserted
+            while True:
+                data = await queue.get()
+                if data is None:
+                    break
+                result = await loop.run_in_executor(None, collection.insert, data)
+                total_inserted += len(result.primary_keys)
+                
+                elapsed = time.perf_counter() - started_at
+                logger.info(
+                    f"진행: {total_inserted}/{len(rows)} "
+                    f"({total_inserted / elapsed:.1f} rows/sec)"
+                )
+        
+        await asyncio.gather(produce(), consume())
+        
+        # 플러시
+        await loop.run_in_executor(None, collection.flush)
+        
+        elapsed = time.perf_counter() - started_at
+        logger.info(
+            f"{collection_name}: 총 {total_inserted}개 벡터 삽입 완료 "
+            f"({elapsed:.1f}초, {total_inserted / elapsed if elapsed > 0 else 0:.1f} rows/sec)"
         )
-        return embeddings
+        return total_inserted
     
     async def insert_quotes(
         self,
         quotes: List[Dict[str, Any]],
-        batch_size: int = 100
+        batch_size: int = 100,
+        skip_existing: bool = True
     ) -> int:
         """
         인용문 벡터 삽입
@@ -199,24 +415,17 @@ class VectorStore:
         Args:
             quotes: 인용문 데이터 리스트
             batch_size: 배치 크기
+            skip_existing: 이미 컬렉션에 있는 quote_id는 건너뜀
         
         Returns:
             삽입된 개수
         """
-        collection = Collection("meari_quotes")
-        collection.load()
+        if skip_existing:
+            existing_ids = self.find_existing_ids("meari_quotes", "quote_id", [q["id"] for q in quotes])
+            quotes = [q for q in quotes if q["id"] not in existing_ids]
         
-        total_inserted = 0
-        
-        for i in range(0, len(quotes), batch_size):
-            batch = quotes[i:i+batch_size]
-            
-            # 텍스트 추출 및 임베딩
-            texts = [q["quote_text"] for q in batch]
-            embeddings = self.embed_texts(texts)
-            
-            # 데이터 준비
-            data = [
+        def to_columns(batch, texts, embeddings):
+            return [
                 [q["id"] for q in batch],  # quote_id
                 [q["news_id"][:100] for q in batch],  # news_id (100자 제한)
                 texts,  # quote_text (이미 2000자로 제한됨)
@@ -224,24 +433,20 @@ class VectorStore:
                 [q.get("tag_id", 0) for q in batch],  # tag_id
                 embeddings.tolist()  # embedding
             ]
-            
-            # 삽입
-            result = collection.insert(data)
-            total_inserted += len(result.primary_keys)
-            
-            logger.info(f"진행: {min(i+batch_size, len(quotes))}/{len(quotes)}")
-            await asyncio.sleep(0.5)
         
-        # 플러시
-        collection.flush()
-        logger.info(f"총 {total_inserted}개 인용문 벡터 삽입 완료")
-        
-        return total_inserted
+        return await self._ingest(
+            "meari_quotes",
+            quotes,
+            text_fn=lambda q: q["quote_text"],
+            columns_fn=to_columns,
+            batch_size=batch_size
+        )
     
     async def insert_policies(
         self,
         policies: List[Dict[str, Any]],
-        batch_size: int = 100
+        batch_size: int = 100,
+        skip_existing: bool = True
     ) -> int:
         """
         정책 벡터 삽입
@@ -249,27 +454,19 @@ class VectorStore:
         Args:
             policies: 정책 데이터 리스트
             batch_size: 배치 크기
+            skip_existing: 이미 컬렉션에 있는 policy_id는 건너뜀
         
         Returns:
             삽입된 개수
         """
-        collection = Collection("meari_policies")
-        collection.load()
-        
-        total_inserted = 0
+        if skip_existing:
+            existing_ids = self.find_existing_ids(
+                "meari_policies", "policy_id", list({p["policy_id"][:100] for p in policies})
+            )
+            policies = [p for p in policies if p["policy_id"][:100] not in existing_ids]
         
-        for i in range(0, len(policies), batch_size):
-            batch = policies[i:i+batch_size]
-            
-            # 텍스트 추출 및 임베딩 (이름 + 내용 결합)
-            texts = [
-                f"{p['policy_name']} {p['support_content']}"
-                for p in batch
-            ]
-            embeddings = self.embed_texts(texts)
-            
-            # 데이터 준비
-            data = [
+        def to_columns(batch, texts, embeddings):
+            return [
                 [p["policy_id"][:100] for p in batch],  # policy_id (100자 제한)
                 [p["policy_name"][:500] for p in batch],  # policy_name (500자 제한)
                 [p["support_content"][:2000] for p in batch],  # support_content (2000자 제한)
@@ -277,19 +474,27 @@ class VectorStore:
                 [p.get("organization", "")[:200] for p in batch],  # organization (200자 제한)
                 embeddings.tolist()  # embedding
             ]
-            
-            # 삽입
-            result = collection.insert(data)
-            total_inserted += len(result.primary_keys)
-            
-            logger.info(f"진행: {min(i+batch_size, len(policies))}/{len(policies)}")
-            await asyncio.sleep(0.5)
         
-        # 플러시
-        collection.flush()
-        logger.info(f"총 {total_inserted}개 정책 벡터 삽입 완료")
+        # 텍스트 추출 및 임베딩 (이름 + 내용 결합)
+        return await self._ingest(
+            "meari_policies",
+            policies,
+            text_fn=lambda p: f"{p['policy_name']} {p['support_content']}",
+            columns_fn=to_columns,
+            batch_size=batch_size
+        )
+    
+    async def multi_search(self, requests: List[VectorSearchRequest]) -> List[List[Dict[str, Any]]]:
+        """
+        여러 컬렉션/쿼리 검색을 한 번에 실행
         
-        return total_inserted
+        Args:
+            requests: 검색 요청 리스트
+        
+        Returns:
+            요청별 검색 결과
+        """
+        return await amulti_search(requests)
     
     async def search_quotes(
         self,
@@ -308,98 +513,45 @@ class VectorStore:
         Returns:
             검색 결과
         """
-        collection = Collection("meari_quotes")
-        collection.load()
-        
-        # 쿼리 임베딩
-        query_embedding = self.embed_texts([query_text])[0]
-        
-        # 검색 파라미터
-        search_params = {
-            "metric_type": "COSINE",
-            "params": {"nprobe": 10}
-        }
-        
-        # 필터 표현식
-        expr = f"tag_id == {tag_id}" if tag_id else None
-        
-        # 검색 실행
-        results = collection.search(
-            data=[query_embedding.tolist()],
-            anns_field="embedding",
-            param=search_params,
-            limit=top_k,
-            expr=expr,
-            output_fields=["quote_id", "quote_text", "speaker", "tag_id", "news_id"]
-        )
+        results = await self.search_quotes_batch([query_text], top_k=top_k, tag_id=tag_id)
+        return results[0]
+    
+    async def search_quotes_batch(
+        self,
+        query_texts: List[str],
+        top_k: int = 5,
+        tag_id: Optional[int] = None
+    ) -> List[List[Dict]]:
+        """
+        여러 쿼리의 유사 인용문을 한 번의 배치 검색으로 조회 (오프라인 프리페치용)
         
-        # 결과 포맷팅
-        formatted_results = []
-        for hit in results[0]:
-            formatted_results.append({
-                "score": hit.score,
-                "quote_id": hit.entity.get("quote_id"),
-                "quote_text": hit.entity.get("quote_text"),
-                "speaker": hit.entity.get("speaker"),
-                "tag_id": hit.entity.get("tag_id"),
-                "news_id": hit.entity.get("news_id")
-            })
+        Args:
+            query_texts: 검색 쿼리 리스트
+            top_k: 쿼리별 반환할 결과 수
+            tag_id: 특정 태그로 필터링
         
-        return formatted_results
-
-
-def get_quotes_collection() -> Collection:
-    """인용문 컬렉션 가져오기 (스레드 세이프)"""
-    try:
-        # 스레드별로 독립적인 컬렉션 객체 유지
-        if not hasattr(thread_local, 'quotes_collection'):
-            # 연결 확인
-            if not connections.has_connection("default"):
-                uri = os.getenv("MILVUS_URI")
-                token = os.getenv("MILVUS_TOKEN")
-                connections.connect(
-                    alias="default",
-                    uri=uri,
-                    token=token,
-                    secure=True
-                )
-            
-            # 컬렉션 로드 (스레드당 한 번만)
-            thread_local.quotes_collection = Collection("meari_quotes")
-            thread_local.quotes_collection.load()
-            logger.info(f"Thread {threading.current_thread().name}: 인용문 컬렉션 로드")
+        Returns:
+            쿼리별 검색 결과
+        """
+        output_fields = ["quote_id", "quote_text", "speaker", "tag_id", "news_id"]
+        requests = [
+            VectorSearchRequest(
+                collection="meari_quotes",
+                query_text=query_text,
+                expr=f"tag_id == {tag_id}" if tag_id else None,
+                top_k=top_k,
+                output_fields=output_fields
+            )
+            for query_text in query_texts
+        ]
         
-        return thread_local.quotes_collection
-    except Exception as e:
-        logger.error(f"인용문 컬렉션 가져오기 실패: {e}")
-        raise
-
-
-def get_policies_collection() -> Collection:
-    """정책 컬렉션 가져오기 (스레드 세이프)"""
-    try:
-        # 스레드별로 독립적인 컬렉션 객체 유지
-        if not hasattr(thread_local, 'policies_collection'):
-            # 연결 확인
-            if not connections.has_connection("default"):
-                uri = os.getenv("MILVUS_URI")
-                token = os.getenv("MILVUS_TOKEN")
-                connections.connect(
-                    alias="default",
-                    uri=uri,
-                    token=token,
-                    secure=True
-                )
-            
-            # 컬렉션 로드 (스레드당 한 번만)
-            thread_local.policies_collection = Collection("meari_policies")
-            thread_local.policies_collection.load()
-            logger.info(f"Thread {threading.current_thread().name}: 정책 컬렉션 로드")
+        results = await self.multi_search(requests)
         
-        return thread_local.policies_collection
-    except Exception as e:
-        logger.error(f"정책 컬렉션 가져오기 실패: {e}")
-        raise
+        # 결과 포맷팅
+        return [
+            [{"score": hit["score"], **{f: hit[f] for f in output_fields}} for hit in hits]
+            for hits in results
+        ]
     
     async def search_policies(
         self,
@@ -416,91 +568,216 @@ def get_policies_collection() -> Collection:
         Returns:
             검색 결과
         """
-        collection = Collection("meari_policies")
-        collection.load()
-        
-        # 쿼리 임베딩
-        query_embedding = self.embed_texts([query_text])[0]
-        
-        # 검색 파라미터
-        search_params = {
-            "metric_type": "COSINE",
-            "params": {"nprobe": 10}
-        }
-        
-        # 검색 실행
-        results = collection.search(
-            data=[query_embedding.tolist()],
-            anns_field="embedding",
-            param=search_params,
-            limit=top_k,
-            output_fields=["policy_id", "policy_name", "support_content", "application_url", "organization"]
-        )
+        output_fields = ["policy_id", "policy_name", "support_content", "application_url", "organization"]
+        results = await self.multi_search([
+            VectorSearchRequest(
+                collection="meari_policies",
+                query_text=query_text,
+                top_k=top_k,
+                output_fields=output_fields
+            )
+        ])
         
         # 결과 포맷팅
-        formatted_results = []
-        for hit in results[0]:
-            formatted_results.append({
-                "score": hit.score,
-                "policy_id": hit.entity.get("policy_id"),
-                "policy_name": hit.entity.get("policy_name"),
-                "support_content": hit.entity.get("support_content"),
-                "application_url": hit.entity.get("application_url"),
-                "organization": hit.entity.get("organization")
-            })
-        
-        return formatted_results
+        return [{"score": hit["score"], **{f: hit[f] for f in output_fields}} for hit in results[0]]
+
+
+class CollectionRegistry:
+    """
+    프로세스 전역 컬렉션 핸들 레지스트리 (스레드 세이프)
+    
+    컬렉션마다 Collection 객체를 한 번만 만들고 load 하여 모든 스레드가 공유합니다.
+    컬렉션 생성/인덱스 변경 시 invalidate 되며, 검색 중 스키마 불일치나
+    컬렉션 재생성으로 오류가 나면 refresh 로 다시 로드합니다.
+    """
+    
+    def __init__(self, alias: str = milvus_manager.SEARCH_ALIAS):
+        self.alias = alias
+        self._collections: Dict[str, Collection] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, collection_name: str) -> Collection:
+        """로드된 컬렉션 핸들 가져오기 (최초 1회만 load)"""
+        collection = self._collections.get(collection_name)
+        if collection is not None:
+            return collection
+        
+        with self._lock:
+            collection = self._collections.get(collection_name)
+            if collection is None:
+                milvus_manager.ensure(self.alias)
+                collection = Collection(collection_name, using=self.alias)
+                collection.load()
+                self._collections[collection_name] = collection
+                logger.info(f"컬렉션 로드: {collection_name}")
+        return collection
+    
+    def refresh(self, collection_name: str) -> Collection:
+        """스키마 변경 후 핸들 다시 로드"""
+        self.invalidate(collection_name)
+        return self.get(collection_name)
+    
+    def invalidate(self, collection_name: Optional[str] = None):
+        """핸들 무효화 (collection_name이 없으면 전체)"""
+        with self._lock:
+            if collection_name is None:
+                self._collections.clear()
+            else:
+                self._collections.pop(collection_name, None)
+
+
+collection_registry = CollectionRegistry()
 
 
 def get_quotes_collection() -> Collection:
-    """인용문 컬렉션 가져오기 (스레드 세이프)"""
+    """인용문 컬렉션 가져오기 (프로세스 전역 공유)"""
     try:
-        # 스레드별로 독립적인 컬렉션 객체 유지
-        if not hasattr(thread_local, 'quotes_collection'):
-            # 연결 확인
-            if not connections.has_connection("default"):
-                uri = os.getenv("MILVUS_URI")
-                token = os.getenv("MILVUS_TOKEN")
-                connections.connect(
-                    alias="default",
-                    uri=uri,
-                    token=token,
-                    secure=True
-                )
-            
-            # 컬렉션 로드 (스레드당 한 번만)
-            thread_local.quotes_collection = Collection("meari_quotes")
-            thread_local.quotes_collection.load()
-            logger.info(f"Thread {threading.current_thread().name}: 인용문 컬렉션 로드")
-        
-        return thread_local.quotes_collection
+        return collection_registry.get("meari_quotes")
     except Exception as e:
         logger.error(f"인용문 컬렉션 가져오기 실패: {e}")
         raise
 
 
 def get_policies_collection() -> Collection:
-    """정책 컬렉션 가져오기 (스레드 세이프)"""
+    """정책 컬렉션 가져오기 (프로세스 전역 공유)"""
     try:
-        # 스레드별로 독립적인 컬렉션 객체 유지
-        if not hasattr(thread_local, 'policies_collection'):
-            # 연결 확인
-            if not connections.has_connection("default"):
-                uri = os.getenv("MILVUS_URI")
-                token = os.getenv("MILVUS_TOKEN")
-                connections.connect(
-                    alias="default",
-                    uri=uri,
-                    token=token,
-                    secure=True
-                )
-            
-            # 컬렉션 로드 (스레드당 한 번만)
-            thread_local.policies_collection = Collection("meari_policies")
-            thread_local.policies_collection.load()
-            logger.info(f"Thread {threading.current_thread().name}: 정책 컬렉션 로드")
-        
-        return thread_local.policies_collection
+        return collection_registry.get("meari_policies")
     except Exception as e:
         logger.error(f"정책 컬렉션 가져오기 실패: {e}")
-        raise
\ No newline at end of file
+        raise
+
+
+# Milvus 서버 오류 코드: 컬렉션 없음(재생성 중), 컬렉션 로드 안 됨
+_STALE_COLLECTION_CODES = {ErrorCode.COLLECTION_NOT_FOUND, 101}
+# 2.2 이하 서버의 레거시 오류 코드 (common.ErrorCode.CollectionNotExists)
+_LEGACY_COLLECTION_NOT_EXISTS = 4
+
+
+def _is_connection_error(e: MilvusException) -> bool:
+    """재연결로 해결되는 오류인지 (연결 없음, 서버 응답 없음)"""
+    if isinstance(e, (ConnectError, ConnectionNotExistException, MilvusUnavailableException)):
+        return True
+    # pymilvus 재시도 소진 시 gRPC 상태 코드를 그대로 담아 던짐
+    return e.code == grpc.StatusCode.UNAVAILABLE
+
+
+def _is_stale_collection_error(e: MilvusException) -> bool:
+    """핸들을 다시 로드하면 해결되는 오류인지 (컬렉션 재생성/스키마 변경/언로드)"""
+    if isinstance(e, (CollectionNotExistException, SchemaNotReadyException)):
+        return True
+    return e.code in _STALE_COLLECTION_CODES or e.compatible_code == _LEGACY_COLLECTION_NOT_EXISTS
+
+
+def _search_group(requests: List[VectorSearchRequest], vectors: List[List[float]]) -> List[List[Dict[str, Any]]]:
+    """같은 컬렉션/필터/top_k 요청을 한 번의 search 호출로 실행"""
+    head = requests[0]
+    search_kwargs = dict(
+        data=vectors,
+        anns_field=head.anns_field,
+        param=head.search_params,
+        limit=head.top_k,
+        expr=head.expr,
+        output_fields=head.output_fields or None
+    )
+    
+    try:
+        results = collection_registry.get(head.collection).search(**search_kwargs)
+    except MilvusException as e:
+        # 연결이 끊긴 경우 백오프 재연결, 컬렉션 재생성/언로드로 핸들이 낡은 경우 다시 로드 (한 번만)
+        # 잘못된 expr/파라미터, 타임아웃 등은 공유 연결을 건드리지 않고 그대로 전달
+        if _is_connection_error(e):
+            logger.warning(f"{head.collection} 검색 중 연결 끊김, 재연결 후 재시도: {e}")
+            milvus_manager.reconnect(collection_registry.alias)
+        elif _is_stale_collection_error(e):
+            logger.warning(f"{head.collection} 컬렉션 핸들 갱신 후 재시도: {e}")
+        else:
+            raise
+        results = collection_registry.refresh(head.collection).search(**search_kwargs)
+    
+    grouped_hits = []
+    for hits in results:
+        formatted = []
+        for hit in hits:
+            item = {"id": hit.id, "score": hit.score, "distance": hit.distance}
+            for field_name in head.output_fields:
+                item[field_name] = hit.entity.get(field_name)
+            formatted.append(item)
+        grouped_hits.append(formatted)
+    return grouped_hits
+
+
+def multi_search(
+    requests: List[VectorSearchRequest],
+    embed_fn: Optional[Callable[[List[str]], np.ndarray]] = None
+) -> List[List[Dict[str, Any]]]:
+    """
+    여러 벡터 검색을 한 번에 실행
+    
+    query_text가 있는 요청은 한 번의 배치 임베딩으로 벡터화하고,
+    같은 컬렉션/필터/top_k 요청은 하나의 search(data=[...]) 호출로 합친 뒤
+    서로 다른 그룹은 스레드 풀에서 동시에 검색합니다.
+    
+    Args:
+        requests: 검색 요청 리스트
+        embed_fn: 텍스트 배치 임베딩 함수 (기본값: 싱글톤 임베딩 모델)
+    
+    Returns:
+        요청 순서와 같은 순서의 검색 결과 리스트
+    """
+    if not requests:
+        return []
+    
+    if embed_fn is None:
+        embed_fn = embed_texts
+    
+    # 1. 쿼리 텍스트 배치 임베딩
+    vectors: List[Optional[List[float]]] = [None] * len(requests)
+    text_indexes = []
+    for i, request in enumerate(requests):
+        if request.vector is not None:
+            vectors[i] = list(request.vector)
+        elif request.query_text is not None:
+            text_indexes.append(i)
+        else:
+            raise ValueError("검색 요청에는 query_text 또는 vector가 필요합니다")
+    
+    if text_indexes:
+        embeddings = embed_fn([requests[i].query_text for i in text_indexes])
+        for i, embedding in zip(text_indexes, embeddings):
+            vectors[i] = embedding.tolist() if hasattr(embedding, "tolist") else list(embedding)
+    
+    # 2. 동일 조건 요청 그룹화
+    groups: Dict[Tuple, List[int]] = {}
+    for i, request in enumerate(requests):
+        groups.setdefault(request.group_key(), []).append(i)
+    
+    # 3. 그룹별 동시 검색
+    results: List[List[Dict[str, Any]]] = [[] for _ in requests]
+    if len(groups) == 1:
+        indexes = next(iter(groups.values()))
+        grouped_hits = _search_group([requests[i] for i in indexes], [vectors[i] for i in indexes])
+        for i, hits in zip(indexes, grouped_hits):
+            results[i] = hits
+        return results
+    
+    futures = {
+        _search_executor.submit(
+            _search_group,
+            [requests[i] for i in indexes],
+            [vectors[i] for i in indexes]
+        ): indexes
+        for indexes in groups.values()
+    }
+    for future, indexes in futures.items():
+        for i, hits in zip(indexes, future.result()):
+            results[i] = hits
+    
+    return results
+
+
+async def amulti_search(
+    requests: List[VectorSearchRequest],
+    embed_fn: Optional[Callable[[List[str]], np.ndarray]] = None
+) -> List[List[Dict[str, Any]]]:
+    """multi_search 비동기 버전 (I/O 레인에서 실행, 임베딩은 CPU 레인으로 넘어감)"""
+    return await run_io(multi_search, requests, embed_fn)
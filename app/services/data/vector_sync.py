@@ -0,0 +1,34 @@
+"""
+Milvus 증분 동기화 watermark
+컬렉션별로 마지막으로 적재한 원본 ID를 Postgres에 저장해 두고,
+다음 동기화는 그 이후 행만 읽습니다 (컬렉션 전체 ID 스캔 없음).
+"""
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.vector_sync import VectorSyncWatermark
+
+
+async def get_watermark(db: AsyncSession, collection_name: str) -> int:
+    """저장된 watermark (없으면 0)"""
+    result = await db.execute(
+        select(VectorSyncWatermark.watermark).where(VectorSyncWatermark.collection_name == collection_name)
+    )
+    return result.scalar() or 0
+
+
+async def save_watermark(db: AsyncSession, collection_name: str, watermark: int) -> None:
+    """
+    watermark 저장 (기존 값보다 작아지지 않음, 커밋은 호출자가 수행)
+
+    Milvus 적재가 끝난 뒤에 호출해야 중간에 실패해도 다음 실행이 빠진 행을 다시 적재합니다.
+    """
+    stmt = pg_insert(VectorSyncWatermark).values(collection_name=collection_name, watermark=watermark)
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=[VectorSyncWatermark.collection_name],
+        set_={
+            "watermark": func.greatest(VectorSyncWatermark.watermark, stmt.excluded.watermark),
+            "updated_at": func.now()
+        }
+    ))
@@ -0,0 +1,43 @@
+"""
+마음나무 카운터
+리츄얼 순번을 COUNT(*) 대신 heart_trees.ritual_count 한 행의 원자적 증가로 발급
+"""
+from uuid import UUID
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.checkin import HeartTree
+
+
+async def allocate_ritual_sequence(db: AsyncSession, user_id: UUID, grow_tree: bool = False) -> int:
+    """
+    다음 리츄얼 순번 발급 (마음나무가 없으면 생성)
+
+    INSERT ... ON CONFLICT DO UPDATE ... RETURNING 한 문장으로 처리하므로
+    동시 요청은 행 잠금으로 직렬화되어 같은 순번이 나오지 않습니다.
+
+    Args:
+        db: 데이터베이스 세션 (커밋은 호출자가 수행)
+        user_id: 사용자 ID
+        grow_tree: True면 마음나무 레벨도 새 순번으로 갱신
+
+    Returns:
+        새 리츄얼 순번 (1부터)
+    """
+    stmt = pg_insert(HeartTree).values(
+        user_id=user_id,
+        ritual_count=1,
+        growth_level=1 if grow_tree else 0,
+        last_grew_at=func.now() if grow_tree else None
+    )
+    new_count = HeartTree.ritual_count + 1
+    updates = {"ritual_count": new_count}
+    if grow_tree:
+        updates.update(growth_level=new_count, last_grew_at=func.now())
+
+    result = await db.execute(
+        stmt.on_conflict_do_update(index_elements=[HeartTree.user_id], set_=updates)
+        .returning(HeartTree.ritual_count)
+    )
+    return result.scalar_one()
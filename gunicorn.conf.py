@@ -0,0 +1,61 @@
+"""
+운영용 gunicorn 설정 (uvicorn 워커 여러 개)
+
+마스터가 앱과 임베딩 모델을 미리 로드(preload_app)한 뒤 워커를 fork하므로
+모델 메모리는 워커 수만큼 늘지 않고 copy-on-write로 공유됩니다.
+워커별 실제 메모리는 scripts/report_worker_memory.py로 확인합니다.
+
+비동기 작업 워커(JOB_WORKERS)는 API 워커마다 따로 뜨므로 gunicorn에서는 기본 0으로 두고
+작업 실행은 별도 프로세스(scripts/run_job_worker.py)가 맡습니다.
+
+워커마다 DB 커넥션 풀을 따로 가지므로, 인스턴스당 커넥션 상한(DB_CONNECTIONS_PER_INSTANCE)을
+워커 수로 나눠 워커별 DB_POOL_SIZE/DB_MAX_OVERFLOW 기본값을 정합니다.
+(인스턴스 수 x DB_CONNECTIONS_PER_INSTANCE + 작업 워커 풀이 Postgres max_connections보다 작아야 함)
+
+사용 예:
+  gunicorn app.main:app -c gunicorn.conf.py
+  WEB_CONCURRENCY=4 DB_CONNECTIONS_PER_INSTANCE=24 gunicorn app.main:app -c gunicorn.conf.py
+"""
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+# cpu_count()는 컨테이너 CPU 제한을 무시하고 호스트 코어 수를 돌려주므로 작은 고정값을 기본으로
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+
+# LLM 워크플로우 요청이 길어서 기본값(30초)보다 넉넉하게
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "180"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = 5
+
+# 앱 import(preload) 전에 적용: API 워커 수만큼 작업 워커가 곱해지지 않도록 작업 실행은 별도 프로세스로
+os.environ.setdefault("JOB_WORKERS", "0")
+
+# 앱 import(preload) 전에 적용: 워커별 풀 = 인스턴스 커넥션 상한 / 워커 수 (절반은 상시, 절반은 overflow)
+db_connections_per_worker = max(int(os.getenv("DB_CONNECTIONS_PER_INSTANCE", "20")) // workers, 2)
+os.environ.setdefault("DB_POOL_SIZE", str(db_connections_per_worker // 2))
+os.environ.setdefault("DB_MAX_OVERFLOW", str(db_connections_per_worker - db_connections_per_worker // 2))
+
+pidfile = os.getenv("GUNICORN_PIDFILE", "/tmp/gunicorn.pid")
+accesslog = "-"
+
+# 워커당 torch 연산 스레드 (기본: 코어를 워커 수로 나눈 값)
+torch_threads = int(os.getenv("TORCH_THREADS_PER_WORKER", max(multiprocessing.cpu_count() // workers, 1)))
+
+
+def when_ready(server):
+    """워커 fork 직전: 공유할 읽기 전용 상태 로드"""
+    from app.core.preload import preload_shared_state
+    preload_shared_state()
+    server.log.info(
+        f"공유 상태 로드 완료, 워커 {workers}개 fork "
+        f"(워커당 torch 스레드 {torch_threads}, DB 풀 {os.environ['DB_POOL_SIZE']}+{os.environ['DB_MAX_OVERFLOW']})"
+    )
+
+
+def post_fork(server, worker):
+    """fork 직후 워커: 소켓 자원과 스레드 설정 초기화"""
+    from app.core.preload import reset_after_fork
+    reset_after_fork(torch_threads)
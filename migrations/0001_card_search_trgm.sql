@@ -0,0 +1,9 @@
+-- 카드 검색: content 문자열 값을 생성 컬럼으로 두고 pg_trgm GIN 인덱스로 부분 일치 검색
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+ALTER TABLE generated_cards
+    ADD COLUMN IF NOT EXISTS search_text TEXT
+    GENERATED ALWAYS AS (jsonb_path_query_array(content, 'strict $.** ? (@.type() == "string")')::text) STORED;
+
+CREATE INDEX IF NOT EXISTS ix_generated_cards_search_text_trgm
+    ON generated_cards USING gin (search_text gin_trgm_ops);
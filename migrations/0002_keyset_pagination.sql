@@ -0,0 +1,6 @@
+-- 세션 이력/카드 검색 키셋 페이지네이션: (user_id, created_at, id) 정렬 인덱스
+CREATE INDEX IF NOT EXISTS ix_meari_sessions_user_created_id
+    ON meari_sessions (user_id, created_at, id);
+
+CREATE INDEX IF NOT EXISTS ix_generated_cards_user_created_id
+    ON generated_cards (user_id, created_at, id);
@@ -0,0 +1,31 @@
+-- 자주 쓰는 조회 조건에 대한 보조 인덱스
+-- meari_sessions(user_id, created_at)은 0002의 (user_id, created_at, id)로,
+-- rituals(user_id, checkin_date)는 _user_ritual_date_uc 유니크 제약 인덱스로 이미 처리됨
+
+-- 카드 타입 필터 검색
+CREATE INDEX IF NOT EXISTS ix_generated_cards_user_type_created
+    ON generated_cards (user_id, card_type, created_at);
+
+-- 세션별 카드 조회/개수 (일자 상세, 세션 이력)
+CREATE INDEX IF NOT EXISTS ix_generated_cards_session_id
+    ON generated_cards (session_id);
+
+-- 최신 페르소나 조회 (부분 인덱스)
+CREATE INDEX IF NOT EXISTS ix_ai_persona_histories_user_latest
+    ON ai_persona_histories (user_id)
+    WHERE is_latest;
+
+-- 페르소나 진화 이력
+CREATE INDEX IF NOT EXISTS ix_ai_persona_histories_user_event_date
+    ON ai_persona_histories (user_id, event_date);
+
+-- 인증 조회
+CREATE INDEX IF NOT EXISTS ix_user_sessions_session_expires
+    ON user_sessions (session_id, expires_at);
+
+CREATE INDEX IF NOT EXISTS ix_user_sessions_user_id
+    ON user_sessions (user_id);
+
+-- 인용문 → 뉴스 조회
+CREATE INDEX IF NOT EXISTS ix_news_quotes_news_id
+    ON news_quotes (news_id);
@@ -0,0 +1,16 @@
+-- 최신 페르소나 포인터 테이블 (is_latest 플래그 갱신 대체)
+CREATE TABLE IF NOT EXISTS user_latest_personas (
+    user_id UUID PRIMARY KEY REFERENCES users (id) ON DELETE CASCADE,
+    persona_history_id BIGINT NOT NULL REFERENCES ai_persona_histories (id) ON DELETE CASCADE,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+);
+
+-- 기존 데이터 이전: is_latest 행, 없으면 가장 마지막 이력
+INSERT INTO user_latest_personas (user_id, persona_history_id)
+SELECT DISTINCT ON (user_id) user_id, id
+FROM ai_persona_histories
+ORDER BY user_id, is_latest DESC, id DESC
+ON CONFLICT (user_id) DO NOTHING;
+
+-- is_latest로 조회하지 않으므로 부분 인덱스 제거
+DROP INDEX IF EXISTS ix_ai_persona_histories_user_latest;
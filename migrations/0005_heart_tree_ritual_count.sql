@@ -0,0 +1,10 @@
+-- 사용자별 리츄얼 순번 카운터 (COUNT(*) 대체)
+ALTER TABLE heart_trees
+    ADD COLUMN IF NOT EXISTS ritual_count INTEGER NOT NULL DEFAULT 0;
+
+-- 기존 데이터 이전: 마지막 순번 기준 (중간에 빈 순번이 있어도 중복 발급되지 않도록)
+INSERT INTO heart_trees (user_id, ritual_count)
+SELECT user_id, max(ritual_sequence)
+FROM rituals
+GROUP BY user_id
+ON CONFLICT (user_id) DO UPDATE SET ritual_count = EXCLUDED.ritual_count;
@@ -0,0 +1,44 @@
+-- 사용자 날짜별 활동 요약 (캘린더/연속 기록/통계 조회용)
+CREATE TABLE IF NOT EXISTS user_daily_activity (
+    user_id UUID NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+    day DATE NOT NULL,
+    daily_ritual_id BIGINT,
+    daily_ritual_title VARCHAR(200),
+    daily_ritual_type VARCHAR(50),
+    daily_completed BOOLEAN NOT NULL DEFAULT false,
+    daily_mood VARCHAR(50),
+    meari_ritual_id BIGINT,
+    meari_completed BOOLEAN NOT NULL DEFAULT false,
+    meari_mood VARCHAR(50),
+    streak_length INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+    PRIMARY KEY (user_id, day)
+);
+
+-- 기존 데이터 이전: 사용자/날짜당 DailyRitual, Ritual 각각 최대 1건
+INSERT INTO user_daily_activity (
+    user_id, day,
+    daily_ritual_id, daily_ritual_title, daily_ritual_type, daily_completed, daily_mood,
+    meari_ritual_id, meari_completed, meari_mood
+)
+SELECT
+    coalesce(d.user_id, r.user_id),
+    coalesce(d.date, r.checkin_date),
+    d.id, d.ritual_title, d.ritual_type, coalesce(d.is_completed, false), d.user_mood,
+    r.id, coalesce(r.ritual_completed, false), r.selected_mood
+FROM daily_rituals d
+FULL OUTER JOIN rituals r ON r.user_id = d.user_id AND r.checkin_date = d.date
+ON CONFLICT (user_id, day) DO NOTHING;
+
+-- 연속 일수: 완료된 날짜를 연속 구간으로 묶어 구간 내 순번 부여
+UPDATE user_daily_activity u
+SET streak_length = s.streak
+FROM (
+    SELECT user_id, day, row_number() OVER (PARTITION BY user_id, grp ORDER BY day) AS streak
+    FROM (
+        SELECT user_id, day, day - (row_number() OVER (PARTITION BY user_id ORDER BY day))::int AS grp
+        FROM user_daily_activity
+        WHERE daily_completed
+    ) completed
+) s
+WHERE u.user_id = s.user_id AND u.day = s.day;
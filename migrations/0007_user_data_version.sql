@@ -0,0 +1,3 @@
+-- 사용자별 데이터 버전 (쓰기마다 증가, ETag 생성용)
+ALTER TABLE users
+    ADD COLUMN IF NOT EXISTS data_version BIGINT NOT NULL DEFAULT 0;
@@ -0,0 +1,28 @@
+-- 비동기 워크플로우 작업 큐 (FOR UPDATE SKIP LOCKED로 여러 워커/노드가 나눠 처리)
+CREATE TABLE IF NOT EXISTS workflow_jobs (
+    id UUID PRIMARY KEY,
+    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    job_type VARCHAR(50) NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'queued',
+    stage VARCHAR(50),
+    payload JSONB NOT NULL,
+    result JSONB,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 1,
+    worker_id VARCHAR(100),
+    heartbeat_at TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+    started_at TIMESTAMP WITH TIME ZONE,
+    finished_at TIMESTAMP WITH TIME ZONE,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS ix_workflow_jobs_queued_created
+    ON workflow_jobs (created_at) WHERE status = 'queued';
+
+CREATE INDEX IF NOT EXISTS ix_workflow_jobs_running_heartbeat
+    ON workflow_jobs (heartbeat_at) WHERE status = 'running';
+
+CREATE INDEX IF NOT EXISTS ix_workflow_jobs_user_id
+    ON workflow_jobs (user_id);
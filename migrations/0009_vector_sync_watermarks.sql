@@ -0,0 +1,6 @@
+-- Milvus 증분 동기화 watermark (컬렉션 전체 ID 스캔 대신 저장된 값 사용)
+CREATE TABLE IF NOT EXISTS vector_sync_watermarks (
+    collection_name VARCHAR(100) PRIMARY KEY,
+    watermark BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+);
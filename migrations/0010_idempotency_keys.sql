@@ -0,0 +1,16 @@
+-- 멱등성 키 선점/완료 응답 (INSERT ... ON CONFLICT로 워커 간 중복 실행 방지)
+CREATE TABLE IF NOT EXISTS idempotency_keys (
+    id BIGSERIAL PRIMARY KEY,
+    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    scope VARCHAR(500) NOT NULL,
+    key VARCHAR(300) NOT NULL,
+    fingerprint VARCHAR(64) NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'processing',
+    status_code INTEGER,
+    body BYTEA,
+    media_type VARCHAR(100),
+    headers JSONB,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+    expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    CONSTRAINT _user_scope_idempotency_key_uc UNIQUE (user_id, scope, key)
+);
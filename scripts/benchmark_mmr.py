@@ -0,0 +1,110 @@
+"""
+공감 카드 인용문 다양화(MMR) 벤치마크
+
+인용문 코퍼스에서 쿼리별 상위 후보(fetch개)를 brute-force로 뽑은 뒤
+  - baseline: 검색 순서대로 상위 3개 (기존 방식)
+  - mmr     : lambda별 MMR 선택
+의 평균 관련도, 선택된 인용문끼리의 평균 유사도(낮을수록 다양),
+거의 같은 인용문이 함께 뽑힌 비율, 선택 지연시간을 비교합니다.
+
+사용 예:
+  python scripts/benchmark_mmr.py --corpus-size 5000
+  python scripts/benchmark_mmr.py --synthetic --fetch 5,6,7,10 --lambdas 0.5,0.7,0.9
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.services.data.diversity import mmr_select
+from scripts.benchmark_vector_index import (
+    brute_force_topk, build_query_texts, embed, load_quote_texts, synthetic_vectors
+)
+
+
+def baseline_select(relevance: np.ndarray, k: int) -> List[int]:
+    return list(range(min(k, len(relevance))))
+
+
+def evaluate(corpus: np.ndarray, queries: np.ndarray, candidates: np.ndarray, select_fn, k: int, dup_threshold: float) -> Dict[str, float]:
+    """선택 결과의 관련도/다양성/지연시간 집계"""
+    relevance_sum = 0.0
+    pairwise_sum = 0.0
+    duplicate_lists = 0
+    latencies = []
+
+    for query, candidate_ids in zip(queries, candidates):
+        vectors = corpus[candidate_ids]
+        relevance = vectors @ query
+
+        started = time.perf_counter()
+        selected = select_fn(vectors, relevance, k)
+        latencies.append((time.perf_counter() - started) * 1e6)
+
+        chosen = vectors[selected]
+        relevance_sum += float(relevance[selected].mean())
+
+        sim = chosen @ chosen.T
+        upper = sim[np.triu_indices(len(selected), k=1)]
+        if len(upper):
+            pairwise_sum += float(upper.mean())
+            duplicate_lists += int((upper >= dup_threshold).any())
+
+    n = len(queries)
+    return {
+        "relevance": relevance_sum / n,
+        "pairwise": pairwise_sum / n,
+        "dup_rate": duplicate_lists / n,
+        "p50_us": float(np.percentile(latencies, 50)),
+    }
+
+
+async def main(args):
+    if args.synthetic:
+        print(f"합성 코퍼스 생성: {args.corpus_size}개 x {args.dim}차원")
+        corpus = synthetic_vectors(args.corpus_size, args.dim)
+        queries = synthetic_vectors(args.num_queries, args.dim, seed=7)
+    else:
+        print("인용문 로드 및 임베딩 중...")
+        corpus = embed(await load_quote_texts(args.corpus_size))
+        queries = embed(build_query_texts())
+
+    fetch_sizes = [int(f) for f in args.fetch.split(",")]
+    lambdas = [float(l) for l in args.lambdas.split(",")]
+    candidates_all = brute_force_topk(corpus, queries, max(fetch_sizes))
+    print(f"코퍼스 {corpus.shape[0]}개, 쿼리 {queries.shape[0]}개, 선택 {args.k}개, 중복 기준 {args.dup_threshold}")
+
+    print(f"\n{'fetch':>5} {'method':<12} {'relevance':>10} {'pairwise':>9} {'dup_rate':>9} {'p50(us)':>8}")
+    print("-" * 58)
+    for fetch in fetch_sizes:
+        candidates = candidates_all[:, :fetch]
+        rows = [("baseline", lambda v, r, k: baseline_select(r, k))]
+        for lam in lambdas:
+            rows.append((f"mmr λ={lam}", lambda v, r, k, lam=lam: mmr_select(v, k, relevance=r, lambda_mult=lam)))
+
+        for label, select_fn in rows:
+            stats = evaluate(corpus, queries, candidates, select_fn, args.k, args.dup_threshold)
+            print(
+                f"{fetch:>5} {label:<12} {stats['relevance']:>10.4f} {stats['pairwise']:>9.4f} "
+                f"{stats['dup_rate']:>9.3f} {stats['p50_us']:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="공감 카드 인용문 MMR 다양화 벤치마크")
+    parser.add_argument("--corpus-size", type=int, default=10000)
+    parser.add_argument("--k", type=int, default=3, help="선택할 인용문 수")
+    parser.add_argument("--fetch", default="5,6,7,10", help="쉼표로 구분한 후보 검색 개수")
+    parser.add_argument("--lambdas", default="0.5,0.6,0.7,0.8,0.9", help="쉼표로 구분한 MMR lambda")
+    parser.add_argument("--dup-threshold", type=float, default=0.9, help="거의 같은 인용문으로 볼 코사인 유사도")
+    parser.add_argument("--synthetic", action="store_true", help="DB/임베딩 모델 없이 합성 벡터로 측정")
+    parser.add_argument("--dim", type=int, default=1024, help="합성 벡터 차원")
+    parser.add_argument("--num-queries", type=int, default=200, help="합성 쿼리 수")
+
+    asyncio.run(main(parser.parse_args()))
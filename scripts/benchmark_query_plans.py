@@ -0,0 +1,326 @@
+"""
+엔드포인트 쿼리 실행 계획 회귀 벤치마크
+
+전용(벤치마크용) PostgreSQL DB에 합성 데이터를 사용자 수 기준으로 채우고,
+주요 엔드포인트 쿼리를 EXPLAIN (ANALYZE, FORMAT JSON)으로 실행해
+큰 테이블에 Seq Scan이 없는지(인덱스를 타는지) 확인합니다.
+하나라도 Seq Scan이 나오면 종료 코드 1로 끝납니다.
+
+사용 예:
+  python scripts/benchmark_query_plans.py --database-url postgresql://localhost/meari_bench --users 10000
+  python scripts/benchmark_query_plans.py --database-url postgresql://localhost/meari_bench --users 100000 --reseed
+"""
+import argparse
+import os
+import sys
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+# 이 행 수 이상인 테이블에서 Seq Scan이 나오면 실패로 처리
+LARGE_TABLE_ROWS = 10000
+
+SESSIONS_PER_USER = 5
+CARDS_PER_SESSION = 3
+RITUALS_PER_USER = 10
+PERSONAS_PER_USER = 3
+QUOTES_PER_USER = 2
+
+SEED_SQL = [
+    # 사용자 + 로그인 세션 + 마음나무
+    """
+    INSERT INTO users (id, social_provider, social_id, email, nickname)
+    SELECT gen_random_uuid(), 'bench', i::text, 'bench' || i || '@example.com', '벤치' || i
+    FROM generate_series(1, :users) AS i
+    """,
+    """
+    INSERT INTO user_sessions (session_id, user_id, expires_at)
+    SELECT 'bench-' || u.social_id, u.id, now() + interval '7 days'
+    FROM users u WHERE u.social_provider = 'bench'
+    """,
+    """
+    INSERT INTO heart_trees (user_id, growth_level)
+    SELECT u.id, (random() * 28)::int FROM users u WHERE u.social_provider = 'bench'
+    """,
+    # 메아리 세션 + 카드
+    f"""
+    INSERT INTO meari_sessions (id, user_id, selected_tag_ids, created_at)
+    SELECT gen_random_uuid(), u.id, '[1, 4]'::jsonb, now() - (s * interval '1 day') - random() * interval '1 day'
+    FROM users u CROSS JOIN generate_series(1, {SESSIONS_PER_USER}) AS s
+    WHERE u.social_provider = 'bench'
+    """,
+    f"""
+    INSERT INTO generated_cards (session_id, user_id, card_type, sub_type, content, growth_context, created_at)
+    SELECT
+        ms.id, ms.user_id,
+        (ARRAY['empathy', 'reflection', 'growth'])[c],
+        CASE WHEN c = 3 THEN 'information' END,
+        jsonb_build_object(
+            'title', (ARRAY['번아웃 극복하기', '불안한 마음 다독이기', '관계 회복 연습'])[1 + (random() * 2)::int],
+            'content', '오늘의 카드 ' || md5(random()::text)
+        ),
+        'initial',
+        ms.created_at
+    FROM meari_sessions ms CROSS JOIN generate_series(1, {CARDS_PER_SESSION}) AS c
+    JOIN users u ON u.id = ms.user_id
+    WHERE u.social_provider = 'bench'
+    """,
+    # 리츄얼 (메아리 일기 + 일일 리츄얼)
+    f"""
+    INSERT INTO rituals (user_id, ritual_sequence, diary_entry, selected_mood, ritual_completed, checkin_date)
+    SELECT u.id, r, '일기', (ARRAY['happy', 'calm', 'tired'])[1 + (random() * 2)::int], true, current_date - r
+    FROM users u CROSS JOIN generate_series(1, {RITUALS_PER_USER}) AS r
+    WHERE u.social_provider = 'bench'
+    """,
+    f"""
+    INSERT INTO daily_rituals (user_id, date, ritual_title, ritual_type, is_completed, user_mood)
+    SELECT u.id, current_date - r, '10분 명상', 'meditation', random() < 0.7, 'calm'
+    FROM users u CROSS JOIN generate_series(1, {RITUALS_PER_USER}) AS r
+    WHERE u.social_provider = 'bench'
+    """,
+    # 날짜별 활동 요약
+    """
+    INSERT INTO user_daily_activity (user_id, day, daily_ritual_id, daily_completed, meari_ritual_id, meari_completed)
+    SELECT coalesce(d.user_id, r.user_id), coalesce(d.date, r.checkin_date),
+           d.id, coalesce(d.is_completed, false), r.id, coalesce(r.ritual_completed, false)
+    FROM daily_rituals d
+    FULL OUTER JOIN rituals r ON r.user_id = d.user_id AND r.checkin_date = d.date
+    JOIN users u ON u.id = coalesce(d.user_id, r.user_id)
+    WHERE u.social_provider = 'bench'
+    """,
+    # 페르소나 이력 + 최신 포인터 (마지막 이력)
+    f"""
+    INSERT INTO ai_persona_histories (user_id, persona_data, event_type, event_date)
+    SELECT u.id, '{{"depth": "surface", "summary": "요약"}}'::jsonb, 'ritual_update',
+           current_date - ({PERSONAS_PER_USER} - p)
+    FROM users u CROSS JOIN generate_series(1, {PERSONAS_PER_USER}) AS p
+    WHERE u.social_provider = 'bench'
+    """,
+    """
+    INSERT INTO user_latest_personas (user_id, persona_history_id)
+    SELECT DISTINCT ON (ph.user_id) ph.user_id, ph.id
+    FROM ai_persona_histories ph JOIN users u ON u.id = ph.user_id
+    WHERE u.social_provider = 'bench'
+    ORDER BY ph.user_id, ph.id DESC
+    """,
+    # 인용문
+    f"""
+    INSERT INTO news_quotes (news_id, quote_text, quote_type)
+    SELECT 'bench-news-' || (i / 3), '인용문 ' || i, 'direct'
+    FROM generate_series(1, :users * {QUOTES_PER_USER}) AS i
+    """,
+]
+
+BENCH_TABLES = [
+    "news_quotes", "user_latest_personas", "ai_persona_histories", "user_daily_activity",
+    "daily_rituals", "rituals",
+    "generated_cards", "meari_sessions", "heart_trees", "user_sessions",
+]
+
+
+# ========== DB 준비 ==========
+
+def prepare_schema(engine):
+    """테이블 생성 + 마이그레이션 적용"""
+    from sqlalchemy import text
+    from app.core.database import Base
+    from app.db.migrate import list_migrations, split_statements
+    import app.models  # noqa: F401 (모든 모델 등록)
+
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        Base.metadata.create_all(conn)
+        for path in list_migrations():
+            for statement in split_statements(path.read_text(encoding="utf-8")):
+                conn.execute(text(statement))
+
+
+def seed(engine, users: int, reseed: bool):
+    """합성 데이터 생성 (이미 같은 규모면 건너뜀)"""
+    from sqlalchemy import text
+
+    with engine.begin() as conn:
+        existing = conn.execute(text("SELECT count(*) FROM users WHERE social_provider = 'bench'")).scalar()
+        if existing == users and not reseed:
+            print(f"기존 합성 데이터 사용: 사용자 {existing}명")
+            return
+
+        print(f"합성 데이터 생성 중: 사용자 {users}명")
+        conn.execute(text("DELETE FROM news_quotes WHERE news_id LIKE 'bench-news-%'"))
+        conn.execute(text("DELETE FROM users WHERE social_provider = 'bench'"))
+        for sql in SEED_SQL:
+            started = time.perf_counter()
+            conn.execute(text(sql), {"users": users})
+            print(f"  {sql.split()[2]:<22} {time.perf_counter() - started:6.1f}s")
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for table in BENCH_TABLES + ["users"]:
+            conn.execute(text(f"ANALYZE {table}"))
+
+
+def large_tables(engine) -> set:
+    from sqlalchemy import text
+
+    with engine.connect() as conn:
+        rows = conn.execute(text(
+            "SELECT relname FROM pg_class WHERE relkind = 'r' AND reltuples >= :rows"
+        ), {"rows": LARGE_TABLE_ROWS})
+        return {row[0] for row in rows}
+
+
+# ========== 엔드포인트 쿼리 ==========
+
+def sample_context(engine) -> Dict:
+    """쿼리 파라미터로 쓸 임의 사용자/세션"""
+    from sqlalchemy import text
+
+    with engine.connect() as conn:
+        row = conn.execute(text("""
+            SELECT u.id, us.session_id, ms.id AS meari_session_id, ms.created_at
+            FROM users u
+            JOIN user_sessions us ON us.user_id = u.id
+            JOIN meari_sessions ms ON ms.user_id = u.id
+            WHERE u.social_provider = 'bench'
+            ORDER BY random() LIMIT 1
+        """)).one()
+    return {
+        "user_id": row.id,
+        "session_id": row.session_id,
+        "meari_session_id": row.meari_session_id,
+        "cursor_created_at": row.created_at,
+    }
+
+
+def endpoint_queries(ctx: Dict) -> List[Tuple[str, object]]:
+    """엔드포인트와 같은 형태의 쿼리 목록"""
+    from sqlalchemy import select, func, desc, tuple_
+    from app.core.auth import build_session_user_query
+    from app.api.v1.dashboard import build_dashboard_stats_query
+    from app.services.activity import build_daily_activity_query
+    from app.models.card import MeariSession, GeneratedCard
+    from app.models.checkin import AIPersonaHistory, Ritual, UserLatestPersona
+    from app.models.news import NewsQuote
+
+    user_id = ctx["user_id"]
+    today = date.today()
+    first_day = date(today.year, today.month, 1)
+
+    card_count = select(func.count(GeneratedCard.id)).where(
+        GeneratedCard.session_id == MeariSession.id
+    ).correlate(MeariSession).scalar_subquery()
+    session_page = select(
+        MeariSession.id, MeariSession.created_at, card_count.label("card_count")
+    ).where(
+        MeariSession.user_id == user_id,
+        tuple_(MeariSession.created_at, MeariSession.id) < tuple_(ctx["cursor_created_at"], uuid.UUID(int=2**128 - 1))
+    ).order_by(desc(MeariSession.created_at), desc(MeariSession.id)).limit(21)
+
+    card_filter = select(GeneratedCard).where(
+        GeneratedCard.user_id == user_id,
+        GeneratedCard.card_type == "growth"
+    ).order_by(desc(GeneratedCard.created_at)).limit(21)
+
+    card_keyword = select(GeneratedCard).where(
+        GeneratedCard.search_text.ilike("%번아웃%")
+    ).order_by(desc(func.similarity(GeneratedCard.search_text, "번아웃"))).limit(21)
+
+    day_cards = select(GeneratedCard).where(GeneratedCard.session_id == ctx["meari_session_id"])
+
+    latest_persona = select(AIPersonaHistory).join(
+        UserLatestPersona, UserLatestPersona.persona_history_id == AIPersonaHistory.id
+    ).where(UserLatestPersona.user_id == user_id)
+    persona_history = select(AIPersonaHistory).where(
+        AIPersonaHistory.user_id == user_id
+    ).order_by(AIPersonaHistory.event_date)
+
+    ritual_on_date = select(Ritual).where(
+        Ritual.user_id == user_id,
+        Ritual.checkin_date == today - timedelta(days=1)
+    )
+
+    quotes_by_news = select(NewsQuote).where(NewsQuote.news_id == "bench-news-42").limit(1)
+
+    return [
+        ("auth.session_user", build_session_user_query(ctx["session_id"])),
+        ("dashboard.stats", build_dashboard_stats_query(user_id, today)),
+        ("calendar.activity", build_daily_activity_query(user_id, [(first_day, today)])),
+        ("history.sessions", session_page),
+        ("history.day_cards", day_cards),
+        ("history.cards_by_type", card_filter),
+        ("history.cards_keyword", card_keyword),
+        ("history.persona_latest", latest_persona),
+        ("history.persona_evolution", persona_history),
+        ("calendar.ritual_on_date", ritual_on_date),
+        ("empathy.quote_news", quotes_by_news),
+    ]
+
+
+# ========== 실행 계획 검사 ==========
+
+def walk_plan(node: Dict, found: List[Tuple[str, str]]):
+    relation = node.get("Relation Name")
+    if relation:
+        found.append((node["Node Type"], relation))
+    for child in node.get("Plans", []):
+        walk_plan(child, found)
+
+
+def explain(engine, stmt) -> Tuple[float, List[Tuple[str, str]]]:
+    """EXPLAIN (ANALYZE)로 실행 시간과 스캔 노드 목록 반환"""
+    compiled = stmt.compile(dialect=engine.dialect)
+    with engine.connect() as conn:
+        result = conn.exec_driver_sql(
+            "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + str(compiled),
+            compiled.params
+        )
+        plan = result.scalar()[0]
+
+    scans: List[Tuple[str, str]] = []
+    walk_plan(plan["Plan"], scans)
+    return plan["Execution Time"], scans
+
+
+def main(args) -> int:
+    # app 모듈이 같은 DB를 보도록 import 전에 설정
+    os.environ["DATABASE_URL"] = args.database_url
+    from sqlalchemy import create_engine
+
+    sync_url = args.database_url.replace("postgresql+asyncpg://", "postgresql://")
+    engine = create_engine(sync_url)
+
+    prepare_schema(engine)
+    seed(engine, args.users, args.reseed)
+    checked = large_tables(engine)
+    ctx = sample_context(engine)
+
+    print(f"\nSeq Scan 검사 대상 (>= {LARGE_TABLE_ROWS}행): {', '.join(sorted(checked))}")
+    print(f"\n{'query':<28} {'time(ms)':>9}  {'result':<6} scans")
+    print("-" * 90)
+
+    failures = 0
+    for name, stmt in endpoint_queries(ctx):
+        elapsed_ms, scans = explain(engine, stmt)
+        bad = [relation for node_type, relation in scans if node_type == "Seq Scan" and relation in checked]
+        failures += bool(bad)
+        summary = ", ".join(f"{node_type}({relation})" for node_type, relation in scans)
+        print(f"{name:<28} {elapsed_ms:>9.2f}  {'FAIL' if bad else 'ok':<6} {summary}")
+
+    print()
+    if failures:
+        print(f"{failures}개 쿼리가 큰 테이블을 Seq Scan 합니다")
+        return 1
+    print("모든 쿼리가 인덱스를 사용합니다")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="엔드포인트 쿼리 EXPLAIN 회귀 벤치마크")
+    parser.add_argument("--database-url", required=True, help="벤치마크 전용 DB URL (데이터가 추가/삭제됩니다)")
+    parser.add_argument("--users", type=int, default=10000, help="합성 사용자 수 (예: 10000, 100000)")
+    parser.add_argument("--reseed", action="store_true", help="기존 합성 데이터를 지우고 다시 생성")
+
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,174 @@
+"""
+카드 응답 직렬화/압축 벤치마크
+
+대표적인 카드 payload(세션 카드, 성장 카드, 카드 검색 결과)를 만들어
+기존 경로(Pydantic 검증 + 표준 json)와 새 경로(model_construct + orjson)의
+응답당 소요 시간과 응답 크기, gzip/brotli 압축 후 크기를 비교합니다.
+DB나 외부 API 없이 실행됩니다.
+
+사용 예:
+  python scripts/benchmark_serialization.py
+  python scripts/benchmark_serialization.py --search-cards 100 --iterations 2000
+"""
+import argparse
+import gzip
+import json
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.core.responses import dumps
+from app.schemas.history import CardSearchResponse
+from app.schemas.meari import GrowthContentResponse, MeariSessionResponse, PersonaData
+
+try:
+    import brotli
+except ImportError:  # brotli 미설치 시 gzip만 측정
+    brotli = None
+
+SAMPLE_TEXT = (
+    "오늘 하루도 버텨낸 당신에게 작은 응원을 보냅니다. 지금 느끼는 감정은 자연스러운 것이며, "
+    "천천히 숨을 고르고 스스로를 돌보는 시간을 가져보세요. "
+)
+
+
+def _card(card_type: str, index: int) -> Dict[str, Any]:
+    return {
+        "type": card_type,
+        "title": f"{card_type} 카드 {index}",
+        "content": SAMPLE_TEXT * 3,
+        "tags": ["위로", "성장", "회복"],
+        "source": {"name": "메아리", "url": f"https://example.com/{card_type}/{index}"},
+    }
+
+
+def _persona() -> Dict[str, Any]:
+    return {
+        "depth": "understanding",
+        "depth_label": "이해",
+        "summary": SAMPLE_TEXT,
+        "characteristics": ["성실함", "섬세함", "책임감"],
+        "needs": ["휴식", "인정", "연결"],
+        "growth_direction": "자기 돌봄을 우선순위에 두기",
+    }
+
+
+def build_payloads(search_cards: int) -> Dict[str, Tuple[type, Dict[str, Any]]]:
+    """응답 모델과 필드 (엔드포인트에서 만드는 형태 그대로)"""
+    now = datetime.utcnow()
+    session_id = uuid.uuid4()
+    return {
+        "meari_session": (MeariSessionResponse, {
+            "status": "success",
+            "session_type": "initial",
+            "timestamp": now,
+            "session_id": session_id,
+            "cards": {
+                "empathy": _card("empathy", 1),
+                "reflection": _card("reflection", 1),
+            },
+            "persona": _persona(),
+            "next_action": "growth_content",
+        }),
+        "growth_content": (GrowthContentResponse, {
+            "status": "success",
+            "content_type": "growth",
+            "timestamp": now,
+            "cards": {
+                "information": _card("information", 1),
+                "experience": _card("experience", 1),
+                "support": _card("support", 1),
+            },
+        }),
+        "card_search": (CardSearchResponse, {
+            "total": search_cards * 5,
+            "page": 1,
+            "limit": search_cards,
+            "next_cursor": None,
+            "cards": [{
+                "id": i,
+                "session_id": session_id,
+                "card_type": "empathy" if i % 2 else "reflection",
+                "sub_type": None,
+                "content": _card("search", i),
+                "growth_context": {"depth": "insight", "emotions": ["불안", "안도"]},
+                "created_at": now - timedelta(days=i),
+            } for i in range(search_cards)],
+        }),
+    }
+
+
+def render_legacy(model: type, fields: Dict[str, Any]) -> bytes:
+    """기존 경로: 모델 검증 -> jsonable 변환 -> 표준 json"""
+    instance = model(**fields)
+    return json.dumps(
+        instance.model_dump(mode="json"),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def render_trusted(model: type, fields: Dict[str, Any]) -> bytes:
+    """새 경로: 세션 응답은 페르소나만 검증, 나머지는 model_construct + orjson"""
+    if "persona" in fields:
+        fields = {**fields, "persona": PersonaData.model_validate(fields["persona"])}
+    return dumps(model.model_construct(**fields))
+
+
+def measure(render: Callable[[type, Dict[str, Any]], bytes], model: type,
+            fields: Dict[str, Any], iterations: int) -> Tuple[float, bytes]:
+    """응답 1건당 평균 소요 시간(us)과 마지막 본문"""
+    body = render(model, fields)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        body = render(model, fields)
+    elapsed = time.perf_counter() - start
+    return elapsed / iterations * 1_000_000, body
+
+
+def compressed_sizes(body: bytes) -> List[str]:
+    sizes = [f"gzip {len(gzip.compress(body, compresslevel=9)):>7,}B"]
+    if brotli is not None:
+        compressed = brotli.compress(body, quality=settings.BROTLI_QUALITY)
+        sizes.append(f"br(q{settings.BROTLI_QUALITY}) {len(compressed):>7,}B")
+    return sizes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="카드 응답 직렬화/압축 벤치마크")
+    parser.add_argument("--iterations", type=int, default=1000, help="payload별 반복 횟수")
+    parser.add_argument("--search-cards", type=int, default=50, help="카드 검색 응답의 카드 수")
+    args = parser.parse_args()
+
+    print(f"반복 {args.iterations}회, 압축 최소 크기 {settings.COMPRESSION_MIN_SIZE}B")
+    if brotli is None:
+        print("(brotli 미설치 - gzip만 측정)")
+    print()
+
+    for name, (model, fields) in build_payloads(args.search_cards).items():
+        legacy_us, legacy_body = measure(render_legacy, model, fields, args.iterations)
+        trusted_us, trusted_body = measure(render_trusted, model, fields, args.iterations)
+
+        # 두 경로의 응답 내용이 같아야 함 (키 순서/공백 차이만 허용)
+        if json.loads(legacy_body) != json.loads(trusted_body):
+            print(f"[{name}] 경고: 두 경로의 응답 내용이 다릅니다")
+
+        print(f"[{name}]")
+        print(f"  legacy : {legacy_us:9.1f}us  {len(legacy_body):>7,}B  " + "  ".join(compressed_sizes(legacy_body)))
+        print(f"  trusted: {trusted_us:9.1f}us  {len(trusted_body):>7,}B  " + "  ".join(compressed_sizes(trusted_body)))
+        print(f"  speedup: x{legacy_us / trusted_us:.1f}")
+        print()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
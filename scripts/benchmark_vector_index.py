@@ -0,0 +1,293 @@
+"""
+벡터 인덱스 프로필 recall/latency 벤치마크
+
+인용문 코퍼스를 임베딩한 뒤 인덱스 프로필(FLAT, IVF_FLAT, IVF_SQ8, HNSW)별로
+인덱스를 만들고, 태그 컨텍스트에서 만든 쿼리 세트를 재생하여
+brute-force 정답 대비 recall@k 와 p50/p95 지연시간을 측정합니다.
+
+백엔드:
+  - milvus: Milvus 서버 또는 Milvus-Lite (--uri ./milvus_bench.db)
+            임시 컬렉션 bench_<profile>을 만들고 측정 후 삭제
+  - local : NumPy 기반 프로세스 내 대체 구현 (FLAT / IVF_FLAT / IVF_SQ8,
+            hnswlib가 설치되어 있으면 HNSW 포함)
+
+사용 예:
+  python scripts/benchmark_vector_index.py --backend local --corpus-size 5000
+  python scripts/benchmark_vector_index.py --backend milvus --uri ./milvus_bench.db --profiles flat,hnsw
+"""
+import argparse
+import asyncio
+import itertools
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.services.data.vector_store import INDEX_PROFILES, build_index_params, build_search_params, METRIC_TYPE
+
+
+# 프로필별로 스윕할 검색 파라미터
+SEARCH_SWEEPS = {
+    "flat": [{}],
+    "ivf_flat": [{"nprobe": n} for n in (4, 8, 16, 32, 64)],
+    "ivf_sq8": [{"nprobe": n} for n in (4, 8, 16, 32, 64)],
+    "hnsw": [{"ef": ef} for ef in (16, 32, 64, 128, 256)],
+}
+
+
+# ========== 데이터 준비 ==========
+
+def build_query_texts() -> List[str]:
+    """태그 컨텍스트 기반 쿼리 세트"""
+    from app.services.ai.agents.growth_agent import TAG_CONTEXTS
+    from app.db.seed_tags import TAG_DATA
+
+    contexts = list(TAG_CONTEXTS.values())
+    tag_names = [name for minors in TAG_DATA.values() for name in minors]
+    combined = [f"{a}. 그리고 {b}" for a, b in itertools.combinations(contexts, 2)]
+    return contexts + tag_names + combined
+
+
+async def load_quote_texts(limit: int) -> List[str]:
+    """DB에서 인용문 텍스트 로드"""
+    from sqlalchemy import select
+    from app.core.database import AsyncSessionLocal
+    from app.models.news import NewsQuote
+
+    async with AsyncSessionLocal() as db:
+        stmt = select(NewsQuote.quote_text).order_by(NewsQuote.id).limit(limit)
+        result = await db.execute(stmt)
+        return [row[0] for row in result.fetchall()]
+
+
+def embed(texts: List[str]) -> np.ndarray:
+    """싱글톤 임베딩 모델로 배치 임베딩 (정규화)"""
+    from app.services.data.embedding_service import get_embedding_model
+
+    model = get_embedding_model()
+    vectors = model.encode(texts, batch_size=32, convert_to_numpy=True, show_progress_bar=False)
+    return normalize(vectors.astype(np.float32))
+
+
+def synthetic_vectors(n: int, dim: int, clusters: int = 64, seed: int = 42) -> np.ndarray:
+    """군집 구조가 있는 합성 벡터 (DB 없이 실행할 때)"""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim))
+    assignments = rng.integers(0, clusters, size=n)
+    vectors = centers[assignments] + 0.35 * rng.normal(size=(n, dim))
+    return normalize(vectors.astype(np.float32))
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def brute_force_topk(corpus: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    """코사인 유사도 brute-force 정답"""
+    scores = queries @ corpus.T
+    top = np.argpartition(-scores, kth=min(k, corpus.shape[0] - 1), axis=1)[:, :k]
+    order = np.take_along_axis(scores, top, axis=1).argsort(axis=1)[:, ::-1]
+    return np.take_along_axis(top, order, axis=1)
+
+
+# ========== 프로세스 내 대체 인덱스 ==========
+
+class FlatIndex:
+    def __init__(self, corpus: np.ndarray, params: Dict):
+        self.corpus = corpus
+
+    def search(self, query: np.ndarray, k: int, params: Dict) -> np.ndarray:
+        scores = self.corpus @ query
+        top = np.argpartition(-scores, min(k, len(scores) - 1))[:k]
+        return top[np.argsort(-scores[top])]
+
+
+class IVFIndex:
+    """k-means 코스 양자화 + nprobe 클러스터 탐색 (sq8=True면 차원별 8비트 양자화)"""
+
+    def __init__(self, corpus: np.ndarray, params: Dict, sq8: bool = False, iterations: int = 10):
+        nlist = min(params.get("nlist", 128), corpus.shape[0])
+        rng = np.random.default_rng(0)
+        centroids = corpus[rng.choice(corpus.shape[0], nlist, replace=False)]
+        for _ in range(iterations):
+            assignments = np.argmax(corpus @ centroids.T, axis=1)
+            for c in range(nlist):
+                members = corpus[assignments == c]
+                if len(members):
+                    centroids[c] = members.mean(axis=0)
+            centroids = normalize(centroids)
+
+        self.centroids = centroids
+        self.lists = [np.where(assignments == c)[0] for c in range(nlist)]
+
+        if sq8:
+            self.vmin = corpus.min(axis=0)
+            self.scale = np.maximum(corpus.max(axis=0) - self.vmin, 1e-12) / 255.0
+            codes = np.round((corpus - self.vmin) / self.scale).astype(np.uint8)
+            self.vectors = codes.astype(np.float32) * self.scale + self.vmin
+        else:
+            self.vectors = corpus
+
+    def search(self, query: np.ndarray, k: int, params: Dict) -> np.ndarray:
+        nprobe = params.get("nprobe", 16)
+        probe = np.argsort(-(self.centroids @ query))[:nprobe]
+        candidates = np.concatenate([self.lists[c] for c in probe])
+        if len(candidates) == 0:
+            return candidates
+        scores = self.vectors[candidates] @ query
+        top = np.argsort(-scores)[:k]
+        return candidates[top]
+
+
+class HNSWIndex:
+    def __init__(self, corpus: np.ndarray, params: Dict):
+        import hnswlib
+
+        self.index = hnswlib.Index(space="cosine", dim=corpus.shape[1])
+        self.index.init_index(
+            max_elements=corpus.shape[0],
+            M=params.get("M", 16),
+            ef_construction=params.get("efConstruction", 200)
+        )
+        self.index.add_items(corpus, np.arange(corpus.shape[0]))
+
+    def search(self, query: np.ndarray, k: int, params: Dict) -> np.ndarray:
+        self.index.set_ef(max(params.get("ef", 64), k))
+        labels, _ = self.index.knn_query(query, k=k)
+        return labels[0]
+
+
+def build_local_index(profile_name: str, corpus: np.ndarray):
+    index_params = build_index_params(profile_name)
+    index_type = index_params["index_type"]
+    params = index_params["params"]
+
+    if index_type == "FLAT":
+        return FlatIndex(corpus, params)
+    if index_type == "IVF_FLAT":
+        return IVFIndex(corpus, params)
+    if index_type == "IVF_SQ8":
+        return IVFIndex(corpus, params, sq8=True)
+    if index_type == "HNSW":
+        return HNSWIndex(corpus, params)
+    raise ValueError(f"지원하지 않는 인덱스 타입: {index_type}")
+
+
+# ========== Milvus 백엔드 ==========
+
+class MilvusBenchIndex:
+    def __init__(self, profile_name: str, corpus: np.ndarray, alias: str):
+        from pymilvus import Collection, CollectionSchema, FieldSchema, DataType, utility
+
+        name = f"bench_{profile_name}"
+        if utility.has_collection(name, using=alias):
+            utility.drop_collection(name, using=alias)
+
+        schema = CollectionSchema(fields=[
+            FieldSchema(name="id", dtype=DataType.INT64, is_primary=True, auto_id=False),
+            FieldSchema(name="embedding", dtype=DataType.FLOAT_VECTOR, dim=corpus.shape[1]),
+        ])
+        self.collection = Collection(name=name, schema=schema, using=alias)
+
+        for i in range(0, corpus.shape[0], 1000):
+            chunk = corpus[i:i+1000]
+            self.collection.insert([list(range(i, i + len(chunk))), chunk.tolist()])
+        self.collection.flush()
+        self.collection.create_index(field_name="embedding", index_params=build_index_params(profile_name))
+        self.collection.load()
+        self.profile_name = profile_name
+
+    def search(self, query: np.ndarray, k: int, params: Dict) -> np.ndarray:
+        results = self.collection.search(
+            data=[query.tolist()],
+            anns_field="embedding",
+            param=build_search_params(self.profile_name, params),
+            limit=k
+        )
+        return np.array([hit.id for hit in results[0]])
+
+    def drop(self):
+        self.collection.drop()
+
+
+# ========== 측정 ==========
+
+def run_profile(index, queries: np.ndarray, truth: np.ndarray, k: int, params: Dict) -> Tuple[float, float, float]:
+    """recall@k, p50(ms), p95(ms)"""
+    latencies = []
+    hits = 0
+    for query, expected in zip(queries, truth):
+        started = time.perf_counter()
+        found = index.search(query, k, params)
+        latencies.append((time.perf_counter() - started) * 1000)
+        hits += len(set(found[:k].tolist()) & set(expected.tolist()))
+
+    recall = hits / (len(queries) * k)
+    return recall, float(np.percentile(latencies, 50)), float(np.percentile(latencies, 95))
+
+
+async def main(args):
+    profiles = [p.strip() for p in args.profiles.split(",") if p.strip()]
+    for profile in profiles:
+        if profile not in INDEX_PROFILES:
+            raise SystemExit(f"알 수 없는 프로필: {profile} (가능: {', '.join(INDEX_PROFILES)})")
+
+    # 1. 코퍼스/쿼리 준비
+    if args.synthetic:
+        print(f"합성 코퍼스 생성: {args.corpus_size}개 x {args.dim}차원")
+        corpus = synthetic_vectors(args.corpus_size, args.dim)
+        queries = synthetic_vectors(args.num_queries, args.dim, seed=7)
+    else:
+        print("인용문 로드 및 임베딩 중...")
+        corpus = embed(await load_quote_texts(args.corpus_size))
+        queries = embed(build_query_texts())
+    print(f"코퍼스 {corpus.shape[0]}개, 쿼리 {queries.shape[0]}개, k={args.k}, metric={METRIC_TYPE}")
+
+    truth = brute_force_topk(corpus, queries, args.k)
+
+    if args.backend == "milvus":
+        from pymilvus import connections
+        connections.connect(alias="bench", uri=args.uri, token=os.getenv("MILVUS_TOKEN", "") if args.uri.startswith("http") else "")
+
+    # 2. 프로필별 측정
+    print(f"\n{'profile':<10} {'search params':<16} {'build(s)':>9} {'recall@k':>9} {'p50(ms)':>9} {'p95(ms)':>9}")
+    print("-" * 68)
+    for profile in profiles:
+        started = time.perf_counter()
+        try:
+            if args.backend == "milvus":
+                index = MilvusBenchIndex(profile, corpus, alias="bench")
+            else:
+                index = build_local_index(profile, corpus)
+        except ImportError as e:
+            print(f"{profile:<10} 건너뜀 ({e})")
+            continue
+        build_seconds = time.perf_counter() - started
+
+        for params in SEARCH_SWEEPS[profile]:
+            recall, p50, p95 = run_profile(index, queries, truth, args.k, params)
+            label = ",".join(f"{key}={value}" for key, value in params.items()) or "-"
+            print(f"{profile:<10} {label:<16} {build_seconds:>9.2f} {recall:>9.3f} {p50:>9.2f} {p95:>9.2f}")
+
+        if hasattr(index, "drop"):
+            index.drop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="벡터 인덱스 프로필 recall/latency 벤치마크")
+    parser.add_argument("--backend", choices=["local", "milvus"], default="local")
+    parser.add_argument("--uri", default="./milvus_bench.db", help="Milvus 서버 URI 또는 Milvus-Lite 파일 경로")
+    parser.add_argument("--profiles", default=",".join(INDEX_PROFILES), help="쉼표로 구분한 프로필 목록")
+    parser.add_argument("--corpus-size", type=int, default=10000)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--synthetic", action="store_true", help="DB/임베딩 모델 없이 합성 벡터로 측정")
+    parser.add_argument("--dim", type=int, default=1024, help="합성 벡터 차원")
+    parser.add_argument("--num-queries", type=int, default=200, help="합성 쿼리 수")
+
+    asyncio.run(main(parser.parse_args()))
@@ -10,7 +10,10 @@ from datetime import datetime, timedelta, date
 from sqlalchemy import select
 from app.core.database import AsyncSessionLocal
 from app.models.user import User
-from app.models.checkin import Ritual, AIPersonaHistory, HeartTree
+from app.models.checkin import Ritual, HeartTree
+from app.core.conditional import bump_data_version
+from app.services.activity import rebuild_daily_activity
+from app.services.data.latest_persona import record_persona
 from app.models.daily import DailyRitual
 import json
 import uuid
@@ -123,14 +126,12 @@ async def create_demo_data(user):
                 "growth_direction": "더 깊은 자기 이해를 향해"
             }
             
-            history = AIPersonaHistory(
-                user_id=user_id,
-                persona_data=json.dumps(persona_data, ensure_ascii=False),
-                event_type="ritual_update" if stage["day"] > 1 else "initial",
-                event_date=base_date + timedelta(days=stage["day"]-1),
-                is_latest=(stage["day"] == 28)
+            await record_persona(
+                db, user_id,
+                json.dumps(persona_data, ensure_ascii=False),
+                "ritual_update" if stage["day"] > 1 else "initial",
+                base_date + timedelta(days=stage["day"]-1)
             )
-            db.add(history)
         
         # 3. 마음나무 레벨 28 설정
         print("마음나무 레벨 설정 중...")
@@ -140,15 +141,19 @@ async def create_demo_data(user):
         
         if heart_tree:
             heart_tree.growth_level = 28
+            heart_tree.ritual_count = 28  # 마지막 리츄얼 순번
             heart_tree.last_grew_at = datetime.now()
         else:
             heart_tree = HeartTree(
                 user_id=user_id,
                 growth_level=28,
+                ritual_count=28,
                 last_grew_at=datetime.now()
             )
             db.add(heart_tree)
         
+        await rebuild_daily_activity(db, user_id)
+        await bump_data_version(db, user_id)
         await db.commit()
         print("\n✅ 28일 완주 데모 데이터 생성 완료!")
         print("- 28개 리츄얼 생성")
@@ -188,10 +193,12 @@ async def reset_demo_data(user):
         
         # 마음나무 리셋
         await db.execute(
-            text("UPDATE heart_trees SET growth_level = 0 WHERE user_id = :user_id"),
+            text("UPDATE heart_trees SET growth_level = 0, ritual_count = 0 WHERE user_id = :user_id"),
             {"user_id": str(user_id)}
         )
         
+        await rebuild_daily_activity(db, user_id)
+        await bump_data_version(db, user_id)
         await db.commit()
         print("✅ 데모 데이터 초기화 완료!")
 
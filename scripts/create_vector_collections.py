@@ -1,6 +1,11 @@
 """
 Milvus 컬렉션 생성 및 데이터 임베딩 스크립트
+
+인용문은 저장된 watermark(vector_sync_watermarks) 이후의 새 행만 읽고,
+정책은 후보 policy_id 중 컬렉션에 없는 것만 임베딩합니다 (증분 동기화).
+전체 인용문 테이블을 다시 확인하려면 --full 옵션을 사용하세요.
 """
+import argparse
 import asyncio
 import sys
 from pathlib import Path
@@ -11,9 +16,10 @@ from app.core.database import AsyncSessionLocal
 from sqlalchemy import select
 from app.models.news import NewsQuote
 from app.models.policy import YouthPolicy
+from app.services.data.vector_sync import get_watermark, save_watermark
 
 
-async def main():
+async def main(full: bool = False):
     """메인 함수"""
     
     # VectorStore 초기화
@@ -30,19 +36,20 @@ async def main():
     
     # 2. 데이터 로드
     async with AsyncSessionLocal() as db:
-        # 인용문 데이터
-        print("\n2. 인용문 데이터 로드 중...")
-        stmt = select(NewsQuote)
+        # 인용문 데이터 (저장된 watermark 이후 새 데이터만)
+        quote_watermark = 0 if full else await get_watermark(db, "meari_quotes")
+        print(f"\n2. 인용문 데이터 로드 중... (watermark: quote_id {quote_watermark})")
+        stmt = select(NewsQuote).where(NewsQuote.id > quote_watermark).order_by(NewsQuote.id)
         result = await db.execute(stmt)
         quotes = result.scalars().all()
-        print(f"  - {len(quotes)}개 인용문 로드 완료")
+        print(f"  - watermark 이후 인용문 {len(quotes)}개 로드 완료")
         
-        # 정책 데이터
+        # 정책 데이터 (이미 적재된 policy_id는 insert_policies에서 제외)
         print("\n3. 정책 데이터 로드 중...")
         stmt = select(YouthPolicy)
         result = await db.execute(stmt)
         policies = result.scalars().all()
-        print(f"  - {len(policies)}개 정책 로드 완료")
+        print(f"  - 정책 {len(policies)}개 로드 완료")
     
     # 3. 인용문 임베딩 및 저장
     if quotes:
@@ -58,8 +65,15 @@ async def main():
             for q in quotes
         ]
         
-        inserted = await vector_store.insert_quotes(quotes_data, batch_size=50)  # 배치 크기 50으로
+        # 후보 ID만 확인해 중복 제외 (watermark 저장 전에 중단됐던 실행, --full 재확인 대비)
+        inserted = await vector_store.insert_quotes(quotes_data, batch_size=64, skip_existing=True)
         print(f"  - {inserted}개 인용문 벡터 저장 완료")
+        
+        # 적재가 끝난 뒤에 watermark 갱신
+        async with AsyncSessionLocal() as db:
+            await save_watermark(db, "meari_quotes", quotes[-1].id)
+            await db.commit()
+        print(f"  - watermark 갱신: quote_id {quotes[-1].id}")
     
     # 4. 정책 임베딩 및 저장
     if policies:
@@ -75,7 +89,7 @@ async def main():
             for p in policies
         ]
         
-        inserted = await vector_store.insert_policies(policies_data, batch_size=50)  # 배치 크기 50으로
+        inserted = await vector_store.insert_policies(policies_data, batch_size=64, skip_existing=True)
         print(f"  - {inserted}개 정책 벡터 저장 완료")
     
     print("\n✅ 모든 작업 완료!")
@@ -97,4 +111,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Milvus 컬렉션 생성 및 증분 임베딩")
+    parser.add_argument("--full", action="store_true", help="watermark와 무관하게 전체 인용문 테이블 확인")
+    args = parser.parse_args()
+    
+    asyncio.run(main(full=args.full))
\ No newline at end of file
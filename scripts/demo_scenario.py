@@ -11,7 +11,10 @@ from datetime import datetime, timedelta, date
 from sqlalchemy import select, text
 from app.core.database import AsyncSessionLocal
 from app.models.user import User
-from app.models.checkin import Ritual, AIPersonaHistory, HeartTree
+from app.models.checkin import Ritual, HeartTree
+from app.core.conditional import bump_data_version
+from app.services.activity import rebuild_daily_activity
+from app.services.data.latest_persona import record_persona
 from app.models.daily import DailyRitual
 from app.models.card import MeariSession, GeneratedCard
 import json
@@ -66,6 +69,8 @@ class DemoScenario:
             await db.execute(text("DELETE FROM heart_trees WHERE user_id = :user_id"), {"user_id": str(self.user_id)})
             await db.execute(text("DELETE FROM user_content_histories WHERE user_id = :user_id"), {"user_id": str(self.user_id)})
             
+            await rebuild_daily_activity(db, self.user_id)
+            await bump_data_version(db, self.user_id)
             await db.commit()
             print("✅ 완전 초기화 완료! 첫 방문자 상태입니다.")
 
@@ -100,14 +105,12 @@ class DemoScenario:
                 "growth_direction": "자신감 회복과 구체적인 목표 설정"
             }
             
-            persona = AIPersonaHistory(
-                user_id=self.user_id,
-                persona_data=json.dumps(persona_data, ensure_ascii=False),
-                event_type="initial",
-                is_latest=True,
-                event_date=date.today()
+            await record_persona(
+                db, self.user_id,
+                json.dumps(persona_data, ensure_ascii=False),
+                "initial",
+                date.today()
             )
-            db.add(persona)
             
             # 마음나무 레벨 1
             heart_tree = HeartTree(
@@ -117,6 +120,8 @@ class DemoScenario:
             )
             db.add(heart_tree)
             
+            await rebuild_daily_activity(db, self.user_id)
+            await bump_data_version(db, self.user_id)
             await db.commit()
             print("✅ 온보딩 직후 상태 설정 완료!")
             print("   - 태그: 진로/취업")
@@ -136,6 +141,8 @@ class DemoScenario:
                 text("DELETE FROM daily_rituals WHERE user_id = :user_id AND date = :today"),
                 {"user_id": str(self.user_id), "today": today}
             )
+            await rebuild_daily_activity(db, self.user_id)
+            await bump_data_version(db, self.user_id)
             await db.commit()
             print("✅ 오늘의 리츄얼 삭제 완료! 리츄얼 받기 가능합니다.")
 
@@ -178,14 +185,12 @@ class DemoScenario:
                 "growth_direction": "더 깊은 자기 이해를 향해"
             }
             
-            persona = AIPersonaHistory(
-                user_id=self.user_id,
-                persona_data=json.dumps(persona_data, ensure_ascii=False),
-                event_type="ritual_update",
-                is_latest=True,
-                event_date=date.today()
+            await record_persona(
+                db, self.user_id,
+                json.dumps(persona_data, ensure_ascii=False),
+                "ritual_update",
+                date.today()
             )
-            db.add(persona)
             
             # 마음나무 레벨 14
             heart_tree = HeartTree(
@@ -195,6 +200,8 @@ class DemoScenario:
             )
             db.add(heart_tree)
             
+            await rebuild_daily_activity(db, self.user_id)
+            await bump_data_version(db, self.user_id)
             await db.commit()
             print("✅ 14일차 상태 설정 완료!")
             print("   - 마음나무: 성장 단계 (14/28)")
@@ -260,23 +267,24 @@ class DemoScenario:
                     "growth_direction": "완성을 향해"
                 }
                 
-                persona = AIPersonaHistory(
-                    user_id=self.user_id,
-                    persona_data=json.dumps(persona_data, ensure_ascii=False),
-                    event_type="ritual_update" if stage["day"] > 1 else "initial",
-                    is_latest=(stage["day"] == 28),
-                    event_date=base_date + timedelta(days=stage["day"]-1)
+                await record_persona(
+                    db, self.user_id,
+                    json.dumps(persona_data, ensure_ascii=False),
+                    "ritual_update" if stage["day"] > 1 else "initial",
+                    base_date + timedelta(days=stage["day"]-1)
                 )
-                db.add(persona)
             
             # 마음나무 만개
             heart_tree = HeartTree(
                 user_id=self.user_id,
                 growth_level=28,
+                ritual_count=28,  # 마지막 리츄얼 순번
                 last_grew_at=datetime.now()
             )
             db.add(heart_tree)
             
+            await rebuild_daily_activity(db, self.user_id)
+            await bump_data_version(db, self.user_id)
             await db.commit()
             print("✅ 28일 완주 상태 설정 완료!")
             print("   - 마음나무: 만개 🌸")
@@ -324,6 +332,8 @@ class DemoScenario:
             )
             db.add(heart_tree)
             
+            await rebuild_daily_activity(db, self.user_id)
+            await bump_data_version(db, self.user_id)
             await db.commit()
             
             stage = "씨앗" if days <= 6 else "새싹" if days <= 13 else "성장" if days <= 20 else "개화" if days <= 27 else "만개"
@@ -0,0 +1,101 @@
+"""
+gunicorn 워커별 메모리 리포트 (Linux 전용, /proc/<pid>/smaps_rollup 사용)
+
+RSS는 공유 페이지를 워커마다 중복으로 세므로, 실제 점유량은 PSS(공유 페이지를
+공유한 프로세스 수로 나눈 값) 합계로 봅니다. preload가 잘 되었다면 워커의
+Shared가 크고 Private은 작게 나옵니다.
+
+사용 예:
+  python scripts/report_worker_memory.py                     # /tmp/gunicorn.pid 기준
+  python scripts/report_worker_memory.py --pid 1234
+  python scripts/report_worker_memory.py --pidfile /run/gunicorn.pid
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+FIELDS = ("Rss", "Pss", "Shared_Clean", "Shared_Dirty", "Private_Clean", "Private_Dirty")
+
+
+def read_smaps_rollup(pid: int) -> Dict[str, int]:
+    """프로세스 메모리 요약 (kB)"""
+    usage = {}
+    for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines():
+        key, _, rest = line.partition(":")
+        if key in FIELDS:
+            usage[key] = int(rest.split()[0])
+    return usage
+
+
+def child_pids(pid: int) -> List[int]:
+    """직계 자식 프로세스 PID"""
+    children = []
+    for task in Path(f"/proc/{pid}/task").iterdir():
+        children_file = task / "children"
+        if children_file.exists():
+            children.extend(int(c) for c in children_file.read_text().split())
+    if children:
+        return sorted(set(children))
+
+    # children 파일을 지원하지 않는 커널: 전체 프로세스의 부모 PID 확인
+    for entry in Path("/proc").iterdir():
+        if entry.name.isdigit():
+            try:
+                stat = (entry / "stat").read_text()
+            except OSError:
+                continue
+            # comm에 공백/괄호가 있을 수 있으므로 마지막 ')' 이후로 파싱
+            ppid = int(stat.rsplit(")", 1)[1].split()[1])
+            if ppid == pid:
+                children.append(int(entry.name))
+    return sorted(children)
+
+
+def format_mb(kb: int) -> str:
+    return f"{kb / 1024:8.1f}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="gunicorn 워커별 메모리 리포트")
+    parser.add_argument("--pid", type=int, help="gunicorn 마스터 PID")
+    parser.add_argument("--pidfile", default=os.getenv("GUNICORN_PIDFILE", "/tmp/gunicorn.pid"))
+    args = parser.parse_args()
+
+    if not Path("/proc/self/smaps_rollup").exists():
+        print("이 스크립트는 /proc/<pid>/smaps_rollup을 지원하는 Linux에서만 동작합니다")
+        return 1
+
+    master = args.pid or int(Path(args.pidfile).read_text().strip())
+    workers = child_pids(master)
+
+    rows = [("master", master, read_smaps_rollup(master))]
+    rows += [(f"worker{i}", pid, read_smaps_rollup(pid)) for i, pid in enumerate(workers, 1)]
+
+    print(f"{'process':<10}{'pid':>8}{'RSS':>10}{'PSS':>10}{'Shared':>10}{'Private':>10}   (MB)")
+    for name, pid, usage in rows:
+        shared = usage.get("Shared_Clean", 0) + usage.get("Shared_Dirty", 0)
+        private = usage.get("Private_Clean", 0) + usage.get("Private_Dirty", 0)
+        print(
+            f"{name:<10}{pid:>8}{format_mb(usage.get('Rss', 0)):>10}{format_mb(usage.get('Pss', 0)):>10}"
+            f"{format_mb(shared):>10}{format_mb(private):>10}"
+        )
+
+    total_rss = sum(usage.get("Rss", 0) for _, _, usage in rows)
+    total_pss = sum(usage.get("Pss", 0) for _, _, usage in rows)
+    print()
+    print(f"워커 수: {len(workers)}")
+    print(f"RSS 합계 (공유 중복 포함): {total_rss / 1024:.1f} MB")
+    print(f"PSS 합계 (실제 점유량):    {total_pss / 1024:.1f} MB")
+    if workers:
+        worker_private = [
+            usage.get("Private_Clean", 0) + usage.get("Private_Dirty", 0)
+            for name, _, usage in rows[1:]
+        ]
+        print(f"워커 1개 추가 시 예상 증가량(평균 Private): {sum(worker_private) / len(worker_private) / 1024:.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
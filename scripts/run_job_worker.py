@@ -0,0 +1,41 @@
+"""
+비동기 워크플로우 작업 전용 워커 프로세스
+
+API 서버와 따로 띄워 LLM 처리량만 독립적으로 늘릴 때 사용합니다.
+(API 서버는 JOB_WORKERS=0으로 두면 작업 접수만 하고 실행은 이 프로세스가 맡습니다.
+ gunicorn.conf.py로 띄운 API 서버는 기본이 0이므로 이 프로세스를 함께 띄워야 합니다)
+Postgres 큐는 SKIP LOCKED로 선점하므로 여러 노드에서 동시에 띄워도 됩니다.
+
+사용 예:
+  python scripts/run_job_worker.py --concurrency 4
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.core.job_worker import JobWorkerPool
+import app.api.v1.meari  # noqa: F401  작업 핸들러 등록
+
+
+def main():
+    parser = argparse.ArgumentParser(description="워크플로우 작업 워커")
+    parser.add_argument(
+        "--concurrency", type=int, default=max(settings.JOB_WORKERS, 1),
+        help="동시에 실행할 작업 수 (기본: JOB_WORKERS)"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    try:
+        asyncio.run(JobWorkerPool(args.concurrency).run_forever())
+    except KeyboardInterrupt:
+        print("워커 종료")
+
+
+if __name__ == "__main__":
+    main()